@@ -1,36 +1,74 @@
-"""Veritas - Autonomous Research & Report Generation Platform."""
-
-from .agents import (
-    BaseAgent,
-    CriticAgent,
-    FactCheckerAgent,
-    ResearcherAgent,
-    SynthesizerAgent,
-    WriterAgent,
-)
-from .api import app
-from .config import settings
-from .domain import (
-    Agent,
-    AgentContext,
-    AgentRegistry,
-    AgentResult,
-    FactCheckAgent,
-    ResearchAgent,
-)
-from .domain import (
-    CriticAgent as DomainCriticAgent,
-)
-from .domain import (
-    SynthesizerAgent as DomainSynthesizerAgent,
-)
-from .domain import (
-    WriterAgent as DomainWriterAgent,
-)
-from .orchestration import ResearchWorkflow, WorkflowResult, WorkflowStage
+"""Veritas - Autonomous Research & Report Generation Platform.
+
+Public names are imported lazily (PEP 562) so importing a light submodule,
+e.g. ``src.domain.events``, does not pull in the agents, LLM clients and the
+API app.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agents import (
+        BaseAgent,
+        CriticAgent,
+        FactCheckerAgent,
+        ResearcherAgent,
+        SynthesizerAgent,
+        WriterAgent,
+    )
+    from .api import app
+    from .config import settings
+    from .domain import (
+        Agent,
+        AgentContext,
+        AgentRegistry,
+        AgentResult,
+        FactCheckAgent,
+        ResearchAgent,
+    )
+    from .domain import (
+        CriticAgent as DomainCriticAgent,
+    )
+    from .domain import (
+        SynthesizerAgent as DomainSynthesizerAgent,
+    )
+    from .domain import (
+        WriterAgent as DomainWriterAgent,
+    )
+    from .orchestration import ResearchWorkflow, WorkflowResult, WorkflowStage
 
 __version__ = "0.1.0"
 
+# Public name -> (submodule, attribute)
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    # Agents
+    "BaseAgent": (".agents", "BaseAgent"),
+    "ResearcherAgent": (".agents", "ResearcherAgent"),
+    "FactCheckerAgent": (".agents", "FactCheckerAgent"),
+    "SynthesizerAgent": (".agents", "SynthesizerAgent"),
+    "WriterAgent": (".agents", "WriterAgent"),
+    "CriticAgent": (".agents", "CriticAgent"),
+    # Domain
+    "Agent": (".domain", "Agent"),
+    "AgentContext": (".domain", "AgentContext"),
+    "AgentRegistry": (".domain", "AgentRegistry"),
+    "AgentResult": (".domain", "AgentResult"),
+    "ResearchAgent": (".domain", "ResearchAgent"),
+    "FactCheckAgent": (".domain", "FactCheckAgent"),
+    "DomainSynthesizerAgent": (".domain", "SynthesizerAgent"),
+    "DomainWriterAgent": (".domain", "WriterAgent"),
+    "DomainCriticAgent": (".domain", "CriticAgent"),
+    # Orchestration
+    "ResearchWorkflow": (".orchestration", "ResearchWorkflow"),
+    "WorkflowResult": (".orchestration", "WorkflowResult"),
+    "WorkflowStage": (".orchestration", "WorkflowStage"),
+    # Config
+    "settings": (".config", "settings"),
+    # API
+    "app": (".api", "app"),
+}
+
 __all__ = [
     # Agents
     "BaseAgent",
@@ -59,3 +97,18 @@ __all__ = [
     # API
     "app",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access and cache it on the package."""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
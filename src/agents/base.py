@@ -2,18 +2,26 @@
 
 import logging
 from abc import abstractmethod
+from functools import partial
 from typing import Any
 
+import orjson
+from langchain_core.messages import AIMessage
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.config.retry import RETRY_CONFIG_DEFAULT, RetryConfig
 from src.domain.interfaces import Agent, AgentContext, AgentResult
 from src.infrastructure.llm import (
     ResilientLLMWrapper,
+    count_tokens,
     get_resilient_llm,
+    truncate_messages,
 )
+from src.infrastructure.llm_cache import LLMCache
+from src.infrastructure.logging import CorrelationIdFilter, correlation_id_var
 
 logger = logging.getLogger(__name__)
+logger.addFilter(CorrelationIdFilter())
 
 
 class BaseAgent(Agent[AgentResult]):
@@ -26,6 +34,12 @@ class BaseAgent(Agent[AgentResult]):
     - Correlation ID tracking
     """
 
+    # Class-level defaults keep agents built without BaseAgent.__init__ working
+    _cache: LLMCache | None = None
+    _llm_provider: str = ""
+    _llm_model: str = ""
+    _max_prompt_tokens: int | None = None
+
     def __init__(
         self,
         name: str,
@@ -35,6 +49,8 @@ class BaseAgent(Agent[AgentResult]):
         llm_temperature: float = 0.7,
         llm_max_tokens: int | None = None,
         retry_config: RetryConfig | None = None,
+        cache: LLMCache | None = None,
+        max_prompt_tokens: int | None = None,
     ):
         """Initialize base agent.
 
@@ -46,6 +62,9 @@ class BaseAgent(Agent[AgentResult]):
             llm_temperature: Sampling temperature
             llm_max_tokens: Maximum tokens to generate (None = unlimited)
             retry_config: Custom retry configuration
+            cache: Optional LLM response cache shared between agents
+            max_prompt_tokens: Prompt token budget; larger prompts are
+                truncated before sending (None = unlimited)
         """
         self._name = name
         self._description = description
@@ -59,7 +78,10 @@ class BaseAgent(Agent[AgentResult]):
             max_tokens=llm_max_tokens,
             retry_config=self._retry_config,
         )
-        self._correlation_id: str | None = None
+        self._llm_provider = llm_provider
+        self._llm_model = llm_model
+        self._cache = cache
+        self._max_prompt_tokens = max_prompt_tokens
 
     @property
     def name(self) -> str:
@@ -76,9 +98,81 @@ class BaseAgent(Agent[AgentResult]):
         """Access the configured resilient LLM client."""
         return self._llm
 
-    def _set_correlation_id(self, context: AgentContext) -> None:
-        """Set correlation ID from context for logging."""
-        self._correlation_id = context.correlation_id
+    def _fit_prompt(self, messages: list[Any]) -> list[Any]:
+        """Truncate ``messages`` to the prompt token budget, if one is set.
+
+        Args:
+            messages: Messages about to be sent to the LLM
+
+        Returns:
+            Messages that fit within ``max_prompt_tokens``
+        """
+        budget = self._max_prompt_tokens
+        if budget is None:
+            return messages
+        tokens = count_tokens(self._llm_model, messages)
+        if tokens <= budget:
+            return messages
+        self._log(
+            logging.WARNING,
+            f"{self.name} prompt has {tokens} tokens, truncating to {budget}",
+        )
+        return truncate_messages(self._llm_model, messages, budget)
+
+    async def _ainvoke_llm(
+        self,
+        messages: list[Any],
+        tools: list[Any] | None = None,
+    ) -> Any:
+        """Invoke the LLM, serving identical requests from the cache if set.
+
+        With ``tools``, they are bound to the underlying client for this call,
+        still under the wrapper's retry and circuit breaker, and the response's
+        tool calls are cached alongside its content.
+
+        Args:
+            messages: Messages to send to the LLM
+            tools: Tools to bind for this call (client must support
+                ``bind_tools``)
+
+        Returns:
+            LLM response (an ``AIMessage`` on cache hits)
+        """
+        messages = self._fit_prompt(messages)
+        if tools:
+            invoke = partial(self.llm.ainvoke, tools=tools)
+        else:
+            invoke = self.llm.ainvoke
+        if self._cache is None:
+            return await invoke(messages)
+
+        tool_names = [tool.name for tool in tools or []]
+        key = LLMCache.make_key(
+            self._llm_model, messages, tool_names, provider=self._llm_provider
+        )
+        cached = await self._cache.get(key)
+        if cached is not None:
+            if not tools:
+                return AIMessage(content=cached)
+            data = orjson.loads(cached)
+            return AIMessage(content=data["content"], tool_calls=data["tool_calls"])
+
+        response = await invoke(messages)
+        content = getattr(response, "content", None)
+        if not isinstance(content, str):
+            return response
+        if not tools:
+            await self._cache.set(key, content)
+            return response
+        tool_calls = [
+            {"name": call["name"], "args": call["args"], "id": call.get("id")}
+            for call in getattr(response, "tool_calls", None) or []
+        ]
+        await self._cache.set(
+            key,
+            orjson.dumps({"content": content, "tool_calls": tool_calls}).decode(),
+        )
+        return response
 
     def _log(
         self,
@@ -86,9 +180,8 @@ class BaseAgent(Agent[AgentResult]):
         msg: str,
         **kwargs: Any,
     ) -> None:
-        """Log with correlation ID context."""
-        extra = {"correlation_id": self._correlation_id}
-        logger.log(level, msg, extra=extra, **kwargs)
+        """Log with the correlation ID bound by ``execute``."""
+        logger.log(level, msg, **kwargs)
 
     async def execute(
         self,
@@ -96,25 +189,29 @@ class BaseAgent(Agent[AgentResult]):
         context: AgentContext,
     ) -> AgentResult:
         """Execute agent logic with retry and error handling."""
-        self._set_correlation_id(context)
-        self._log(
-            logging.INFO,
-            f"Executing {self.name} with input type: {type(input).__name__}",
-        )
-
-        # Validate input
-        if not await self.validate_input(input):
-            self._log(logging.ERROR, f"Invalid input for {self.name}")
-            raise ValueError(f"Invalid input for agent {self.name}")
-
-        # Execute with retry
+        # Bound once per call; the log filter and LLM wrapper both read it
+        token = correlation_id_var.set(context.correlation_id)
         try:
-            result = await self._execute_with_retry(input, context)
-            self._log(logging.INFO, f"{self.name} completed successfully")
-            return result
-        except Exception as e:
-            self._log(logging.ERROR, f"{self.name} failed: {str(e)}")
-            raise
+            self._log(
+                logging.INFO,
+                f"Executing {self.name} with input type: {type(input).__name__}",
+            )
+
+            # Validate input
+            if not await self.validate_input(input):
+                self._log(logging.ERROR, f"Invalid input for {self.name}")
+                raise ValueError(f"Invalid input for agent {self.name}")
+
+            # Execute with retry
+            try:
+                result = await self._execute_with_retry(input, context)
+                self._log(logging.INFO, f"{self.name} completed successfully")
+                return result
+            except Exception as e:
+                self._log(logging.ERROR, f"{self.name} failed: {str(e)}")
+                raise
+        finally:
+            correlation_id_var.reset(token)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -141,8 +238,8 @@ class BaseAgent(Agent[AgentResult]):
         """Internal run method - implement agent logic here.
 
         Subclasses should implement this method with their specific logic.
-        The LLM calls should use self.llm.ainvoke() which includes
-        automatic retry and circuit breaker protection.
+        The LLM calls should use self._ainvoke_llm() which includes
+        automatic retry, circuit breaker protection and optional caching.
         """
         ...
 
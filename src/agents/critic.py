@@ -8,6 +8,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from src.agents.base import BaseAgent
 from src.domain.events import ReportReviewed, ReportWritten
 from src.domain.interfaces import AgentContext
+from src.infrastructure.llm_cache import LLMCache
 
 
 class CriticAgent(BaseAgent[ReportReviewed]):
@@ -33,6 +34,8 @@ Be thorough but constructive. Your feedback should help improve the report."""
         model: str = "gpt-4o",
         temperature: float = 0.4,
         max_tokens: int | None = None,
+        cache: LLMCache | None = None,
+        max_prompt_tokens: int | None = None,
     ):
         super().__init__(
             name="critic",
@@ -41,6 +44,8 @@ Be thorough but constructive. Your feedback should help improve the report."""
             llm_model=model,
             llm_temperature=temperature,
             llm_max_tokens=max_tokens,
+            cache=cache,
+            max_prompt_tokens=max_prompt_tokens,
         )
 
     async def _run(
@@ -70,7 +75,7 @@ Be thorough but constructive. Your feedback should help improve the report."""
             ),
         ]
 
-        response = await self.llm.ainvoke(messages)
+        response = await self._ainvoke_llm(messages)
         content = response.content if hasattr(response, "content") else str(response)
 
         # Parse JSON response
@@ -1,5 +1,6 @@
 """Fact-Checker Agent - Verifies claims and assigns confidence scores."""
 
+import functools
 import json
 from typing import Any
 
@@ -8,6 +9,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from src.agents.base import BaseAgent
 from src.domain.events import FactCheckCompleted, ResearchCompleted
 from src.domain.interfaces import AgentContext
+from src.infrastructure.llm_cache import LLMCache
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
@@ -23,6 +25,27 @@ class ClaimStatus:
     UNVERIFIED = "unverified"
 
 
+_VALID_STATUSES = frozenset(
+    {
+        ClaimStatus.VERIFIED,
+        ClaimStatus.PARTIALLY_VERIFIED,
+        ClaimStatus.DISPUTED,
+        ClaimStatus.UNVERIFIED,
+    }
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_status(status: str) -> str:
+    """Map a raw status to a ClaimStatus value (case-insensitive match).
+
+    LLMs repeat a handful of spellings, so results are memoized and each
+    distinct spelling is normalized once.
+    """
+    normalized = status.lower().replace(" ", "_")
+    return normalized if normalized in _VALID_STATUSES else ClaimStatus.UNVERIFIED
+
+
 class FactCheckerAgent(BaseAgent[FactCheckCompleted]):
     """Fact-Checker Agent implementation.
 
@@ -50,6 +73,8 @@ values listed above."""
         model: str = "gpt-4o",
         temperature: float = 0.3,
         max_tokens: int | None = None,
+        cache: LLMCache | None = None,
+        max_prompt_tokens: int | None = None,
     ):
         super().__init__(
             name="fact_checker",
@@ -58,6 +83,8 @@ values listed above."""
             llm_model=model,
             llm_temperature=temperature,
             llm_max_tokens=max_tokens,
+            cache=cache,
+            max_prompt_tokens=max_prompt_tokens,
         )
 
     async def _run(
@@ -98,7 +125,7 @@ values listed above."""
             ),
         ]
 
-        response = await self.llm.ainvoke(messages)
+        response = await self._ainvoke_llm(messages)
         content = response.content if hasattr(response, "content") else str(response)
 
         # Parse JSON response
@@ -202,25 +229,10 @@ values listed above."""
         Returns:
             List with normalized status values
         """
-        valid_statuses = {
-            ClaimStatus.VERIFIED,
-            ClaimStatus.PARTIALLY_VERIFIED,
-            ClaimStatus.DISPUTED,
-            ClaimStatus.UNVERIFIED,
-        }
-
-        normalized = []
-        for claim in claims:
-            status = claim.get("status", "")
-            # Normalize to valid status (case-insensitive match)
-            status_normalized = status.lower().replace(" ", "_")
-            if status_normalized in valid_statuses:
-                status = status_normalized
-            else:
-                status = ClaimStatus.UNVERIFIED
-            normalized.append({**claim, "status": status})
-
-        return normalized
+        return [
+            {**claim, "status": _normalize_status(claim.get("status", ""))}
+            for claim in claims
+        ]
 
     async def validate_input(self, input: Any) -> bool:
         """Validate input is a ResearchCompleted event."""
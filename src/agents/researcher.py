@@ -1,23 +1,23 @@
 """Researcher Agent - Collects raw information and key findings using web search."""
 
+import asyncio
 import json
 import logging
 from typing import Any
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool, tool
 
 from src.agents.base import BaseAgent
 from src.domain.events import ResearchCompleted
 from src.domain.interfaces import AgentContext
-from src.infrastructure.tools import get_web_search_tool
+from src.infrastructure.llm_cache import LLMCache
+from src.infrastructure.tools import get_async_web_search_tool, get_web_search_tool
 
 logger = logging.getLogger(__name__)
 
 
-# Define web search tool for the agent
-@tool
-def search_web(query: str) -> str:
+def _search_web(query: str) -> str:
     """Search the web for information on a given query.
 
     Args:
@@ -38,6 +38,27 @@ def search_web(query: str) -> str:
         return f"Web search failed: {str(e)}"
 
 
+async def _asearch_web(query: str) -> str:
+    """Async counterpart of ``_search_web`` using the shared async client."""
+    search_tool_func = get_async_web_search_tool(max_results=5)
+    if search_tool_func is None:
+        return "Web search is not configured. Please set TAVILY_API_KEY."
+
+    try:
+        return await search_tool_func(query)
+    except Exception as e:
+        logger.error(f"Web search failed: {e}")
+        return f"Web search failed: {str(e)}"
+
+
+# Define web search tool for the agent; ainvoke uses the non-blocking client
+search_web = StructuredTool.from_function(
+    func=_search_web,
+    coroutine=_asearch_web,
+    name="search_web",
+)
+
+
 # Define format tool for structured output
 @tool
 def format_report(sources: list[dict], findings: list[str]) -> str:
@@ -78,12 +99,18 @@ Return your findings in JSON format with:
 - findings: list of AT LEAST 5 distinct key findings as strings
 """
 
+    # Class-level default keeps agents built without __init__ working
+    _max_concurrent_searches: int = 10
+
     def __init__(
         self,
         provider: str = "openai",
         model: str = "gpt-4o",
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        cache: LLMCache | None = None,
+        max_prompt_tokens: int | None = None,
+        max_concurrent_searches: int = 10,
     ):
         """Initialize researcher agent.
 
@@ -92,6 +119,9 @@ Return your findings in JSON format with:
             model: Model name to use
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate (None = unlimited)
+            cache: Optional LLM response cache
+            max_prompt_tokens: Prompt token budget (None = unlimited)
+            max_concurrent_searches: Maximum web searches in flight at once
         """
         super().__init__(
             name="researcher",
@@ -100,6 +130,8 @@ Return your findings in JSON format with:
             llm_model=model,
             llm_temperature=temperature,
             llm_max_tokens=max_tokens,
+            cache=cache,
+            max_prompt_tokens=max_prompt_tokens,
         )
 
         # Initialize the web search tool
@@ -107,10 +139,11 @@ Return your findings in JSON format with:
 
         # For ReAct agent pattern
         self._tools = [search_web]
+        self._max_concurrent_searches = max(1, max_concurrent_searches)
 
     async def _run(
         self,
-        topic: str,
+        topic: str | dict[str, Any],
         context: AgentContext,
     ) -> ResearchCompleted:
         """Execute research on the given topic.
@@ -119,27 +152,62 @@ Return your findings in JSON format with:
         all search results, then uses LLM to extract findings.
 
         Args:
-            topic: The research topic
+            topic: The research topic, or a dict with 'topic' and optional
+                'subqueries'
             context: Agent context with correlation ID
 
         Returns:
             ResearchCompleted event with sources and findings
         """
+        subqueries: list[str] = []
+        if isinstance(topic, dict):
+            subqueries = topic.get("subqueries") or []
+            topic = topic["topic"]
+
         llm = self.llm.llm
 
         # Check if LLM supports tool calling
         if not hasattr(llm, "bind_tools"):
             logger.warning("LLM doesn't support tool calling, using direct invocation")
-            return await self._run_direct(topic, context)
+            return await self._run_direct(topic, context, subqueries)
 
         # Use direct invocation for more reliable results with small models
         # This bypasses the ReAct pattern issues with Ollama 3.2:3b
-        return await self._run_direct(topic, context)
+        return await self._run_direct(topic, context, subqueries)
+
+    async def _search(self, queries: list[str]) -> str:
+        """Run web searches concurrently and combine their results.
+
+        At most ``max_concurrent_searches`` searches are in flight, so the
+        stage takes roughly as long as the slowest query.
+
+        Args:
+            queries: Search queries, in order
+
+        Returns:
+            Search results, labelled by query when there is more than one
+        """
+        if len(queries) == 1:
+            return await self._search_tool.ainvoke(queries[0])
+
+        # Created per call: a semaphore binds to the event loop it first waits on
+        semaphore = asyncio.Semaphore(self._max_concurrent_searches)
+
+        async def bounded_search(query: str) -> str:
+            async with semaphore:
+                return await self._search_tool.ainvoke(query)
+
+        results = await asyncio.gather(*(bounded_search(q) for q in queries))
+        return "\n\n".join(
+            f"QUERY: {query}\n{result}"
+            for query, result in zip(queries, results, strict=True)
+        )
 
     async def _run_direct(
         self,
         topic: str,
         context: AgentContext,
+        subqueries: list[str] | None = None,
     ) -> ResearchCompleted:
         """Run research using direct invocation with tool binding.
 
@@ -148,14 +216,16 @@ Return your findings in JSON format with:
         Args:
             topic: The research topic
             context: Agent context
+            subqueries: Additional search queries to run alongside the topic
 
         Returns:
             ResearchCompleted event
         """
         llm = self.llm.llm
 
-        # Perform web search directly
-        search_result = self._search_tool.invoke(topic)
+        # Perform web searches directly; duplicates are searched once
+        queries = list(dict.fromkeys([topic, *(subqueries or [])]))
+        search_result = await self._search(queries)
 
         # Format the search results nicely
         formatted_results = f"""TOPIC: {topic}
@@ -184,10 +254,8 @@ DO NOT include any other text - ONLY the JSON object."""
 
         # Use LLM with bind_tools for structured output
         if hasattr(llm, "bind_tools"):
-            llm_with_tools = llm.bind_tools([format_report])
-
-            response = await llm_with_tools.ainvoke(
-                [HumanMessage(content=formatted_results)]
+            response = await self._ainvoke_llm(
+                [HumanMessage(content=formatted_results)], tools=[format_report]
             )
 
             # Check if tool was called
@@ -213,7 +281,7 @@ DO NOT include any other text - ONLY the JSON object."""
                 response.content if hasattr(response, "content") else str(response)
             )
         else:
-            response = await self.llm.ainvoke([HumanMessage(content=formatted_results)])
+            response = await self._ainvoke_llm([HumanMessage(content=formatted_results)])
             content = (
                 response.content if hasattr(response, "content") else str(response)
             )
@@ -275,6 +343,18 @@ DO NOT include any other text - ONLY the JSON object."""
         self,
         topic: str,
         context: AgentContext,
+        subqueries: list[str] | None = None,
     ) -> ResearchCompleted:
-        """Convenience method to run research."""
+        """Convenience method to run research.
+
+        Args:
+            topic: The research topic
+            context: Agent context with correlation ID
+            subqueries: Additional search queries, searched concurrently
+
+        Returns:
+            ResearchCompleted event with sources and findings
+        """
+        if subqueries:
+            return await self.execute({"topic": topic, "subqueries": subqueries}, context)
         return await self.execute(topic, context)
@@ -8,6 +8,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from src.agents.base import BaseAgent
 from src.domain.events import FactCheckCompleted, ResearchCompleted, SynthesisCompleted
 from src.domain.interfaces import AgentContext
+from src.infrastructure.llm_cache import LLMCache
 
 
 class SynthesizerAgent(BaseAgent[SynthesisCompleted]):
@@ -32,6 +33,8 @@ Focus on creating actionable insights from the data."""
         model: str = "gpt-4o",
         temperature: float = 0.5,
         max_tokens: int | None = None,
+        cache: LLMCache | None = None,
+        max_prompt_tokens: int | None = None,
     ):
         super().__init__(
             name="synthesizer",
@@ -40,6 +43,8 @@ Focus on creating actionable insights from the data."""
             llm_model=model,
             llm_temperature=temperature,
             llm_max_tokens=max_tokens,
+            cache=cache,
+            max_prompt_tokens=max_prompt_tokens,
         )
 
     async def _run(
@@ -88,7 +93,7 @@ Focus on creating actionable insights from the data."""
             ),
         ]
 
-        response = await self.llm.ainvoke(messages)
+        response = await self._ainvoke_llm(messages)
         content = response.content if hasattr(response, "content") else str(response)
 
         # Parse JSON response
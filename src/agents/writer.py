@@ -9,6 +9,7 @@ from langchain_core.tools import tool
 from src.agents.base import BaseAgent
 from src.domain.events import ReportWritten, SynthesisCompleted
 from src.domain.interfaces import AgentContext
+from src.infrastructure.llm_cache import LLMCache
 
 
 # Define formatting tool for the agent
@@ -51,6 +52,8 @@ IMPORTANT: You must use the format_report tool to output your final report."""
         model: str = "gpt-4o",
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        cache: LLMCache | None = None,
+        max_prompt_tokens: int | None = None,
     ):
         super().__init__(
             name="writer",
@@ -59,6 +62,8 @@ IMPORTANT: You must use the format_report tool to output your final report."""
             llm_model=model,
             llm_temperature=temperature,
             llm_max_tokens=max_tokens,
+            cache=cache,
+            max_prompt_tokens=max_prompt_tokens,
         )
 
     async def _run(
@@ -71,7 +76,7 @@ IMPORTANT: You must use the format_report tool to output your final report."""
         Uses direct tool calling pattern to ensure structured output.
 
         Args:
-            inputs: Dict with 'synthesis' and 'format'
+            inputs: Dict with 'synthesis', 'format' and optional 'feedback'
             context: Agent context with correlation ID
 
         Returns:
@@ -79,46 +84,30 @@ IMPORTANT: You must use the format_report tool to output your final report."""
         """
         synthesis = inputs.get("synthesis")
         report_format = inputs.get("format", "markdown")
+        feedback = inputs.get("feedback")
 
         # Runtime type validation for type narrowing
         assert isinstance(
             synthesis, SynthesisCompleted
         ), "synthesis must be SynthesisCompleted"
 
-        insights_text = "\n".join(f"- {insight}" for insight in synthesis.insights)
-
-        contradictions_text = "\n".join(
-            f"- {item}" for item in synthesis.resolved_contradictions
-        )
-
-        format_instructions = {
-            "markdown": "Use Markdown formatting with headers, bullet points, and emphasis.",
-            "plain": "Use plain text without any formatting.",
-            "html": "Use HTML tags for structure and formatting.",
-        }.get(report_format, "Use Markdown formatting.")
-
+        request = self._report_request(synthesis, report_format, feedback)
         llm = self.llm.llm
 
         # Check if LLM supports tool calling
         if hasattr(llm, "bind_tools"):
-            # Use direct tool calling pattern
-            llm_with_tools = llm.bind_tools([format_report])
-
             messages = [
                 SystemMessage(content=self.WRITER_SYSTEM_PROMPT),
                 HumanMessage(
-                    content=f"Write a comprehensive report based on the following synthesis:\n\n"
-                    f"INSIGHTS:\n{insights_text}\n\n"
-                    f"RESOLVED CONTRADICTIONS:\n{contradictions_text}\n\n"
-                    f"{format_instructions}\n\n"
-                    "Use the format_report tool to output your final report with:\n"
+                    content=request
+                    + "Use the format_report tool to output your final report with:\n"
                     "- title: descriptive report title about the topic\n"
                     "- content: the full report text about the synthesis insights\n"
                     "- format: the format used (markdown/plain/html)"
                 ),
             ]
 
-            response = await llm_with_tools.ainvoke(messages)
+            response = await self._ainvoke_llm(messages, tools=[format_report])
 
             # Check if the model wants to call a tool
             tool_calls = getattr(response, "tool_calls", None)
@@ -151,18 +140,15 @@ IMPORTANT: You must use the format_report tool to output your final report."""
             messages = [
                 SystemMessage(content=self.WRITER_SYSTEM_PROMPT),
                 HumanMessage(
-                    content=f"Write a comprehensive report based on the following synthesis:\n\n"
-                    f"INSIGHTS:\n{insights_text}\n\n"
-                    f"RESOLVED CONTRADICTIONS:\n{contradictions_text}\n\n"
-                    f"{format_instructions}\n\n"
-                    "Provide your report in JSON format with:\n"
+                    content=request
+                    + "Provide your report in JSON format with:\n"
                     "- title: descriptive report title\n"
                     "- content: the full report text\n"
                     "- format: the format used (markdown/plain/html)"
                 ),
             ]
 
-            response = await self.llm.ainvoke(messages)
+            response = await self._ainvoke_llm(messages)
             content = (
                 response.content if hasattr(response, "content") else str(response)
             )
@@ -199,6 +185,47 @@ IMPORTANT: You must use the format_report tool to output your final report."""
             correlation_id=context.correlation_id,
         )
 
+    @staticmethod
+    def _report_request(
+        synthesis: SynthesisCompleted,
+        report_format: str,
+        feedback: list[str] | None = None,
+    ) -> str:
+        """Build the shared part of the writing prompt.
+
+        Args:
+            synthesis: Synthesis results to write up
+            report_format: Requested output format
+            feedback: Reviewer suggestions the report must address
+
+        Returns:
+            Prompt text describing the insights and formatting rules
+        """
+        insights_text = "\n".join(f"- {insight}" for insight in synthesis.insights)
+
+        contradictions_text = "\n".join(
+            f"- {item}" for item in synthesis.resolved_contradictions
+        )
+
+        format_instructions = {
+            "markdown": "Use Markdown formatting with headers, bullet points, and emphasis.",
+            "plain": "Use plain text without any formatting.",
+            "html": "Use HTML tags for structure and formatting.",
+        }.get(report_format, "Use Markdown formatting.")
+
+        feedback_text = ""
+        if feedback:
+            items = "\n".join(f"- {item}" for item in feedback)
+            feedback_text = f"REVIEWER FEEDBACK TO ADDRESS:\n{items}\n\n"
+
+        return (
+            f"Write a comprehensive report based on the following synthesis:\n\n"
+            f"INSIGHTS:\n{insights_text}\n\n"
+            f"RESOLVED CONTRADICTIONS:\n{contradictions_text}\n\n"
+            f"{feedback_text}"
+            f"{format_instructions}\n\n"
+        )
+
     async def validate_input(self, input: Any) -> bool:
         """Validate input contains synthesis and format."""
         if isinstance(input, dict):
@@ -210,9 +237,20 @@ IMPORTANT: You must use the format_report tool to output your final report."""
         synthesis: SynthesisCompleted,
         context: AgentContext,
         format: str = "markdown",
+        feedback: list[str] | None = None,
     ) -> ReportWritten:
-        """Convenience method to write a report."""
-        return await self.execute(
-            {"synthesis": synthesis, "format": format},
-            context,
-        )
+        """Convenience method to write a report.
+
+        Args:
+            synthesis: Synthesis results to write up
+            context: Agent context with correlation ID
+            format: Output format (markdown, plain, html)
+            feedback: Reviewer suggestions to address when revising
+
+        Returns:
+            ReportWritten event with title and content
+        """
+        inputs: dict[str, Any] = {"synthesis": synthesis, "format": format}
+        if feedback:
+            inputs["feedback"] = feedback
+        return await self.execute(inputs, context)
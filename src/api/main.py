@@ -4,9 +4,13 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api.routes import router as research_router
+from src.infrastructure.llm import aclose_http_clients
 from src.infrastructure.logging import get_logger, setup_logging
+from src.infrastructure.tools import aclose_tavily_clients
+from src.orchestration import ResearchWorkflow
 
 logger = get_logger(__name__)
 
@@ -18,8 +22,12 @@ async def lifespan(app: FastAPI):
     setup_logging()
     logger.info("Veritas API starting up...")
     yield
-    # Shutdown
+    # Shutdown: close the shared connection pools on the loop that used them,
+    # dropping cached agents so none keeps a client built on a closed pool
     logger.info("Veritas API shutting down...")
+    ResearchWorkflow.clear_agent_cache()
+    await aclose_http_clients()
+    await aclose_tavily_clients()
 
 
 app = FastAPI(
@@ -29,6 +37,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
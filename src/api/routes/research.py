@@ -1,12 +1,15 @@
 """Research endpoints for the Veritas API."""
 
 import asyncio
+import threading
+from collections import Counter
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from src.api.models.request import ResearchRequest
 from src.api.models.response import (
@@ -15,12 +18,65 @@ from src.api.models.response import (
     ResearchSource,
     ResearchStatusResponse,
 )
+from src.domain.events import (
+    FactCheckCompleted,
+    ReportReviewed,
+    ReportWritten,
+    ResearchCompleted,
+    SynthesisCompleted,
+)
 from src.orchestration import ResearchWorkflow, WorkflowResult, WorkflowStage
 
 router = APIRouter(prefix="/api/v1/research", tags=["research"])
 
-# In-memory job storage (use Redis/database for production)
-_jobs: dict[str, dict[str, Any]] = {}
+# In-memory job storage (use Redis/database for production).
+# Jobs are partitioned across shards keyed by job ID, each guarded by its own
+# lock, so concurrent writers only contend when they hit the same shard.
+_NUM_SHARDS = 16
+_shards: list[dict[str, dict[str, Any]]] = [{} for _ in range(_NUM_SHARDS)]
+_shard_locks: list[threading.Lock] = [threading.Lock() for _ in range(_NUM_SHARDS)]
+
+
+def _shard_index(job_id: str) -> int:
+    """Get the shard index for a job ID."""
+    return hash(job_id) & (_NUM_SHARDS - 1)
+
+
+def _get_job(job_id: str) -> dict[str, Any] | None:
+    """Get a job record by ID."""
+    return _shards[_shard_index(job_id)].get(job_id)
+
+
+def _put_job(job_id: str, job: dict[str, Any]) -> None:
+    """Store a job record."""
+    idx = _shard_index(job_id)
+    with _shard_locks[idx]:
+        _shards[idx][job_id] = job
+
+
+def _update_job(job_id: str, **fields: Any) -> None:
+    """Update fields of an existing job record (no-op if it was deleted)."""
+    idx = _shard_index(job_id)
+    with _shard_locks[idx]:
+        job = _shards[idx].get(job_id)
+        if job is not None:
+            job.update(fields)
+
+
+def _pop_job(job_id: str) -> dict[str, Any] | None:
+    """Remove a job record, returning it if it existed."""
+    idx = _shard_index(job_id)
+    with _shard_locks[idx]:
+        return _shards[idx].pop(job_id, None)
+
+
+def _iter_jobs() -> list[tuple[str, dict[str, Any]]]:
+    """Snapshot all job records across shards."""
+    jobs: list[tuple[str, dict[str, Any]]] = []
+    for idx, shard in enumerate(_shards):
+        with _shard_locks[idx]:
+            jobs.extend(shard.items())
+    return jobs
 
 
 def _map_workflow_stage_to_progress(stage: WorkflowStage) -> tuple[str, int]:
@@ -37,14 +93,65 @@ def _map_workflow_stage_to_progress(stage: WorkflowStage) -> tuple[str, int]:
     return stage_map.get(stage, ("unknown", 0))
 
 
+def _extract_research(research: ResearchCompleted, data: dict[str, Any]) -> None:
+    """Add research results to response data."""
+    data["topic"] = research.topic
+    data["sources"] = [
+        ResearchSource(title=s.get("title", ""), url=s.get("url", ""))
+        for s in research.sources
+    ]
+    data["findings"] = research.findings
+
+
+def _extract_fact_check(fact_check: FactCheckCompleted, data: dict[str, Any]) -> None:
+    """Add fact-check claim counts to response data."""
+    counts = Counter(c.get("status") for c in fact_check.claims)
+    data["claims_verified"] = counts["verified"]
+    data["claims_partially_verified"] = counts["partially_verified"]
+    data["claims_disputed"] = counts["disputed"]
+    data["claims_unverified"] = counts["unverified"]
+
+
+def _extract_synthesis(synthesis: SynthesisCompleted, data: dict[str, Any]) -> None:
+    """Add synthesis results to response data."""
+    data["insights"] = synthesis.insights
+
+
+def _extract_report(report: ReportWritten, data: dict[str, Any]) -> None:
+    """Add report results to response data."""
+    data["report_title"] = report.title
+    data["report_content"] = report.content
+    data["report_format"] = report.format
+
+
+def _extract_review(review: ReportReviewed, data: dict[str, Any]) -> None:
+    """Add review results to response data."""
+    data["review_score"] = review.score
+    data["review_approved"] = review.approved
+    data["review_suggestions"] = review.suggestions
+
+
+# WorkflowResult attribute -> extractor that copies its fields into the response
+_EXTRACTORS: list[tuple[str, Callable[[Any, dict[str, Any]], None]]] = [
+    ("research", _extract_research),
+    ("fact_check", _extract_fact_check),
+    ("synthesis", _extract_synthesis),
+    ("report", _extract_report),
+    ("review", _extract_review),
+]
+
+
 def _convert_workflow_result(
     job_id: str, result: WorkflowResult
 ) -> ResearchJobResponse:
-    """Convert WorkflowResult to API response model."""
-    import traceback
+    """Convert WorkflowResult to API response model.
 
+    Values are built server-side from trusted ``WorkflowResult`` events, so the
+    response is assembled with ``model_construct`` to skip re-validation.
+    """
     now = datetime.now(UTC)
-    created_at = job_id in _jobs and _jobs[job_id].get("created_at") or now
+    job = _get_job(job_id)
+    created_at = job and job.get("created_at") or now
 
     # Get stage and progress
     current_stage, progress_percentage = _map_workflow_stage_to_progress(result.status)
@@ -67,60 +174,29 @@ def _convert_workflow_result(
     if result.status == WorkflowStage.FAILED:
         response_data["status"] = JobStatus.FAILED
         response_data["error"] = result.error
-        return ResearchJobResponse(**response_data)
-
-    # Add research results
-    if result.research:
-        response_data["topic"] = result.research.topic
-        response_data["sources"] = [
-            ResearchSource(title=s.get("title", ""), url=s.get("url", ""))
-            for s in result.research.sources
-        ]
-        response_data["findings"] = result.research.findings
-
-    # Add fact-check results
-    if result.fact_check:
-        claims = result.fact_check.claims
-        response_data["claims_verified"] = len(
-            [c for c in claims if c.get("status") == "verified"]
-        )
-        response_data["claims_partially_verified"] = len(
-            [c for c in claims if c.get("status") == "partially_verified"]
-        )
-        response_data["claims_disputed"] = len(
-            [c for c in claims if c.get("status") == "disputed"]
-        )
-        response_data["claims_unverified"] = len(
-            [c for c in claims if c.get("status") == "unverified"]
-        )
+        return ResearchJobResponse.model_construct(**response_data)
 
-    # Add synthesis results
-    if result.synthesis:
-        response_data["insights"] = result.synthesis.insights
-
-    # Add report results
-    if result.report:
-        response_data["report_title"] = result.report.title
-        response_data["report_content"] = result.report.content
-        response_data["report_format"] = result.report.format
-
-    # Add review results
-    if result.review:
-        response_data["review_score"] = result.review.score
-        response_data["review_approved"] = result.review.approved
-        response_data["review_suggestions"] = result.review.suggestions
+    for attr, extract in _EXTRACTORS:
+        part = getattr(result, attr)
+        if part is not None:
+            extract(part, response_data)
+
+    if result.review is not None:
         response_data["review_iterations"] = result.iterations
 
-    return ResearchJobResponse(**response_data)
+    return ResearchJobResponse.model_construct(**response_data)
 
 
 async def _run_research_workflow(job_id: str, request: ResearchRequest) -> None:
     """Background task to run the research workflow."""
     try:
         # Update status to processing
-        _jobs[job_id]["status"] = JobStatus.PROCESSING
-        _jobs[job_id]["current_stage"] = "research"
-        _jobs[job_id]["progress_percentage"] = 20
+        _update_job(
+            job_id,
+            status=JobStatus.PROCESSING,
+            current_stage="research",
+            progress_percentage=20,
+        )
 
         # Create and execute workflow
         workflow = ResearchWorkflow(
@@ -134,25 +210,32 @@ async def _run_research_workflow(job_id: str, request: ResearchRequest) -> None:
         result = await workflow.execute(request.topic, correlation_id=job_id)
 
         # Store result
-        _jobs[job_id]["result"] = result
-        _jobs[job_id]["status"] = (
-            JobStatus.COMPLETED
-            if result.status == WorkflowStage.COMPLETED
-            else JobStatus.FAILED
+        _update_job(
+            job_id,
+            result=result,
+            status=(
+                JobStatus.COMPLETED
+                if result.status == WorkflowStage.COMPLETED
+                else JobStatus.FAILED
+            ),
+            current_stage=result.status.value,
+            progress_percentage=100,
+            updated_at=datetime.now(UTC),
         )
-        _jobs[job_id]["current_stage"] = result.status.value
-        _jobs[job_id]["progress_percentage"] = 100
-        _jobs[job_id]["updated_at"] = datetime.now(UTC)
 
     except Exception as e:
-        _jobs[job_id]["status"] = JobStatus.FAILED
-        _jobs[job_id]["error"] = str(e)
-        _jobs[job_id]["updated_at"] = datetime.now(UTC)
+        _update_job(
+            job_id,
+            status=JobStatus.FAILED,
+            error=str(e),
+            updated_at=datetime.now(UTC),
+        )
 
 
 @router.post(
     "",
     response_model=ResearchStatusResponse,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_202_ACCEPTED,
     summary="Submit a research job",
     description="Submit a new research topic for analysis. Returns a job ID for tracking.",
@@ -166,16 +249,19 @@ async def submit_research(
     now = datetime.now(UTC)
 
     # Store job info
-    _jobs[job_id] = {
-        "job_id": job_id,
-        "status": JobStatus.PENDING,
-        "topic": request.topic,
-        "created_at": now,
-        "updated_at": now,
-        "current_stage": None,
-        "progress_percentage": 0,
-        "request": request.model_dump(),
-    }
+    _put_job(
+        job_id,
+        {
+            "job_id": job_id,
+            "status": JobStatus.PENDING,
+            "topic": request.topic,
+            "created_at": now,
+            "updated_at": now,
+            "current_stage": None,
+            "progress_percentage": 0,
+            "request": request.model_dump(),
+        },
+    )
 
     # Add background task
     background_tasks.add_task(_run_research_workflow, job_id, request)
@@ -192,6 +278,7 @@ async def submit_research(
 @router.get(
     "/{job_id}",
     response_model=ResearchJobResponse,
+    response_class=ORJSONResponse,
     summary="Get research job status and results",
     description="Retrieve the current status and results of a research job.",
 )
@@ -199,13 +286,13 @@ async def get_research_job(job_id: str) -> ResearchJobResponse:
     """Get the status and results of a research job."""
     import traceback
 
-    if job_id not in _jobs:
+    job = _get_job(job_id)
+    if job is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_id} not found",
         )
 
-    job = _jobs[job_id]
     now = datetime.now(UTC)
 
     # If job is still pending/processing, return status only
@@ -251,6 +338,7 @@ async def get_research_job(job_id: str) -> ResearchJobResponse:
 @router.get(
     "",
     response_model=list[ResearchStatusResponse],
+    response_class=ORJSONResponse,
     summary="List research jobs",
     description="Get a list of research jobs with optional filtering and sorting.",
 )
@@ -262,7 +350,7 @@ async def list_research_jobs(
     """List research jobs with filtering, sorting, and limiting."""
     # Filter jobs by status
     filtered_jobs = [
-        (job_id, job) for job_id, job in _jobs.items() if job["status"] == job_status
+        (job_id, job) for job_id, job in _iter_jobs() if job["status"] == job_status
     ]
 
     # Sort by updated_at
@@ -300,9 +388,8 @@ async def list_research_jobs(
 )
 async def delete_research_job(job_id: str) -> None:
     """Delete a research job."""
-    if job_id not in _jobs:
+    if _pop_job(job_id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_id} not found",
         )
-    del _jobs[job_id]
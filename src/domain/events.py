@@ -6,6 +6,11 @@ from typing import Any
 from uuid import uuid4
 
 
+def _now() -> datetime:
+    """Return the current UTC time used to stamp new events."""
+    return datetime.now(UTC)
+
+
 @dataclass
 class DomainEvent:
     """Base domain event for agent communication."""
@@ -26,7 +31,7 @@ class DomainEvent:
         """Factory method to create a domain event."""
         return cls(
             event_id=str(uuid4()),
-            timestamp=datetime.now(UTC),
+            timestamp=_now(),
             correlation_id=correlation_id or str(uuid4()),
             event_type=event_type,
             payload=payload,
@@ -52,7 +57,7 @@ class ResearchCompleted(DomainEvent):
         """Factory method to create a research completed event."""
         return cls(
             event_id=str(uuid4()),
-            timestamp=datetime.now(UTC),
+            timestamp=_now(),
             correlation_id=correlation_id or str(uuid4()),
             event_type="research.completed",
             payload={
@@ -85,7 +90,7 @@ class FactCheckCompleted(DomainEvent):
         """Factory method to create a fact-check completed event."""
         return cls(
             event_id=str(uuid4()),
-            timestamp=datetime.now(UTC),
+            timestamp=_now(),
             correlation_id=correlation_id or str(uuid4()),
             event_type="fact_check.completed",
             payload={
@@ -116,7 +121,7 @@ class SynthesisCompleted(DomainEvent):
         """Factory method to create a synthesis completed event."""
         return cls(
             event_id=str(uuid4()),
-            timestamp=datetime.now(UTC),
+            timestamp=_now(),
             correlation_id=correlation_id or str(uuid4()),
             event_type="synthesis.completed",
             payload={
@@ -147,7 +152,7 @@ class ReportWritten(DomainEvent):
         """Factory method to create a report written event."""
         return cls(
             event_id=str(uuid4()),
-            timestamp=datetime.now(UTC),
+            timestamp=_now(),
             correlation_id=correlation_id or str(uuid4()),
             event_type="report.written",
             payload={
@@ -180,7 +185,7 @@ class ReportReviewed(DomainEvent):
         """Factory method to create a report reviewed event."""
         return cls(
             event_id=str(uuid4()),
-            timestamp=datetime.now(UTC),
+            timestamp=_now(),
             correlation_id=correlation_id or str(uuid4()),
             event_type="report.reviewed",
             payload={
@@ -1,9 +1,26 @@
 """Infrastructure layer for Veritas."""
 
-from .llm import get_anthropic_llm, get_llm, get_openai_llm
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .llm import get_anthropic_llm, get_llm, get_openai_llm
 
 __all__ = [
     "get_openai_llm",
     "get_anthropic_llm",
     "get_llm",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import LLM factories on first access (PEP 562).
+
+    Keeps lightweight modules such as ``logging`` and ``llm_cache`` from
+    pulling in every LLM client library.
+    """
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".llm", __name__), name)
+    globals()[name] = value
+    return value
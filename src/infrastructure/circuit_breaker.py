@@ -2,11 +2,13 @@
 
 import asyncio
 import logging
+import threading
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import Enum
-from typing import Any
+from typing import Any, Protocol
 
 logger = logging.getLogger(__name__)
 
@@ -19,15 +21,48 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
-@dataclass
+def to_datetime(monotonic_ts: float | None) -> datetime | None:
+    """Convert a ``time.monotonic()`` reading to an approximate UTC datetime.
+
+    Args:
+        monotonic_ts: Monotonic timestamp, or None
+
+    Returns:
+        Wall-clock datetime for display, or None if no timestamp
+    """
+    if monotonic_ts is None:
+        return None
+    return datetime.now(UTC) - timedelta(seconds=time.monotonic() - monotonic_ts)
+
+
 class CircuitStats:
-    """Statistics for circuit breaker."""
+    """Statistics for circuit breaker.
 
-    total_calls: int = 0
-    successful_calls: int = 0
-    failed_calls: int = 0
-    last_failure_time: datetime | None = None
-    last_success_time: datetime | None = None
+    Timestamps are ``time.monotonic()`` readings; use ``to_datetime`` to
+    convert them for display.
+    """
+
+    __slots__ = (
+        "total_calls",
+        "successful_calls",
+        "failed_calls",
+        "last_failure_monotonic",
+        "last_success_monotonic",
+    )
+
+    def __init__(self) -> None:
+        self.total_calls = 0
+        self.successful_calls = 0
+        self.failed_calls = 0
+        self.last_failure_monotonic: float | None = None
+        self.last_success_monotonic: float | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"CircuitStats(total_calls={self.total_calls}, "
+            f"successful_calls={self.successful_calls}, "
+            f"failed_calls={self.failed_calls})"
+        )
 
     @property
     def failure_rate(self) -> float:
@@ -37,7 +72,89 @@ class CircuitStats:
         return self.failed_calls / self.total_calls
 
 
-@dataclass
+@dataclass(frozen=True)
+class StateSnapshot:
+    """Circuit state shared with other processes through a store.
+
+    Attributes:
+        state: Circuit state at the time of the transition
+        opened_at: Wall-clock epoch seconds when the circuit opened, if open
+    """
+
+    state: CircuitState
+    opened_at: float | None = None
+
+
+class CircuitBreakerStore(Protocol):
+    """Backend for sharing circuit state across replicas."""
+
+    async def get(self, name: str) -> StateSnapshot | None:
+        """Get the last published snapshot for a circuit."""
+        ...
+
+    async def record(self, name: str, snapshot: StateSnapshot) -> None:
+        """Publish a circuit's new state."""
+        ...
+
+
+class RedisCircuitBreakerStore:
+    """Circuit breaker store backed by Redis.
+
+    Requires the optional ``redis`` package.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        key_prefix: str = "veritas:circuit:",
+        ttl_seconds: int = 300,
+        client: Any = None,
+    ):
+        """Initialize Redis store.
+
+        Args:
+            url: Redis connection URL (ignored if client is given)
+            key_prefix: Prefix for circuit keys
+            ttl_seconds: Expiry for published snapshots
+            client: Optional pre-configured ``redis.asyncio.Redis`` client
+        """
+        if client is None:
+            try:
+                from redis import asyncio as redis_asyncio
+            except ImportError as e:
+                raise ImportError(
+                    "The redis package is required for RedisCircuitBreakerStore"
+                ) from e
+            client = redis_asyncio.from_url(url, decode_responses=True)
+        self._client = client
+        self._key_prefix = key_prefix
+        self._ttl_seconds = ttl_seconds
+
+    async def get(self, name: str) -> StateSnapshot | None:
+        """Get the last published snapshot for a circuit."""
+        data = await self._client.hgetall(f"{self._key_prefix}{name}")
+        if not data:
+            return None
+        opened_at = data.get("opened_at")
+        return StateSnapshot(
+            state=CircuitState(data["state"]),
+            opened_at=float(opened_at) if opened_at else None,
+        )
+
+    async def record(self, name: str, snapshot: StateSnapshot) -> None:
+        """Publish a circuit's new state."""
+        key = f"{self._key_prefix}{name}"
+        await self._client.hset(
+            key,
+            mapping={
+                "state": snapshot.state.value,
+                "opened_at": "" if snapshot.opened_at is None else str(snapshot.opened_at),
+            },
+        )
+        await self._client.expire(key, self._ttl_seconds)
+
+
+@dataclass(frozen=True, slots=True)
 class CircuitBreakerConfig:
     """Configuration for circuit breaker behavior.
 
@@ -54,6 +171,12 @@ class CircuitBreakerConfig:
     timeout_seconds: float = 30.0
 
 
+# Internal state codes; int comparisons are cheaper than Enum equality on the
+# hot path. ``_STATES`` maps them back to ``CircuitState`` at the boundary.
+_CLOSED, _OPEN, _HALF_OPEN = 0, 1, 2
+_STATES = (CircuitState.CLOSED, CircuitState.OPEN, CircuitState.HALF_OPEN)
+
+
 class CircuitBreaker:
     """Circuit breaker implementation for graceful degradation.
 
@@ -64,6 +187,26 @@ class CircuitBreaker:
     - Auto-closing circuit when health is restored
     """
 
+    # Aggregators may hold thousands of breakers; avoid a per-instance __dict__
+    __slots__ = (
+        "name",
+        "config",
+        "on_state_change",
+        "_store",
+        "_store_cache_ttl",
+        "_remote_snapshot",
+        "_cache_expiry",
+        "_pending_tasks",
+        "_state_int",
+        "_stats",
+        "_failure_count",
+        "_success_count",
+        "_opened_at",
+        "_half_open_probes",
+        "_probe_epoch",
+        "_lock",
+    )
+
     def __init__(
         self,
         name: str,
@@ -71,6 +214,8 @@ class CircuitBreaker:
         on_state_change: (
             Callable[[str, CircuitState, CircuitState], None] | None
         ) = None,
+        store: CircuitBreakerStore | None = None,
+        store_cache_ttl: float = 1.0,
     ):
         """Initialize circuit breaker.
 
@@ -78,82 +223,253 @@ class CircuitBreaker:
             name: Identifier for this circuit breaker
             config: Circuit breaker configuration
             on_state_change: Callback when state changes (name, old_state, new_state)
+            store: Optional store for sharing state across replicas
+            store_cache_ttl: Seconds to reuse a fetched remote snapshot
         """
         self.name = name
         self.config = config or CircuitBreakerConfig()
         self.on_state_change = on_state_change
+        self._store = store
+        self._store_cache_ttl = store_cache_ttl
+        self._remote_snapshot: StateSnapshot | None = None
+        self._cache_expiry = 0.0
+        self._pending_tasks: set[asyncio.Task] = set()
 
-        self._state = CircuitState.CLOSED
+        self._state_int = _CLOSED
         self._stats = CircuitStats()
         self._failure_count = 0
         self._success_count = 0
-        self._last_failure_time: datetime | None = None
-        self._opened_at: datetime | None = None
+        self._opened_at: float | None = None
+        # Calls admitted while HALF_OPEN and not yet finished; the epoch
+        # changes on every transition so stale slots release nothing
+        self._half_open_probes = 0
+        self._probe_epoch = 0
+        # Guards only the compare-and-set of state/counters, never held across I/O
+        self._lock = threading.Lock()
 
     @property
     def state(self) -> CircuitState:
         """Get current circuit state."""
-        if self._state == CircuitState.OPEN:
-            # Check if cooldown has passed
-            if self._opened_at and self._opened_at + timedelta(
-                seconds=self.config.cooldown_seconds
-            ) < datetime.now(UTC):
-                self._transition_to(CircuitState.HALF_OPEN)
-                return CircuitState.HALF_OPEN
-        return self._state
+        state = self._state_int
+        if state == _OPEN:
+            state = self._slow_check()
+        return _STATES[state]
+
+    def _slow_check(self) -> int:
+        """Resolve the state of an OPEN circuit, promoting it after cooldown.
+
+        Kept off the CLOSED fast path so healthy circuits never read the clock.
+        """
+        if (
+            self._opened_at is not None
+            and time.monotonic() - self._opened_at > self.config.cooldown_seconds
+        ):
+            self._transition_to(_HALF_OPEN, expected=_OPEN)
+        return self._state_int
 
     @property
     def stats(self) -> CircuitStats:
         """Get circuit statistics."""
         return self._stats
 
-    def _transition_to(self, new_state: CircuitState) -> None:
-        """Transition to a new state with logging."""
-        old_state = self._state
-        if old_state != new_state:
-            self._state = new_state
-            logger.warning(
-                f"Circuit '{self.name}' state changed: {old_state.value} -> {new_state.value}"
-            )
-            if self.on_state_change:
-                self.on_state_change(self.name, old_state, new_state)
+    def snapshot(self) -> tuple[CircuitState, float | None]:
+        """Read state and last failure time in one pass.
+
+        Does not promote an OPEN circuit after cooldown; use ``state`` for that.
+
+        Returns:
+            Tuple of (state, last failure as a ``time.monotonic()`` reading)
+        """
+        return _STATES[self._state_int], self._stats.last_failure_monotonic
+
+    def _transition_to(
+        self,
+        new_state: int,
+        expected: int,
+        now: float | None = None,
+    ) -> bool:
+        """Transition from ``expected`` to ``new_state`` with logging.
+
+        Behaves like a compare-and-set: the transition only happens if the
+        current state is still ``expected``, so concurrent callers cannot
+        double-open the circuit or fire the callback twice. The lock is held
+        only for the swap; logging and the callback run outside it.
+
+        Args:
+            new_state: State code to transition to
+            expected: State code the circuit must currently be in
+            now: Monotonic timestamp of the triggering event, if already read
+
+        Returns:
+            True if this call performed the transition
+        """
+        if self._state_int == new_state:
+            # Already there: skip the lock, log record and callback entirely
+            return False
+        with self._lock:
+            if self._state_int != expected:
+                return False
+            self._state_int = new_state
+            self._half_open_probes = 0
+            self._probe_epoch += 1
+            if new_state == _OPEN:
+                self._opened_at = time.monotonic() if now is None else now
+                self._success_count = 0
+
+        old, new = _STATES[expected], _STATES[new_state]
+        logger.warning(
+            "Circuit '%s' state changed: %s -> %s",
+            self.name,
+            old.value,
+            new.value,
+        )
+        if self.on_state_change:
+            self.on_state_change(self.name, old, new)
+        if self._store is not None:
+            opened_at = time.time() if new_state == _OPEN else None
+            self._spawn(self._store.record(self.name, StateSnapshot(new, opened_at)))
+        return True
+
+    def _spawn(self, coro: Any) -> None:
+        """Run a store coroutine fire-and-forget on the running event loop."""
+        try:
+            task = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            # No running loop (sync caller): skip remote sync for this event
+            coro.close()
+            return
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+
+    async def _refresh_snapshot(self) -> None:
+        """Fetch the latest remote snapshot into the local cache."""
+        try:
+            self._remote_snapshot = await self._store.get(self.name)  # type: ignore[union-attr]
+        except Exception as e:
+            logger.warning("Circuit '%s' failed to read shared state: %s", self.name, e)
+
+    def _remote_open(self) -> bool:
+        """Check whether another replica has opened this circuit.
+
+        Uses the locally cached snapshot and refreshes it in the background
+        at most once per ``store_cache_ttl`` seconds.
+        """
+        now = time.monotonic()
+        if now >= self._cache_expiry:
+            self._cache_expiry = now + self._store_cache_ttl
+            self._spawn(self._refresh_snapshot())
+
+        snapshot = self._remote_snapshot
+        return (
+            snapshot is not None
+            and snapshot.state == CircuitState.OPEN
+            and snapshot.opened_at is not None
+            and time.time() - snapshot.opened_at < self.config.cooldown_seconds
+        )
 
     def record_success(self) -> None:
         """Record a successful call."""
-        self._stats.total_calls += 1
-        self._stats.successful_calls += 1
-        self._stats.last_success_time = datetime.now(UTC)
-
-        if self._state == CircuitState.HALF_OPEN:
-            self._success_count += 1
-            if self._success_count >= self.config.success_threshold:
-                self._failure_count = 0
-                self._success_count = 0
-                self._transition_to(CircuitState.CLOSED)
+        now = time.monotonic()
+        stats = self._stats
+        threshold_reached = False
+        with self._lock:
+            stats.total_calls += 1
+            stats.successful_calls += 1
+            stats.last_success_monotonic = now
+            if self._state_int == _HALF_OPEN:
+                self._success_count += 1
+                threshold_reached = (
+                    self._success_count >= self.config.success_threshold
+                )
+
+        if threshold_reached and self._transition_to(_CLOSED, expected=_HALF_OPEN):
+            self._failure_count = 0
+            self._success_count = 0
 
     def record_failure(self) -> None:
         """Record a failed call."""
-        self._stats.total_calls += 1
-        self._stats.failed_calls += 1
-        self._stats.last_failure_time = datetime.now(UTC)
-        self._last_failure_time = datetime.now(UTC)
-
-        if self._state == CircuitState.HALF_OPEN:
-            self._transition_to(CircuitState.OPEN)
-            self._opened_at = datetime.now(UTC)
-        elif self._state == CircuitState.CLOSED:
-            self._failure_count += 1
-            if self._failure_count >= self.config.failure_threshold:
-                self._opened_at = datetime.now(UTC)
-                self._transition_to(CircuitState.OPEN)
+        now = time.monotonic()
+        stats = self._stats
+        threshold_reached = False
+        with self._lock:
+            stats.total_calls += 1
+            stats.failed_calls += 1
+            stats.last_failure_monotonic = now
+            state = self._state_int
+            if state == _CLOSED:
+                self._failure_count += 1
+                threshold_reached = (
+                    self._failure_count >= self.config.failure_threshold
+                )
+
+        if state == _HALF_OPEN:
+            self._transition_to(_OPEN, expected=_HALF_OPEN, now=now)
+        elif threshold_reached:
+            self._transition_to(_OPEN, expected=_CLOSED, now=now)
 
     def allow_request(self) -> bool:
-        """Check if a request should be allowed.
+        """Check if a request would be allowed, without admitting it.
+
+        Use ``acquire`` to actually admit a call.
 
         Returns:
             True if request is allowed, False if circuit is open
         """
-        return self.state != CircuitState.OPEN
+        state = self._state_int
+        if state == _CLOSED:
+            return self._store is None or not self._remote_open()
+        if state == _OPEN and self._slow_check() == _OPEN:
+            return False
+        return (
+            self._state_int == _CLOSED
+            or self._half_open_probes < self.config.success_threshold
+        )
+
+    def acquire(self) -> "ProbeSlot | None":
+        """Admit a call, taking a HALF_OPEN probe slot if needed.
+
+        Returns:
+            None if the call is blocked; otherwise a slot whose ``release``
+            must be called exactly once when the call finishes
+        """
+        state = self._state_int
+        if state == _CLOSED:
+            if self._store is not None and self._remote_open():
+                return None
+            return _NO_PROBE
+        if state == _OPEN and self._slow_check() == _OPEN:
+            return None
+        return self._acquire_probe()
+
+    def _acquire_probe(self) -> "ProbeSlot | None":
+        """Admit a HALF_OPEN probe if fewer than ``success_threshold`` are in flight.
+
+        Caps the calls that reach a recovering dependency when the cooldown
+        ends; the slot is freed by ``ProbeSlot.release``.
+        """
+        with self._lock:
+            if self._state_int != _HALF_OPEN:
+                return _NO_PROBE if self._state_int == _CLOSED else None
+            if self._half_open_probes >= self.config.success_threshold:
+                return None
+            self._half_open_probes += 1
+            epoch = self._probe_epoch
+        return ProbeSlot(self, epoch)
+
+    def _release_probe(self, epoch: int) -> None:
+        """Free a probe slot taken in ``epoch``, if the state has not moved on."""
+        with self._lock:
+            if self._probe_epoch == epoch and self._half_open_probes:
+                self._half_open_probes -= 1
+
+    def reset(self) -> None:
+        """Force the circuit closed and clear its counters."""
+        with self._lock:
+            self._state_int = _CLOSED
+            self._failure_count = 0
+            self._success_count = 0
+            self._half_open_probes = 0
+            self._probe_epoch += 1
 
     async def call(
         self,
@@ -175,17 +491,16 @@ class CircuitBreaker:
             CircuitOpenError: If circuit is open
             Exception: Any exception from the coroutine
         """
-        if not self.allow_request():
+        slot = self.acquire()
+        if slot is None:
             raise CircuitOpenError(
                 f"Circuit '{self.name}' is open. Requests blocked until cooldown completes."
             )
 
         try:
-            # Execute with timeout
-            result = await asyncio.wait_for(
-                coro(*args, **kwargs),
-                timeout=self.config.timeout_seconds,
-            )
+            # Execute with timeout; asyncio.timeout avoids wait_for's wrapper task
+            async with asyncio.timeout(self.config.timeout_seconds):
+                result = await coro(*args, **kwargs)
             self.record_success()
             return result
         except TimeoutError:
@@ -196,6 +511,40 @@ class CircuitBreaker:
         except Exception:
             self.record_failure()
             raise
+        finally:
+            slot.release()
+
+
+class ProbeSlot:
+    """Admission handed out by ``CircuitBreaker.acquire``.
+
+    Calls admitted while HALF_OPEN hold one of the breaker's probe slots;
+    releasing the slot frees it. Releasing more than once is a no-op, so
+    retries inside one admitted call cannot free extra slots.
+    """
+
+    __slots__ = ("_breaker", "_epoch")
+
+    def __init__(self, breaker: CircuitBreaker | None, epoch: int = 0):
+        """Initialize slot.
+
+        Args:
+            breaker: Breaker whose probe count to release, or None for calls
+                admitted while CLOSED
+            epoch: Breaker probe epoch the slot was taken in
+        """
+        self._breaker = breaker
+        self._epoch = epoch
+
+    def release(self) -> None:
+        """Free the probe slot, once."""
+        breaker, self._breaker = self._breaker, None
+        if breaker is not None:
+            breaker._release_probe(self._epoch)
+
+
+# Shared admission for calls that took no probe slot
+_NO_PROBE = ProbeSlot(None)
 
 
 class CircuitOpenError(Exception):
@@ -211,41 +560,67 @@ class CircuitTimeoutError(Exception):
 
 
 class CircuitBreakerRegistry:
-    """Registry for managing multiple circuit breakers."""
+    """Registry for managing multiple circuit breakers.
+
+    Breakers are partitioned across shards keyed by name, each with its own
+    lock. Lookups are lock-free; creation uses double-checked locking so
+    concurrent first calls for the same name always share one breaker.
+    """
 
-    _breakers: dict[str, CircuitBreaker] = {}
+    _NUM_SHARDS = 8
+    _shards: list[dict[str, CircuitBreaker]] = [{} for _ in range(_NUM_SHARDS)]
+    _locks: list[threading.Lock] = [threading.Lock() for _ in range(_NUM_SHARDS)]
+
+    @classmethod
+    def _shard_index(cls, name: str) -> int:
+        """Get the shard index for a breaker name."""
+        return hash(name) & (cls._NUM_SHARDS - 1)
 
     @classmethod
     def get_or_create(
         cls,
         name: str,
         config: CircuitBreakerConfig | None = None,
+        store: CircuitBreakerStore | None = None,
     ) -> CircuitBreaker:
         """Get or create a circuit breaker by name."""
-        if name not in cls._breakers:
-            cls._breakers[name] = CircuitBreaker(name, config)
-        return cls._breakers[name]
+        idx = cls._shard_index(name)
+        shard = cls._shards[idx]
+        breaker = shard.get(name)
+        if breaker is None:
+            with cls._locks[idx]:
+                breaker = shard.get(name)
+                if breaker is None:
+                    breaker = CircuitBreaker(name, config, store=store)
+                    shard[name] = breaker
+        return breaker
 
     @classmethod
     def get(cls, name: str) -> CircuitBreaker | None:
         """Get a circuit breaker by name."""
-        return cls._breakers.get(name)
+        return cls._shards[cls._shard_index(name)].get(name)
 
     @classmethod
     def reset(cls, name: str) -> bool:
         """Reset (close) a circuit breaker by name."""
-        breaker = cls._breakers.get(name)
+        breaker = cls.get(name)
         if breaker:
-            breaker._state = CircuitState.CLOSED
-            breaker._failure_count = 0
-            breaker._success_count = 0
+            breaker.reset()
             return True
         return False
 
+    @classmethod
+    def clear(cls) -> None:
+        """Remove all registered circuit breakers."""
+        for idx, shard in enumerate(cls._shards):
+            with cls._locks[idx]:
+                shard.clear()
+
     @classmethod
     def all_states(cls) -> dict[str, tuple[CircuitState, CircuitStats]]:
         """Get state and stats for all circuit breakers."""
         return {
             name: (breaker.state, breaker.stats)
-            for name, breaker in cls._breakers.items()
+            for shard in cls._shards
+            for name, breaker in list(shard.items())
         }
@@ -1,9 +1,16 @@
 """LLM client infrastructure using LangChain with resilience features."""
 
+import asyncio
+import functools
 import logging
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import Token
+from dataclasses import astuple
 from typing import Any, TypeVar
 
+import httpx
 from langchain_anthropic import ChatAnthropic
 from langchain_ollama import ChatOllama
 from langchain_openai import ChatOpenAI
@@ -11,6 +18,7 @@ from tenacity import (
     after_log,
     before_sleep_log,
     retry,
+    retry_if_exception,
     stop_after_attempt,
     wait_exponential,
 )
@@ -19,23 +27,102 @@ from src.config import settings
 from src.config.retry import (
     RETRY_CONFIG_DEFAULT,
     RetryConfig,
+    is_retryable_error,
 )
 from src.infrastructure.circuit_breaker import (
     CircuitBreakerConfig,
     CircuitBreakerRegistry,
     CircuitOpenError,
+    CircuitState,
+    to_datetime,
 )
+from src.infrastructure.logging import CorrelationIdFilter, correlation_id_var
 
 logger = logging.getLogger(__name__)
+logger.addFilter(CorrelationIdFilter())
 
 T = TypeVar("T")
 
+# Connection pools shared by every OpenAI-compatible client (OpenAI, OpenRouter)
+# so TCP/TLS connections are reused regardless of model. Pass http_client /
+# http_async_client explicitly to opt out. The pools are created on first use;
+# the async pool's connections belong to the event loop that opened them, so
+# async LLM calls are expected to run on one loop (the API server's).
+_HTTPX_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_shared_http: tuple[httpx.Client, httpx.AsyncClient] | None = None
+_shared_http_lock = threading.Lock()
+
+
+def _shared_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    """Return the shared sync and async httpx pools, creating them on first use."""
+    global _shared_http
+    with _shared_http_lock:
+        if _shared_http is None:
+            _shared_http = (
+                httpx.Client(limits=_HTTPX_LIMITS),
+                httpx.AsyncClient(limits=_HTTPX_LIMITS),
+            )
+        return _shared_http
+
+
+async def aclose_http_clients() -> None:
+    """Close the shared httpx pools and drop the clients built on them.
+
+    Await this on the event loop that made the LLM calls, before it stops;
+    the API lifespan does so on shutdown. Later calls get fresh pools.
+    """
+    global _shared_http
+    with _shared_http_lock:
+        clients, _shared_http = _shared_http, None
+    _cached_wrapper.cache_clear()
+    _cached_client.cache_clear()
+    if clients is not None:
+        sync_client, async_client = clients
+        sync_client.close()
+        await async_client.aclose()
+
+
+def _fmt_mono(monotonic_ts: float | None) -> str:
+    """Format a monotonic timestamp for messages, or "n/a" if unset."""
+    if monotonic_ts is None:
+        return "n/a"
+    return to_datetime(monotonic_ts).isoformat()
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_client(client_cls: type, config: tuple[tuple[str, Any], ...]) -> Any:
+    """Construct an LLM client once per (class, configuration)."""
+    return client_cls(**dict(config))
+
+
+def _build_client(client_cls: type, **kwargs: Any) -> Any:
+    """Construct an LLM client, reusing a cached instance for identical configs.
+
+    Reusing the client keeps its HTTP connection pool warm across calls.
+    Configurations with unhashable values (e.g. callbacks, custom HTTP
+    clients) are constructed fresh every time.
+
+    Args:
+        client_cls: LangChain chat model class to instantiate
+        **kwargs: Constructor arguments
+
+    Returns:
+        Configured client instance
+    """
+    config = tuple(sorted(kwargs.items()))
+    try:
+        hash(config)
+    except TypeError:
+        return client_cls(**kwargs)
+    return _cached_client(client_cls, config)
+
 
 def get_openai_llm(
     model: str = "gpt-4o",
     temperature: float = 0.7,
     max_retries: int = 5,
     max_tokens: int | None = None,
+    **kwargs,
 ) -> ChatOpenAI:
     """Get configured OpenAI LLM client with retry configuration.
 
@@ -44,11 +131,13 @@ def get_openai_llm(
         temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
         max_retries: Maximum number of retries on rate limit errors
         max_tokens: Maximum number of tokens to generate (None = unlimited)
+        **kwargs: Additional arguments passed to ChatOpenAI (e.g. http_client
+            and http_async_client to use dedicated connection pools)
 
     Returns:
         Configured ChatOpenAI instance
     """
-    kwargs = dict(
+    kwargs.update(
         model=model,
         temperature=temperature,
         api_key=settings.openai_api_key,
@@ -56,7 +145,11 @@ def get_openai_llm(
     )
     if max_tokens is not None:
         kwargs["max_tokens"] = max_tokens
-    return ChatOpenAI(**kwargs)
+    if "http_client" not in kwargs or "http_async_client" not in kwargs:
+        http_client, http_async_client = _shared_http_clients()
+        kwargs.setdefault("http_client", http_client)
+        kwargs.setdefault("http_async_client", http_async_client)
+    return _build_client(ChatOpenAI, **kwargs)
 
 
 def get_anthropic_llm(
@@ -77,7 +170,8 @@ def get_anthropic_llm(
         Configured ChatAnthropic instance
     """
     kwargs["max_tokens"] = max_tokens if max_tokens is not None else 4096
-    return ChatAnthropic(
+    return _build_client(
+        ChatAnthropic,
         model_name=model_name,
         temperature=temperature,
         api_key=settings.anthropic_api_key,
@@ -97,7 +191,8 @@ def get_openrouter_llm(
         model: Model name to use (default: "openai/gpt-5-nano")
         temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
         max_tokens: Maximum tokens to generate (None = unlimited)
-        **kwargs: Additional arguments passed to ChatOpenAI
+        **kwargs: Additional arguments passed to ChatOpenAI (e.g. http_client
+            and http_async_client to use dedicated connection pools)
 
     Returns:
         Configured ChatOpenAI instance for OpenRouter
@@ -113,7 +208,11 @@ def get_openrouter_llm(
     )
     if max_tokens is not None:
         config_kwargs["max_tokens"] = max_tokens
-    return ChatOpenAI(**config_kwargs, **kwargs)
+    if "http_client" not in kwargs or "http_async_client" not in kwargs:
+        http_client, http_async_client = _shared_http_clients()
+        kwargs.setdefault("http_client", http_client)
+        kwargs.setdefault("http_async_client", http_async_client)
+    return _build_client(ChatOpenAI, **config_kwargs, **kwargs)
 
 
 def get_ollama_llm(
@@ -133,7 +232,8 @@ def get_ollama_llm(
     Returns:
         Configured ChatOllama instance
     """
-    return ChatOllama(
+    return _build_client(
+        ChatOllama,
         model=model,
         temperature=temperature,
         base_url=base_url,
@@ -153,13 +253,104 @@ def get_llm(
     Returns:
         Configured LLM client
     """
-    if provider == "anthropic":
-        return get_anthropic_llm(**kwargs)
-    if provider == "openrouter":
-        return get_openrouter_llm(**kwargs)
-    if provider == "ollama":
-        return get_ollama_llm(**kwargs)
-    return get_openai_llm(**kwargs)
+    return _PROVIDERS.get(provider, get_openai_llm)(**kwargs)
+
+
+# Provider dispatch table; unknown providers fall back to OpenAI
+_PROVIDERS: dict[str, Callable[..., Any]] = {
+    "openai": get_openai_llm,
+    "anthropic": get_anthropic_llm,
+    "openrouter": get_openrouter_llm,
+    "ollama": get_ollama_llm,
+}
+
+
+# Rough characters-per-token ratio for models tiktoken has no encoding for
+_CHARS_PER_TOKEN = 4
+
+
+@functools.lru_cache(maxsize=32)
+def _encoder(model: str) -> Any | None:
+    """Return the tiktoken encoding for ``model``, or None if unavailable.
+
+    Models tiktoken does not know (Anthropic, Ollama, OpenRouter routes) and
+    environments where the encoding files cannot be loaded return None, and
+    token counts fall back to a character estimate.
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        return None
+
+
+def _message_text(message: Any) -> str:
+    """Return the text content of a LangChain message or plain string."""
+    content = getattr(message, "content", message)
+    return content if isinstance(content, str) else str(content)
+
+
+def _count_text(model: str, text: str) -> int:
+    """Count (or estimate) the tokens in ``text`` for ``model``."""
+    encoder = _encoder(model)
+    if encoder is None:
+        return -(-len(text) // _CHARS_PER_TOKEN)
+    return len(encoder.encode(text))
+
+
+def count_tokens(model: str, messages: list[Any]) -> int:
+    """Count the prompt tokens of ``messages`` before sending them.
+
+    Exact for OpenAI models with a tiktoken encoding, an estimate otherwise.
+
+    Args:
+        model: Model name
+        messages: LangChain messages (or plain strings)
+
+    Returns:
+        Number of content tokens across all messages
+    """
+    return sum(_count_text(model, _message_text(m)) for m in messages)
+
+
+def truncate_messages(model: str, messages: list[Any], budget: int) -> list[Any]:
+    """Trim the largest message so the prompt fits within ``budget`` tokens.
+
+    The largest message is almost always the bulk input (search results,
+    findings) rather than the instructions, so it is cut from the end.
+
+    Args:
+        model: Model name
+        messages: LangChain messages (or plain strings)
+        budget: Maximum prompt tokens
+
+    Returns:
+        ``messages`` unchanged if it fits, otherwise a copy with the largest
+        message's content shortened
+    """
+    counts = [_count_text(model, _message_text(m)) for m in messages]
+    excess = sum(counts) - budget
+    if excess <= 0:
+        return messages
+
+    index = max(range(len(messages)), key=counts.__getitem__)
+    keep = max(0, counts[index] - excess)
+    text = _message_text(messages[index])
+    encoder = _encoder(model)
+    if encoder is None:
+        text = text[: keep * _CHARS_PER_TOKEN]
+    else:
+        text = encoder.decode(encoder.encode(text)[:keep])
+
+    message = messages[index]
+    trimmed = list(messages)
+    trimmed[index] = (
+        message.model_copy(update={"content": text})
+        if hasattr(message, "model_copy")
+        else text
+    )
+    return trimmed
 
 
 class ResilientLLMWrapper:
@@ -177,6 +368,7 @@ class ResilientLLMWrapper:
         retry_config: RetryConfig | None = None,
         circuit_config: CircuitBreakerConfig | None = None,
         correlation_id: str | None = None,
+        use_tenacity: bool = False,
     ):
         """Initialize resilient LLM wrapper.
 
@@ -185,10 +377,22 @@ class ResilientLLMWrapper:
             retry_config: Retry configuration
             circuit_config: Circuit breaker configuration
             correlation_id: Optional correlation ID for logging
+            use_tenacity: Retry through tenacity instead of the built-in loop
         """
         self._llm = llm
         self._retry_config = retry_config or RETRY_CONFIG_DEFAULT
         self._correlation_id = correlation_id
+        self._use_async = hasattr(llm, "ainvoke")
+        self._retry_decorator = (
+            self._build_retry(
+                self._retry_config.max_attempts,
+                self._retry_config.base_delay,
+                self._retry_config.max_delay,
+                self._retry_config.exponential_base,
+            )
+            if use_tenacity
+            else None
+        )
 
         # Get or create circuit breaker for this LLM
         llm_name = getattr(llm, "model", "unknown")
@@ -207,30 +411,117 @@ class ResilientLLMWrapper:
         """Access the underlying LLM client."""
         return self._llm
 
-    def _get_retry_decorator(self) -> Callable:
-        """Create retry decorator with configuration."""
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_retry(
+        cls,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        exponential_base: float,
+    ) -> Callable:
+        """Create retry decorator, cached per retry configuration.
+
+        Tenacity copies its retry state on every decorated call, so a single
+        decorator is safe to share across wrappers and concurrent calls.
+        """
         return retry(
-            stop=stop_after_attempt(self._retry_config.max_attempts),
+            stop=stop_after_attempt(max_attempts),
+            retry=retry_if_exception(is_retryable_error),
             wait=wait_exponential(
-                multiplier=self._retry_config.exponential_base,
-                min=self._retry_config.base_delay,
-                max=self._retry_config.max_delay,
+                multiplier=exponential_base,
+                min=base_delay,
+                max=max_delay,
             ),
             before_sleep=before_sleep_log(logger, logging.WARNING),
             after=after_log(logger, logging.INFO),
             reraise=True,
         )
 
+    def _circuit_open_error(self) -> CircuitOpenError:
+        """Build the error raised when the circuit blocks a call.
+
+        Timestamps are only converted for display here, on the rejected path.
+        """
+        state, last_failure = self._circuit.snapshot()
+        return CircuitOpenError(
+            "Circuit breaker is %s for LLM calls. Last failure: %s"
+            % (state.value, _fmt_mono(last_failure))
+        )
+
+    async def _retry_call(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``fn``, retrying retryable errors with exponential backoff.
+
+        A plain loop keeps the first-try success path free of tenacity's
+        per-call state objects and logging hooks.
+        """
+        config = self._retry_config
+        attempt = 1
+        while True:
+            try:
+                return await fn()
+            except Exception as e:
+                if attempt >= config.max_attempts or not config.is_retryable(e):
+                    raise
+                delay = config.get_delay(attempt)
+                logger.warning(
+                    "LLM call failed (attempt %d/%d), retrying in %.2fs: %s",
+                    attempt,
+                    config.max_attempts,
+                    delay,
+                    e,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _retry_call_sync(self, fn: Callable[[], Any]) -> Any:
+        """Blocking counterpart of :meth:`_retry_call`."""
+        config = self._retry_config
+        attempt = 1
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                if attempt >= config.max_attempts or not config.is_retryable(e):
+                    raise
+                delay = config.get_delay(attempt)
+                logger.warning(
+                    "LLM sync call failed (attempt %d/%d), retrying in %.2fs: %s",
+                    attempt,
+                    config.max_attempts,
+                    delay,
+                    e,
+                )
+                time.sleep(delay)
+                attempt += 1
+
+    def _bind_correlation_id(self, correlation_id: str | None) -> Token | None:
+        """Set the correlation ID for the current context.
+
+        An explicit ``correlation_id`` wins, then one already set by the caller's
+        context, then the wrapper's default.
+
+        Returns:
+            Token to reset the context variable, or None if nothing was set
+        """
+        cid = correlation_id
+        if cid is None and correlation_id_var.get() is None:
+            cid = self._correlation_id
+        return correlation_id_var.set(cid) if cid is not None else None
+
     async def ainvoke(
         self,
         messages: Any,
         correlation_id: str | None = None,
+        tools: list[Any] | None = None,
     ) -> Any:
         """Invoke LLM with retry and circuit breaker protection.
 
         Args:
             messages: Messages to send to LLM
             correlation_id: Optional correlation ID for tracing
+            tools: Tools to bind for this call (client must support
+                ``bind_tools``)
 
         Returns:
             LLM response
@@ -239,41 +530,71 @@ class ResilientLLMWrapper:
             CircuitOpenError: If circuit breaker is open
             Exception: After all retries exhausted
         """
-        cid = correlation_id or self._correlation_id
+        token = self._bind_correlation_id(correlation_id)
+        try:
+            return await self._ainvoke_with_retry(messages, tools)
+        finally:
+            if token is not None:
+                correlation_id_var.reset(token)
 
-        async def _do_invoke() -> Any:
-            return await self._llm.ainvoke(messages)
+    async def _ainvoke_with_retry(
+        self,
+        messages: Any,
+        tools: list[Any] | None = None,
+    ) -> Any:
+        """Async invoke with retry logic."""
 
-        # Check circuit breaker
-        if not self._circuit.allow_request():
-            raise CircuitOpenError(
-                f"Circuit breaker is open for LLM calls. "
-                f"Last failure: {self._circuit.stats.last_failure_time}"
-            )
+        circuit = self._circuit
+        llm = self._llm.bind_tools(tools) if tools else self._llm
+
+        async def _do_invoke() -> Any:
+            # Checked per attempt: an earlier attempt may have tripped the circuit
+            if circuit.state is CircuitState.OPEN:
+                raise self._circuit_open_error()
+            try:
+                result = await llm.ainvoke(messages)
+            except Exception:
+                circuit.record_failure()
+                raise
+            circuit.record_success()
+            return result
 
-        # Apply retry decorator
-        retry_decorator = self._get_retry_decorator()
+        # Admit the call once; each attempt re-checks the state in _do_invoke
+        slot = circuit.acquire()
+        if slot is None:
+            raise self._circuit_open_error()
 
         try:
-            result = await retry_decorator(_do_invoke)()
-            logger.info(
-                f"LLM invocation successful (correlation_id={cid})",
-                extra={"correlation_id": cid},
-            )
+            if self._retry_decorator is not None:
+                result = await self._retry_decorator(_do_invoke)()
+            else:
+                result = await self._retry_call(_do_invoke)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "LLM invocation successful (correlation_id=%s)",
+                    correlation_id_var.get(),
+                )
             return result
         except Exception as e:
             logger.error(
-                f"LLM invocation failed after retries (correlation_id={cid}): {e}",
-                extra={"correlation_id": cid},
+                "LLM invocation failed after retries (correlation_id=%s): %s",
+                correlation_id_var.get(),
+                e,
             )
             raise
+        finally:
+            slot.release()
 
     async def invoke(
         self,
         messages: Any,
         correlation_id: str | None = None,
     ) -> Any:
-        """Synchronous invoke with retry and circuit breaker protection.
+        """Invoke with retry and circuit breaker protection from async code.
+
+        Routes through the client's native ``ainvoke`` when available so no
+        thread-pool hop is needed; otherwise runs the blocking invoke in a
+        worker thread.
 
         Args:
             messages: Messages to send to LLM
@@ -282,45 +603,76 @@ class ResilientLLMWrapper:
         Returns:
             LLM response
         """
-        # Use asyncio to run sync invoke in thread pool
+        if self._use_async:
+            return await self.ainvoke(messages, correlation_id)
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self._sync_invoke_with_retry(messages, correlation_id),
-        )
+        token = self._bind_correlation_id(correlation_id)
+        try:
+            # to_thread copies the current context, correlation ID included
+            return await asyncio.to_thread(self._sync_invoke_with_retry, messages)
+        finally:
+            if token is not None:
+                correlation_id_var.reset(token)
 
-    def _sync_invoke_with_retry(
+    def invoke_sync(
         self,
         messages: Any,
         correlation_id: str | None = None,
     ) -> Any:
-        """Synchronous invoke with retry logic."""
-        cid = correlation_id or self._correlation_id
+        """Blocking invoke with retry and circuit breaker protection.
 
-        if not self._circuit.allow_request():
-            raise CircuitOpenError(
-                f"Circuit breaker is open for LLM calls. "
-                f"Last failure: {self._circuit.stats.last_failure_time}"
-            )
+        Args:
+            messages: Messages to send to LLM
+            correlation_id: Optional correlation ID for tracing
+
+        Returns:
+            LLM response
+        """
+        token = self._bind_correlation_id(correlation_id)
+        try:
+            return self._sync_invoke_with_retry(messages)
+        finally:
+            if token is not None:
+                correlation_id_var.reset(token)
+
+    def _sync_invoke_with_retry(self, messages: Any) -> Any:
+        """Synchronous invoke with retry logic."""
+        circuit = self._circuit
+        slot = circuit.acquire()
+        if slot is None:
+            raise self._circuit_open_error()
 
-        @self._get_retry_decorator()
         def _do_invoke() -> Any:
-            return self._llm.invoke(messages)
+            if circuit.state is CircuitState.OPEN:
+                raise self._circuit_open_error()
+            try:
+                result = self._llm.invoke(messages)
+            except Exception:
+                circuit.record_failure()
+                raise
+            circuit.record_success()
+            return result
 
         try:
-            result = _do_invoke()
-            logger.info(
-                f"LLM sync invocation successful (correlation_id={cid})",
-                extra={"correlation_id": cid},
-            )
+            if self._retry_decorator is not None:
+                result = self._retry_decorator(_do_invoke)()
+            else:
+                result = self._retry_call_sync(_do_invoke)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "LLM sync invocation successful (correlation_id=%s)",
+                    correlation_id_var.get(),
+                )
             return result
         except Exception as e:
             logger.error(
-                f"LLM sync invocation failed (correlation_id={cid}): {e}",
-                extra={"correlation_id": cid},
+                "LLM sync invocation failed (correlation_id=%s): %s",
+                correlation_id_var.get(),
+                e,
             )
             raise
+        finally:
+            slot.release()
 
 
 def get_resilient_llm(
@@ -331,6 +683,10 @@ def get_resilient_llm(
 ) -> ResilientLLMWrapper:
     """Factory function to get resilient LLM client.
 
+    Wrappers are cached per (provider, retry config, circuit config,
+    kwargs), so call sites asking for the same client share one wrapper.
+    Configurations with unhashable values are built fresh every time.
+
     Args:
         provider: LLM provider ("openai", "anthropic", "openrouter", or "ollama")
         retry_config: Custom retry configuration
@@ -340,9 +696,29 @@ def get_resilient_llm(
     Returns:
         ResilientLLMWrapper instance
     """
-    llm = get_llm(provider, **kwargs)
+    retry_key = astuple(retry_config) if retry_config is not None else None
+    config = tuple(sorted(kwargs.items()))
+    try:
+        hash((retry_key, circuit_config, config))
+    except TypeError:
+        return ResilientLLMWrapper(
+            llm=get_llm(provider, **kwargs),
+            retry_config=retry_config,
+            circuit_config=circuit_config,
+        )
+    return _cached_wrapper(provider, retry_key, circuit_config, config)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_wrapper(
+    provider: str,
+    retry_key: tuple[Any, ...] | None,
+    circuit_config: CircuitBreakerConfig | None,
+    config: tuple[tuple[str, Any], ...],
+) -> ResilientLLMWrapper:
+    """Build a resilient wrapper once per normalized configuration."""
     return ResilientLLMWrapper(
-        llm=llm,
-        retry_config=retry_config,
+        llm=get_llm(provider, **dict(config)),
+        retry_config=RetryConfig(*retry_key) if retry_key is not None else None,
         circuit_config=circuit_config,
     )
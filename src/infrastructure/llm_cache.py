@@ -0,0 +1,163 @@
+"""Response cache for LLM calls.
+
+Caches the text content of LLM responses keyed on a SHA-256 hash of the
+model, messages and tools, so repeated agent calls on identical inputs
+(tests, dev iteration, re-runs of the same topic) skip the provider.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Storage for cached LLM responses."""
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached value for ``key``, or None if absent/expired."""
+        ...
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        ...
+
+
+class InMemoryCacheBackend:
+    """Process-local LRU cache with per-entry expiry."""
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize in-memory backend.
+
+        Args:
+            maxsize: Maximum number of entries before evicting the oldest
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        """Return a live entry and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """Store an entry, evicting the least recently used if full."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+class RedisCacheBackend:
+    """Cache backend shared across processes through Redis.
+
+    Requires the optional ``redis`` package.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        key_prefix: str = "veritas:llm:",
+        client: Any = None,
+    ):
+        """Initialize Redis backend.
+
+        Args:
+            url: Redis connection URL (ignored if client is given)
+            key_prefix: Prefix for cache keys
+            client: Optional pre-configured ``redis.asyncio.Redis`` client
+        """
+        if client is None:
+            try:
+                from redis import asyncio as redis_asyncio
+            except ImportError as e:
+                raise ImportError(
+                    "The redis package is required for RedisCacheBackend"
+                ) from e
+            client = redis_asyncio.from_url(url, decode_responses=True)
+        self._client = client
+        self._key_prefix = key_prefix
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached value for ``key``."""
+        return await self._client.get(f"{self._key_prefix}{key}")
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """Store ``value`` with an expiry."""
+        await self._client.set(f"{self._key_prefix}{key}", value, ex=ttl)
+
+
+class LLMCache:
+    """Cache of LLM response content over a pluggable backend.
+
+    Backend errors are logged and treated as misses so a cache outage never
+    fails an LLM call.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, ttl: int = 3600):
+        """Initialize LLM cache.
+
+        Args:
+            backend: Storage backend (defaults to an in-memory LRU)
+            ttl: Seconds to keep each cached response
+        """
+        self._backend = backend or InMemoryCacheBackend()
+        self._ttl = ttl
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: list[Any],
+        tools: list[str] | None = None,
+        provider: str = "",
+    ) -> str:
+        """Build a cache key from the provider, model, messages and tool names.
+
+        Args:
+            model: Model identifier
+            messages: LangChain messages (or plain strings)
+            tools: Names of tools bound to the call
+            provider: LLM provider, so providers serving the same model name
+                do not share entries
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        payload = {
+            "provider": provider,
+            "model": model,
+            "messages": [
+                [getattr(m, "type", "text"), getattr(m, "content", m)]
+                for m in messages
+            ],
+            "tools": sorted(tools or []),
+        }
+        raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.sha256(raw).hexdigest()
+
+    async def get(self, key: str) -> str | None:
+        """Return cached response content, or None on miss or backend error."""
+        try:
+            return await self._backend.get(key)
+        except Exception as e:
+            logger.warning("LLM cache read failed: %s", e)
+            return None
+
+    async def set(self, key: str, value: str) -> None:
+        """Store response content; backend errors are logged and ignored."""
+        try:
+            await self._backend.set(key, value, self._ttl)
+        except Exception as e:
+            logger.warning("LLM cache write failed: %s", e)
@@ -1,12 +1,128 @@
 """Logging configuration for Veritas."""
 
+import atexit
+import functools
+import logging
+import queue
 import sys
+import threading
+from contextvars import ContextVar
 from pathlib import Path
 
 from loguru import logger
 
 from src.config import settings
 
+# Correlation ID of the request/workflow running in the current context.
+# Set once at the entry point; propagates across awaits, tasks and to_thread.
+correlation_id_var: ContextVar[str | None] = ContextVar("correlation_id", default=None)
+
+
+class CorrelationIdFilter(logging.Filter):
+    """Inject the current correlation ID into stdlib log records."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = correlation_id_var.get()
+        return True
+
+
+class BatchedFileSink:
+    """Loguru sink that writes records to a file in batches off-thread.
+
+    Records go into a bounded queue; a daemon thread drains it and writes up
+    to ``batch_size`` records per ``write`` call, at least every
+    ``flush_interval`` seconds. When the queue is full, new records are
+    dropped and counted instead of growing memory without bound. The file is
+    rotated once it exceeds ``max_bytes``, keeping ``backup_count`` old files.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 0.1,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 7,
+    ):
+        """Initialize the sink and start its writer thread.
+
+        Args:
+            path: Log file path
+            max_queue: Maximum buffered records before dropping
+            batch_size: Maximum records per write
+            flush_interval: Maximum seconds a record waits before being written
+            max_bytes: File size that triggers rotation
+            backup_count: Number of rotated files to keep
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.dropped = 0
+        self._queue: queue.Queue[str | None] = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(
+            target=self._run, name="veritas-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __call__(self, message: str) -> None:
+        """Enqueue a formatted record without blocking the caller."""
+        try:
+            self._queue.put_nowait(str(message))
+        except queue.Full:
+            self.dropped += 1
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Flush buffered records and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        """Drain the queue in batches until stopped."""
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch: list[str] = []
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            else:
+                stopping = True
+            if batch:
+                self._write("".join(batch))
+
+    def _write(self, data: str) -> None:
+        """Append data to the log file, rotating first if it is too large."""
+        try:
+            if self.path.exists() and self.path.stat().st_size >= self.max_bytes:
+                self._rotate()
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(data)
+        except OSError as e:
+            print(f"Failed to write logs to {self.path}: {e}", file=sys.stderr)
+
+    def _rotate(self) -> None:
+        """Shift ``path`` to ``path.1``, ``path.1`` to ``path.2``, and so on."""
+        for i in range(self.backup_count - 1, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{i}")
+            if src.exists():
+                src.replace(self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backup_count > 0:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
 
 def setup_logging():
     """Configure logging based on environment.
@@ -22,13 +138,13 @@ def setup_logging():
         log_path = Path("logs/veritas.log")
         log_path.parent.mkdir(exist_ok=True)
 
+        # Bounded, batched writer instead of enqueue=True's unbounded queue
+        sink = BatchedFileSink(log_path)
+        atexit.register(sink.stop)
         logger.add(
-            str(log_path),
-            rotation="10 MB",
-            retention="7 days",
+            sink,
             level="INFO",
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
-            enqueue=True,  # Non-blocking for production
         )
     else:
         # Development: Simple stdout with colors for visibility
@@ -40,9 +156,13 @@ def setup_logging():
         )
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str):
     """Get a logger instance with the given name.
 
+    Bound loggers are memoized per name; loguru applies handler changes to
+    existing bound loggers, so cached instances stay valid after setup.
+
     Args:
         name: Logger name (usually __name__)
 
@@ -62,4 +182,5 @@ def log_stage(stage: str, message: str, logger_instance=None):
         logger_instance: Optional logger instance
     """
     logger_obj = logger_instance or logger
-    logger_obj.info(f"[{stage}] {message}")
+    # Positional args defer formatting until a sink actually emits the record
+    logger_obj.info("[{}] {}", stage, message)
@@ -1,20 +1,18 @@
 """Web search and tool infrastructure using Tavily SDK."""
 
+import functools
 import logging
 from typing import Any
 
-from tavily import TavilyClient
+from tavily import AsyncTavilyClient, TavilyClient
 
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-def get_tavily_client() -> TavilyClient:
-    """Create a Tavily client.
-
-    Returns:
-        Configured TavilyClient instance
+def _require_api_key() -> str:
+    """Return the configured Tavily API key.
 
     Raises:
         ValueError: If API key is not configured
@@ -25,10 +23,86 @@ def get_tavily_client() -> TavilyClient:
         raise ValueError(
             "TAVILY_API_KEY environment variable is required for web search"
         )
+    return api_key
 
+
+@functools.lru_cache(maxsize=4)
+def _cached_tavily_client(api_key: str) -> TavilyClient:
+    """Construct one Tavily client per API key."""
     return TavilyClient(api_key=api_key)
 
 
+# One async client per API key. Each owns an httpx.AsyncClient whose
+# connections belong to the event loop that opened them, so async searches are
+# expected to run on one loop (the API server's); see aclose_tavily_clients.
+_async_tavily_clients: dict[str, AsyncTavilyClient] = {}
+
+
+def get_tavily_client() -> TavilyClient:
+    """Get the shared Tavily client.
+
+    Returns:
+        Configured TavilyClient instance
+
+    Raises:
+        ValueError: If API key is not configured
+    """
+    return _cached_tavily_client(_require_api_key())
+
+
+def get_async_tavily_client() -> AsyncTavilyClient:
+    """Get the shared async Tavily client.
+
+    Returns:
+        Configured AsyncTavilyClient instance
+
+    Raises:
+        ValueError: If API key is not configured
+    """
+    api_key = _require_api_key()
+    client = _async_tavily_clients.get(api_key)
+    if client is None:
+        # Reusing the client keeps TCP/TLS connections to Tavily alive
+        client = _async_tavily_clients[api_key] = AsyncTavilyClient(api_key=api_key)
+    return client
+
+
+async def aclose_tavily_clients() -> None:
+    """Close the shared async Tavily clients.
+
+    Await this on the event loop that ran the searches, before it stops; the
+    API lifespan does so on shutdown. Later lookups create fresh clients.
+    """
+    clients = list(_async_tavily_clients.values())
+    _async_tavily_clients.clear()
+    for client in clients:
+        await client.close()
+
+
+def _clean_query(query: str) -> str:
+    """Strip ReAct framing and truncate to Tavily's 400 character limit."""
+    clean_query = query
+    if "Action Input:" in query:
+        clean_query = query.split("Action Input:")[-1].strip()
+    return clean_query[:400]
+
+
+def _format_results(response: dict[str, Any]) -> str:
+    """Format a Tavily search response for the LLM."""
+    results = response.get("results", [])
+    if not results:
+        return "No results found."
+
+    formatted = []
+    for r in results:
+        formatted.append(f"Title: {r.get('title', 'N/A')}")
+        formatted.append(f"URL: {r.get('url', 'N/A')}")
+        formatted.append(f"Content: {r.get('content', 'N/A')[:300]}...")
+        formatted.append("---")
+
+    return "\n".join(formatted)
+
+
 def get_web_search_tool(max_results: int = 5) -> Any:
     """Create a web search tool using Tavily.
 
@@ -55,29 +129,48 @@ def get_web_search_tool(max_results: int = 5) -> Any:
         Returns:
             Search results as formatted string
         """
-        # Clean up query from ReAct format
-        clean_query = query
-        if "Action Input:" in query:
-            clean_query = query.split("Action Input:")[-1].strip()
+        try:
+            response = client.search(query=_clean_query(query), max_results=max_results)
+            return _format_results(response)
+        except Exception as e:
+            logger.error(f"Tavily search failed: {e}")
+            return f"Search failed: {str(e)}"
+
+    return search
+
+
+def get_async_web_search_tool(max_results: int = 5) -> Any:
+    """Create an async web search function using the shared Tavily client.
+
+    Unlike :func:`get_web_search_tool`, searches do not block the event loop,
+    so concurrent agents keep making progress while a search is in flight.
+
+    Args:
+        max_results: Maximum number of search results to return
 
-        # Truncate to Tavily's 400 character limit
-        clean_query = clean_query[:400]
+    Returns:
+        An async search function, or None if Tavily is not configured
+    """
+    try:
+        client = get_async_tavily_client()
+    except ValueError:
+        logger.error("Failed to create Tavily client - API key not configured")
+        return None
 
+    async def search(query: str) -> str:
+        """Search the web for information.
+
+        Args:
+            query: The search query
+
+        Returns:
+            Search results as formatted string
+        """
         try:
-            response = client.search(query=clean_query, max_results=max_results)
-            # Format the response nicely
-            results = response.get("results", [])
-            if not results:
-                return "No results found."
-
-            formatted = []
-            for r in results:
-                formatted.append(f"Title: {r.get('title', 'N/A')}")
-                formatted.append(f"URL: {r.get('url', 'N/A')}")
-                formatted.append(f"Content: {r.get('content', 'N/A')[:300]}...")
-                formatted.append("---")
-
-            return "\n".join(formatted)
+            response = await client.search(
+                query=_clean_query(query), max_results=max_results
+            )
+            return _format_results(response)
         except Exception as e:
             logger.error(f"Tavily search failed: {e}")
             return f"Search failed: {str(e)}"
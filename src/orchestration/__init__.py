@@ -1,9 +1,22 @@
 """Orchestration module for Veritas."""
 
-from .workflow import ResearchWorkflow, WorkflowResult, WorkflowStage
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .workflow import ResearchWorkflow, WorkflowResult, WorkflowStage
 
 __all__ = [
     "ResearchWorkflow",
     "WorkflowResult",
     "WorkflowStage",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import workflow names on first access (PEP 562)."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".workflow", __name__), name)
+    globals()[name] = value
+    return value
@@ -1,15 +1,15 @@
 """Orchestration layer for multi-agent workflows."""
 
-from dataclasses import dataclass
+import asyncio
+import hashlib
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, fields
+from datetime import datetime
 from enum import Enum
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import orjson
 
-from ..agents import (
-    CriticAgent,
-    FactCheckerAgent,
-    ResearcherAgent,
-    SynthesizerAgent,
-    WriterAgent,
-)
 from ..domain.events import (
     FactCheckCompleted,
     ReportReviewed,
@@ -18,10 +18,59 @@ from ..domain.events import (
     SynthesisCompleted,
 )
 from ..domain.interfaces import AgentContext
-from ..infrastructure.logging import get_logger, log_stage
+from ..infrastructure.llm_cache import CacheBackend, LLMCache
+from ..infrastructure.logging import correlation_id_var, get_logger, log_stage
+
+if TYPE_CHECKING:
+    from ..agents import (
+        CriticAgent,
+        FactCheckerAgent,
+        ResearcherAgent,
+        SynthesizerAgent,
+        WriterAgent,
+    )
+
+__all__ = ["ResearchWorkflow", "WorkflowResult", "WorkflowStage"]
 
 logger = get_logger(__name__)
 
+# Agents (and the LLM/search clients behind them) are imported on first use
+_AGENT_NAMES = (
+    "CriticAgent",
+    "FactCheckerAgent",
+    "ResearcherAgent",
+    "SynthesizerAgent",
+    "WriterAgent",
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve agent classes lazily (PEP 562)."""
+    if name not in _AGENT_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from .. import agents
+
+    value = getattr(agents, name)
+    globals()[name] = value
+    return value
+
+
+# Workflow attribute -> agent class, instantiated lazily by ResearchWorkflow
+_AGENT_ATTRS = {
+    "researcher": "ResearcherAgent",
+    "fact_checker": "FactCheckerAgent",
+    "synthesizer": "SynthesizerAgent",
+    "writer": "WriterAgent",
+    "critic": "CriticAgent",
+}
+
+
+def _load_agents() -> None:
+    """Bind any agent classes not yet imported (or patched) into module scope."""
+    for name in _AGENT_NAMES:
+        if name not in globals():
+            __getattr__(name)
+
 
 class WorkflowStage(Enum):
     """Workflow execution stages."""
@@ -35,7 +84,7 @@ class WorkflowStage(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowResult:
     """Result of a workflow execution."""
 
@@ -48,6 +97,43 @@ class WorkflowResult:
     error: str | None = None
     iterations: int = 0
 
+    def to_json(self) -> str:
+        """Serialize the result to a JSON string.
+
+        Returns:
+            JSON document that ``from_json`` can restore
+        """
+        return orjson.dumps(self, default=str).decode()
+
+    @classmethod
+    def from_json(cls, raw: str) -> "WorkflowResult":
+        """Restore a result serialized with ``to_json``.
+
+        Args:
+            raw: JSON document produced by ``to_json``
+
+        Returns:
+            Reconstructed WorkflowResult
+        """
+        data = orjson.loads(raw)
+        data["status"] = WorkflowStage(data["status"])
+        for name, event_cls in _RESULT_EVENTS.items():
+            event = data.get(name)
+            if event is not None:
+                event["timestamp"] = datetime.fromisoformat(event["timestamp"])
+                data[name] = event_cls(**event)
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+_RESULT_EVENTS = {
+    "research": ResearchCompleted,
+    "fact_check": FactCheckCompleted,
+    "synthesis": SynthesisCompleted,
+    "report": ReportWritten,
+    "review": ReportReviewed,
+}
+
 
 class ResearchWorkflow:
     """Orchestrates the multi-agent research workflow.
@@ -56,6 +142,19 @@ class ResearchWorkflow:
     Supports iterative workflows where Critic feedback triggers revision.
     """
 
+    # Agents keyed by class and constructor arguments, shared by every
+    # workflow in the process; they hold no per-run state. Least recently
+    # used agents are evicted so per-workflow caches in the key are not
+    # kept alive forever.
+    _agent_cache: ClassVar[OrderedDict[tuple, Any]] = OrderedDict()
+    _agent_cache_size: ClassVar[int] = 64
+
+    researcher: "ResearcherAgent"
+    fact_checker: "FactCheckerAgent"
+    synthesizer: "SynthesizerAgent"
+    writer: "WriterAgent"
+    critic: "CriticAgent"
+
     def __init__(
         self,
         max_iterations: int = 3,
@@ -63,6 +162,13 @@ class ResearchWorkflow:
         llm_provider: str = "openai",
         llm_model: str = "gpt-4o",
         max_tokens: int | None = None,
+        max_prompt_tokens: int | None = None,
+        fact_check_batch_size: int = 5,
+        max_concurrency: int = 4,
+        cache: LLMCache | None = None,
+        speculative_revision: bool = False,
+        result_cache: CacheBackend | None = None,
+        result_cache_ttl: int = 86400,
     ):
         """Initialize workflow with agents.
 
@@ -72,40 +178,274 @@ class ResearchWorkflow:
             llm_provider: LLM provider to use ("openai" or "anthropic")
             llm_model: Model name to use (e.g., "gpt-4o", "claude-sonnet-4-20250514")
             max_tokens: Maximum tokens per LLM call (None = unlimited)
+            max_prompt_tokens: Prompt token budget per LLM call; larger
+                prompts are truncated before sending (None = unlimited)
+            fact_check_batch_size: Findings verified per fact-check call
+            max_concurrency: Maximum fact-check calls in flight at once
+            cache: Optional LLM response cache shared by all agents
+            speculative_revision: Start the next rewrite while the critic
+                reviews, trading wasted calls on approval and the critic's
+                feedback for latency
+            result_cache: Optional backend storing completed runs, so a
+                repeated topic with the same settings skips every stage
+            result_cache_ttl: Seconds to keep each cached run
         """
         self.max_iterations = max_iterations
         self.auto_approve_threshold = auto_approve_threshold
         self.llm_provider = llm_provider
         self.llm_model = llm_model
         self.max_tokens = max_tokens
+        self.max_prompt_tokens = max_prompt_tokens
+        self.fact_check_batch_size = max(1, fact_check_batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache = cache
+        self.speculative_revision = speculative_revision
+        self.result_cache = result_cache
+        self.result_cache_ttl = result_cache_ttl
+
+        _load_agents()
+        # Agents are built on first access; the classes are bound now so a
+        # workflow keeps whatever agent classes were in scope at construction
+        self._agent_classes = {
+            attr: globals()[class_name] for attr, class_name in _AGENT_ATTRS.items()
+        }
+        self._agent_kwargs = {
+            "provider": llm_provider,
+            "model": llm_model,
+            "max_tokens": max_tokens,
+            "cache": cache,
+            "max_prompt_tokens": max_prompt_tokens,
+        }
+
+    @classmethod
+    def clear_agent_cache(cls) -> None:
+        """Drop the agents shared across workflows."""
+        cls._agent_cache.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolve an agent the first time it is accessed.
+
+        Workflows with the same provider, model and agent settings share
+        one instance of each agent.
 
-        # Initialize agents with specified LLM provider/model
-        self.researcher = ResearcherAgent(
-            provider=llm_provider,
-            model=llm_model,
-            max_tokens=max_tokens,
-        )
-        self.fact_checker = FactCheckerAgent(
-            provider=llm_provider,
-            model=llm_model,
-            max_tokens=max_tokens,
-        )
-        self.synthesizer = SynthesizerAgent(
-            provider=llm_provider,
-            model=llm_model,
-            max_tokens=max_tokens,
+        Args:
+            name: Attribute name, e.g. "researcher"
+
+        Returns:
+            The agent, cached on the instance for later lookups
+        """
+        agent_classes = self.__dict__.get("_agent_classes")
+        if agent_classes is None or name not in agent_classes:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        agent_cls = agent_classes[name]
+        key = (agent_cls, *self._agent_kwargs.items())
+        cache = self._agent_cache
+        agent = cache.get(key)
+        if agent is None:
+            agent = agent_cls(**self._agent_kwargs)
+            cache[key] = agent
+            while len(cache) > self._agent_cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        setattr(self, name, agent)
+        return agent
+
+    def _result_key(self, topic: str) -> str:
+        """Build the cache key identifying a run of ``topic``.
+
+        Args:
+            topic: Research topic
+
+        Returns:
+            Hex SHA-256 digest of the topic and outcome-affecting settings
+        """
+        raw = (
+            f"{topic}|{self.llm_provider}|{self.llm_model}|"
+            f"{self.max_iterations}|{self.auto_approve_threshold}"
         )
-        self.writer = WriterAgent(
-            provider=llm_provider,
-            model=llm_model,
-            max_tokens=max_tokens,
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    async def _cached_result(self, key: str) -> WorkflowResult | None:
+        """Return a cached run, or None on miss or backend error."""
+        try:
+            raw = await self.result_cache.get(key)
+            return WorkflowResult.from_json(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning(f"Workflow cache read failed: {e}")
+            return None
+
+    async def _store_result(self, key: str, result: WorkflowResult) -> None:
+        """Cache a completed run; backend errors are logged and ignored."""
+        try:
+            await self.result_cache.set(key, result.to_json(), self.result_cache_ttl)
+        except Exception as e:
+            logger.warning(f"Workflow cache write failed: {e}")
+
+    async def _fact_check(
+        self,
+        research: ResearchCompleted,
+        context: AgentContext,
+    ) -> FactCheckCompleted:
+        """Verify findings in concurrent batches and merge the results.
+
+        Findings are split into batches of ``fact_check_batch_size``, with at
+        most ``max_concurrency`` batches in flight, so wall-clock time tracks
+        the slowest batch rather than the sum of all of them. If a batch
+        fails, the batches still running are cancelled and its error is raised.
+
+        Args:
+            research: Research output whose findings are verified
+            context: Agent context with correlation ID
+
+        Returns:
+            FactCheckCompleted event covering every finding, in order
+        """
+        findings = research.findings
+        size = self.fact_check_batch_size
+        if len(findings) <= size:
+            return await self.fact_checker.verify_claims(
+                claims=findings,
+                sources=research.sources,
+                context=context,
+            )
+
+        # Created per run: a semaphore binds to the event loop it first waits on
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def verify(batch: list[str]) -> FactCheckCompleted:
+            async with semaphore:
+                return await self.fact_checker.verify_claims(
+                    claims=batch,
+                    sources=research.sources,
+                    context=context,
+                )
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(verify(findings[i : i + size]))
+                    for i in range(0, len(findings), size)
+                ]
+        except ExceptionGroup as eg:
+            # Surface the batch's own error, as the single-call path does
+            raise eg.exceptions[0] from eg
+        parts = [task.result() for task in tasks]
+
+        claims: list[dict] = []
+        verified_claims: list[dict] = []
+        confidence_scores: dict[str, float] = {}
+        for part in parts:
+            claims.extend(part.claims)
+            verified_claims.extend(part.verified_claims)
+            confidence_scores.update(part.confidence_scores)
+
+        return FactCheckCompleted.create(
+            claims=claims,
+            verified_claims=verified_claims,
+            confidence_scores=confidence_scores,
+            correlation_id=context.correlation_id,
         )
-        self.critic = CriticAgent(
-            provider=llm_provider,
-            model=llm_model,
-            max_tokens=max_tokens,
+
+    async def _revise(
+        self,
+        result: WorkflowResult,
+        context: AgentContext,
+        feedback: list[str] | None = None,
+    ) -> ReportWritten:
+        """Rewrite the report for a revision round.
+
+        The research and fact-check do not change between rounds, so the
+        existing synthesis is reused and only the writer runs again.
+
+        Args:
+            result: Workflow result holding the current synthesis
+            context: Agent context with correlation ID
+            feedback: Critic suggestions for the writer to address
+
+        Returns:
+            Revised report
+        """
+        return await self.writer.write_report(
+            synthesis=result.synthesis,
+            format="markdown",
+            context=context,
+            feedback=feedback,
         )
 
+    async def _review(self, result: WorkflowResult, context: AgentContext) -> None:
+        """Run critic review rounds on ``result.report``, revising until approved.
+
+        Stops after ``max_iterations`` rounds; with zero rounds the report is
+        left unreviewed. Updates ``result`` in place.
+
+        Args:
+            result: Workflow result holding the synthesis and report
+            context: Execution context
+        """
+        for iteration in range(self.max_iterations):
+            log_stage(
+                "REVIEW", f"Iteration {iteration + 1}/{self.max_iterations}..."
+            )
+            # A speculative rewrite runs alongside the review without its
+            # feedback; it is only kept if the critic has no suggestions
+            revision = (
+                asyncio.create_task(self._revise(result, context))
+                if self.speculative_revision
+                else None
+            )
+            try:
+                result.review = await self.critic.review(result.report, context)
+            except BaseException:
+                if revision is not None:
+                    await self._discard(revision)
+                raise
+            result.iterations = iteration + 1
+
+            if result.review.approved:
+                log_stage(
+                    "REVIEW",
+                    f"✅ Report approved (score: {result.review.score:.2f})",
+                )
+                if revision is not None:
+                    await self._discard(revision)
+                break
+
+            if result.review.score >= self.auto_approve_threshold:
+                log_stage(
+                    "REVIEW", f"✅ Auto-approved (score: {result.review.score:.2f})"
+                )
+                if revision is not None:
+                    await self._discard(revision)
+                break
+
+            # Revision needed - rewrite with feedback
+            log_stage(
+                "REVIEW", f"⚠️  Needs revision (score: {result.review.score:.2f})"
+            )
+            suggestions = result.review.suggestions
+            if revision is not None and not suggestions:
+                result.report = await revision
+            else:
+                if revision is not None:
+                    await self._discard(revision)
+                result.report = await self._revise(result, context, suggestions)
+
+    @staticmethod
+    async def _discard(task: asyncio.Task) -> None:
+        """Cancel a speculative revision and wait for it to finish.
+
+        Waiting retrieves the task's outcome, so a rewrite that already
+        failed is not reported as a never-retrieved exception.
+
+        Args:
+            task: Revision task to drop
+        """
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
     async def execute(
         self,
         topic: str,
@@ -120,10 +460,21 @@ class ResearchWorkflow:
         Returns:
             WorkflowResult with all outputs
         """
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self._result_key(topic)
+            cached = await self._cached_result(cache_key)
+            if cached is not None:
+                logger.info(f"Returning cached workflow result: {topic}")
+                return cached
+
         context = AgentContext.create(correlation_id=correlation_id)
         result = WorkflowResult(status=WorkflowStage.RESEARCH)
+        log = logger.bind(correlation_id=context.correlation_id)
+        # Agents and LLM calls made during this run pick the ID up from here
+        token = correlation_id_var.set(context.correlation_id)
 
-        logger.info(f"🚀 Starting research workflow: {topic}")
+        log.info(f"🚀 Starting research workflow: {topic}")
 
         try:
             # Stage 1: Research
@@ -137,27 +488,12 @@ class ResearchWorkflow:
 
             # Stage 2: Fact-Check
             log_stage("FACT-CHECK", "Verifying claims against sources...")
-            result.fact_check = await self.fact_checker.verify_claims(
-                claims=result.research.findings,
-                sources=result.research.sources,
-                context=context,
-            )
-            verified = len(
-                [c for c in result.fact_check.claims if c.get("status") == "verified"]
-            )
-            partially = len(
-                [
-                    c
-                    for c in result.fact_check.claims
-                    if c.get("status") == "partially_verified"
-                ]
-            )
-            disputed = len(
-                [c for c in result.fact_check.claims if c.get("status") == "disputed"]
-            )
-            unverified = len(
-                [c for c in result.fact_check.claims if c.get("status") == "unverified"]
-            )
+            result.fact_check = await self._fact_check(result.research, context)
+            counts = Counter(c.get("status") for c in result.fact_check.claims)
+            verified = counts["verified"]
+            partially = counts["partially_verified"]
+            disputed = counts["disputed"]
+            unverified = counts["unverified"]
             log_stage(
                 "FACT-CHECK",
                 f"✅ Verified: {verified} | Partial: {partially} | Disputed: {disputed} | Unverified: {unverified}",
@@ -189,56 +525,21 @@ class ResearchWorkflow:
             result.status = WorkflowStage.REVIEW
 
             # Stage 5: Review (with iteration)
-            for iteration in range(self.max_iterations):
-                log_stage(
-                    "REVIEW", f"Iteration {iteration + 1}/{self.max_iterations}..."
-                )
-                result.review = await self.critic.review(result.report, context)
-                result.iterations = iteration + 1
-
-                if result.review.approved:
-                    log_stage(
-                        "REVIEW",
-                        f"✅ Report approved (score: {result.review.score:.2f})",
-                    )
-                    break
-
-                if result.review.score >= self.auto_approve_threshold:
-                    log_stage(
-                        "REVIEW", f"✅ Auto-approved (score: {result.review.score:.2f})"
-                    )
-                    break
-
-                # Revision needed - rewrite with feedback
-                log_stage(
-                    "REVIEW", f"⚠️  Needs revision (score: {result.review.score:.2f})"
-                )
-                # Create enhanced synthesis with criticism
-                # For simplicity, re-run synthesis and writing
-                result.synthesis = await self.synthesizer.synthesize(
-                    research=result.research,
-                    fact_check=result.fact_check,
-                    context=context,
-                )
-                result.report = await self.writer.write_report(
-                    synthesis=result.synthesis,
-                    format="markdown",
-                    context=context,
-                )
+            await self._review(result, context)
 
             result.status = WorkflowStage.COMPLETED
-            logger.info(
-                "Workflow completed successfully",
-                extra={"correlation_id": context.correlation_id},
-            )
+            log.info("Workflow completed successfully")
 
         except Exception as e:
             result.status = WorkflowStage.FAILED
             result.error = str(e)
-            logger.error(
-                f"Workflow failed: {e}",
-                extra={"correlation_id": context.correlation_id},
-            )
+            log.error(f"Workflow failed: {e}")
+
+        finally:
+            correlation_id_var.reset(token)
+
+        if cache_key is not None and result.status == WorkflowStage.COMPLETED:
+            await self._store_result(cache_key, result)
 
         return result
 
@@ -253,11 +554,7 @@ class ResearchWorkflow:
 
         try:
             result.research = await self.researcher.research(topic, context)
-            result.fact_check = await self.fact_checker.verify_claims(
-                claims=result.research.findings,
-                sources=result.research.sources,
-                context=context,
-            )
+            result.fact_check = await self._fact_check(result.research, context)
             result.synthesis = await self.synthesizer.synthesize(
                 research=result.research,
                 fact_check=result.fact_check,
@@ -1,5 +1,6 @@
 """Test script to verify API key availability for all LLM providers."""
 
+import asyncio
 import sys
 
 from langchain_openai import ChatOpenAI
@@ -8,12 +9,12 @@ from langchain_anthropic import ChatAnthropic
 from src.config import settings
 
 
-def test_openai_api() -> bool:
+async def test_openai_api() -> bool:
     """Test OpenAI API key availability."""
     print("Testing OpenAI API...")
     try:
         client = ChatOpenAI(api_key=settings.openai_api_key, model="gpt-4o-mini")
-        response = client.invoke([{"role": "user", "content": "test"}])
+        response = await client.ainvoke([{"role": "user", "content": "test"}])
         print(
             f"  ✓ OpenAI API: OK (model: {response.response_metadata.get('model_name', 'unknown')})"
         )
@@ -23,14 +24,14 @@ def test_openai_api() -> bool:
         return False
 
 
-def test_anthropic_api() -> bool:
+async def test_anthropic_api() -> bool:
     """Test Anthropic API key availability."""
     print("Testing Anthropic API...")
     try:
         client = ChatAnthropic(
             api_key=settings.anthropic_api_key, model_name="claude-sonnet-4-20250514"
         )
-        response = client.invoke([{"role": "user", "content": "test"}])
+        response = await client.ainvoke([{"role": "user", "content": "test"}])
         print(f"  ✓ Anthropic API: OK (model: {response.id})")
         return True
     except Exception as e:
@@ -38,7 +39,7 @@ def test_anthropic_api() -> bool:
         return False
 
 
-def test_openrouter_api() -> bool:
+async def test_openrouter_api() -> bool:
     """Test OpenRouter API key availability using LangChain."""
     print("Testing OpenRouter API...")
     if not settings.openrouter_api_key:
@@ -50,7 +51,7 @@ def test_openrouter_api() -> bool:
             api_key=settings.openrouter_api_key,
             base_url="https://openrouter.ai/api/v1",
         )
-        response = client.invoke([{"role": "user", "content": "test"}])
+        response = await client.ainvoke([{"role": "user", "content": "test"}])
         print(
             f"  ✓ OpenRouter API: OK (model: {response.response_metadata.get('model_name', 'unknown')})"
         )
@@ -60,6 +61,15 @@ def test_openrouter_api() -> bool:
         return False
 
 
+async def _run_all() -> list[bool]:
+    """Run every provider check concurrently."""
+    return await asyncio.gather(
+        test_openai_api(),
+        test_anthropic_api(),
+        test_openrouter_api(),
+    )
+
+
 def main() -> int:
     """Run all API availability tests."""
     print("=" * 50)
@@ -67,11 +77,10 @@ def main() -> int:
     print("=" * 50)
     print()
 
-    results = {
-        "OpenAI": test_openai_api(),
-        "Anthropic": test_anthropic_api(),
-        "OpenRouter": test_openrouter_api(),
-    }
+    # Providers are independent, so check them concurrently
+    names = ["OpenAI", "Anthropic", "OpenRouter"]
+    outcomes = asyncio.run(_run_all())
+    results = dict(zip(names, outcomes, strict=True))
 
     print()
     print("=" * 50)
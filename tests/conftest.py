@@ -0,0 +1,16 @@
+"""Fixtures shared by unit and integration tests."""
+
+import pytest
+
+from src.orchestration.workflow import ResearchWorkflow
+
+
+@pytest.fixture(autouse=True)
+def fresh_agent_cache():
+    """Drop the process-wide agent cache after each test.
+
+    Tests stub methods on agents; clearing the cache keeps an agent a test
+    touched from being handed to workflows built by later tests.
+    """
+    yield
+    ResearchWorkflow.clear_agent_cache()
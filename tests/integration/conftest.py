@@ -0,0 +1,160 @@
+"""Shared fixtures for integration tests."""
+
+import asyncio
+import contextlib
+import dataclasses
+import functools
+from datetime import UTC, datetime
+
+import pytest
+
+from src.domain import events
+from src.domain.events import FactCheckCompleted, ResearchCompleted
+from src.orchestration.workflow import ResearchWorkflow
+
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed.
+
+    uvloop is optional (and unavailable on Windows); without it the default
+    asyncio policy is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def frozen_event_clock():
+    """Stamp every event created during integration tests with ``FROZEN_NOW``.
+
+    Keeps event timestamps deterministic and comparable across tests.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(events, "_now", lambda: FROZEN_NOW)
+        yield FROZEN_NOW
+
+
+@pytest.fixture(scope="session")
+def workflow_factory():
+    """Return a builder of Ollama-backed workflows, one per configuration.
+
+    Workflows are memoized on ``(max_iterations, auto_approve_threshold)``;
+    tests must restore anything they patch on them (``swap`` does).
+    """
+
+    @functools.cache
+    def make(max_iterations: int = 1, auto_approve_threshold: float = 0.8) -> ResearchWorkflow:
+        return ResearchWorkflow(
+            max_iterations=max_iterations,
+            auto_approve_threshold=auto_approve_threshold,
+            llm_provider="ollama",
+            llm_model="llama3.2:3b",
+        )
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def ollama_workflow(workflow_factory):
+    """Build one Ollama-backed workflow for tests that only read its attributes.
+
+    Tests that patch agent methods must build their own workflow instead.
+    Under pytest-xdist each worker builds its own copy; nothing here needs
+    to be shared or pickled across processes.
+    """
+    return workflow_factory()
+
+
+@contextlib.contextmanager
+def _swap(obj, attr: str, value):
+    """Temporarily bind ``value`` as ``obj.attr``, restoring it on exit."""
+    shadowed = attr in vars(obj)
+    original = getattr(obj, attr)
+    setattr(obj, attr, value)
+    try:
+        yield value
+    finally:
+        if shadowed:
+            setattr(obj, attr, original)
+        else:
+            delattr(obj, attr)
+
+
+@pytest.fixture
+def swap():
+    """Return a context manager that rebinds one attribute for its block.
+
+    A lighter stand-in for ``patch.object(obj, attr, new_callable=AsyncMock)``:
+    pass the replacement (usually an ``AsyncMock``) and get it back from
+    ``with``.
+    """
+    return _swap
+
+
+@functools.lru_cache(maxsize=8)
+def _research_event(topic: str, findings: tuple[str, ...]) -> ResearchCompleted:
+    """Build a research event with one empty source, once per arguments."""
+    return ResearchCompleted.create(
+        topic=topic,
+        sources=[{"url": "", "title": "", "date": ""}],
+        findings=list(findings),
+    )
+
+
+@functools.lru_cache(maxsize=2)
+def _fact_check_event(verified: bool) -> FactCheckCompleted:
+    """Build a single-claim fact-check event, once per shape."""
+    claim = {"text": "test", "status": "verified"}
+    return FactCheckCompleted.create(
+        claims=[claim],
+        verified_claims=[claim] if verified else [],
+        confidence_scores={"test": 0.9} if verified else {},
+    )
+
+
+def _with_correlation_id(event, correlation_id: str | None):
+    """Return ``event``, or a copy carrying ``correlation_id`` if given."""
+    if correlation_id is None:
+        return event
+    return dataclasses.replace(event, correlation_id=correlation_id)
+
+
+@pytest.fixture
+def canned_research():
+    """Return a factory for minimal, memoized research events.
+
+    Events are shared between tests and must be treated as read-only; pass
+    ``correlation_id`` to get a copy with a specific ID.
+    """
+
+    def make(
+        topic: str = "test",
+        findings: tuple[str, ...] = ("finding",),
+        correlation_id: str | None = None,
+    ) -> ResearchCompleted:
+        return _with_correlation_id(_research_event(topic, findings), correlation_id)
+
+    return make
+
+
+@pytest.fixture
+def canned_fact_check():
+    """Return a factory for minimal, memoized fact-check events.
+
+    ``verified=True`` marks the single claim as verified with a 0.9 score;
+    otherwise the verified claims and scores are empty.
+    """
+
+    def make(
+        verified: bool = False,
+        correlation_id: str | None = None,
+    ) -> FactCheckCompleted:
+        return _with_correlation_id(_fact_check_event(verified), correlation_id)
+
+    return make
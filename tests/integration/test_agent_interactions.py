@@ -1,7 +1,6 @@
 """Agent-to-agent interaction integration tests."""
 
-from unittest.mock import AsyncMock, patch
-
+import orjson
 import pytest
 
 from src.agents import (
@@ -21,310 +20,322 @@ from src.domain.events import (
 from src.domain.interfaces import AgentContext
 
 
-class TestResearcherToFactCheckerFlow:
-    """Test researcher to fact-checker data flow."""
+def _dumps(data) -> str:
+    """Serialize a canned LLM response the way the agents parse it."""
+    return orjson.dumps(data).decode()
 
-    @pytest.mark.asyncio
-    async def test_researcher_output_feeds_factchecker(self):
-        """Verify ResearchCompleted event can be processed by fact-checker."""
-        researcher = ResearcherAgent(provider="ollama", model="llama3.2:3b")
-        fact_checker = FactCheckerAgent(provider="ollama", model="llama3.2:3b")
 
-        # Create sample research output
-        research = ResearchCompleted.create(
-            topic="artificial intelligence ethics",
-            sources=[
-                {
-                    "url": "https://example.com/ai-ethics",
-                    "title": "AI Ethics Guidelines",
-                    "date": "2024-01-15",
-                },
-                {
-                    "url": "https://example.com/ai-safety",
-                    "title": "AI Safety Principles",
-                    "date": "2024-02-01",
-                },
-            ],
-            findings=[
-                "AI systems should be transparent and explainable",
-                "AI should not discriminate against protected groups",
-                "Human oversight should be maintained for critical decisions",
-                "AI development should follow ethical guidelines",
-            ],
-        )
+# Canned LLM responses, serialized once at import
+_FACTCHECK_RESPONSE = _dumps(
+    {
+        "claims": [{"text": "AI systems should be transparent", "status": "verified"}],
+        "verified_claims": [
+            {"text": "AI systems should be transparent", "status": "verified"}
+        ],
+        "confidence_scores": {"AI systems should be transparent": 0.95},
+    }
+)
+_FACTCHECK_TOPIC_RESPONSE = _dumps(
+    {
+        "claims": [{"text": "Solar panel efficiency", "status": "verified"}],
+        "verified_claims": [],
+        "confidence_scores": {},
+    }
+)
+_SYNTHESIS_RESPONSE = _dumps(
+    {
+        "insights": ["Quantum computing uses fundamentally different computation model"],
+        "resolved_contradictions": [],
+    }
+)
+_WRITER_MARKDOWN_RESPONSE = _dumps(
+    {
+        "title": "Blockchain Technology Overview",
+        "content": "# Blockchain Technology\n\n## Introduction\n\nBlockchain represents...",
+        "format": "markdown",
+    }
+)
+_WRITER_PLAIN_RESPONSE = _dumps(
+    {
+        "title": "Plain Text Report",
+        "content": "PLAIN TEXT REPORT\n\nThis is plain content",
+        "format": "plain",
+    }
+)
+_CRITIC_REJECT_RESPONSE = _dumps(
+    {
+        "suggestions": ["Add more recent data", "Include economic impact section"],
+        "score": 0.75,
+        "approved": False,
+    }
+)
+_CRITIC_APPROVE_RESPONSE = _dumps({"suggestions": [], "score": 0.92, "approved": True})
 
-        context = AgentContext.create(correlation_id="test-correlation-001")
 
-        # Mock the LLM call for fact-checker
-        with patch.object(
-            fact_checker.llm, "ainvoke", new_callable=AsyncMock
-        ) as mock_invoke:
-            # Simulate a valid JSON response
-            mock_response = type(
-                "MockResponse",
-                (),
-                {
-                    "content": '{"claims": [{"text": "AI systems should be transparent", "status": "verified"}], "verified_claims": [{"text": "AI systems should be transparent", "status": "verified"}], "confidence_scores": {"AI systems should be transparent": 0.95}}'
-                },
-            )()
-            mock_invoke.return_value = mock_response
-
-            result = await fact_checker.verify_claims(
-                claims=research.findings,
-                sources=research.sources,
-                context=context,
-            )
-
-        # Verify output structure
-        assert result is not None
-        assert hasattr(result, "claims")
-        assert hasattr(result, "verified_claims")
-        assert hasattr(result, "confidence_scores")
-        assert len(result.claims) > 0
-
-    @pytest.mark.asyncio
-    async def test_factchecker_preserves_research_topic(self):
-        """Verify that fact-checker maintains context of research topic."""
-        fact_checker = FactCheckerAgent(provider="ollama", model="llama3.2:3b")
+class _Msg:
+    """Minimal LLM reply; agents only read ``content`` from it."""
 
-        research = ResearchCompleted.create(
-            topic="renewable energy advancements",
-            sources=[
-                {
-                    "url": "https://example.com/renewable",
-                    "title": "Renewable Energy",
-                    "date": "2024-01-01",
-                }
-            ],
-            findings=[
-                "Solar panel efficiency has improved significantly",
-                "Wind power costs have decreased by 50%",
-            ],
-        )
+    __slots__ = ("content",)
 
-        context = AgentContext.create(correlation_id="test-topic-preservation")
+    def __init__(self, content: str):
+        self.content = content
 
-        with patch.object(
-            fact_checker.llm, "ainvoke", new_callable=AsyncMock
-        ) as mock_invoke:
-            mock_response = type(
-                "MockResponse",
-                (),
-                {
-                    "content": '{"claims": [{"text": "Solar panel efficiency", "status": "verified"}], "verified_claims": [], "confidence_scores": {}}'
-                },
-            )()
-            mock_invoke.return_value = mock_response
 
-            result = await fact_checker.verify_claims(
-                claims=research.findings,
-                sources=research.sources,
-                context=context,
-            )
+def _respond_with(content: str):
+    """Build a stand-in for ``llm.ainvoke`` that always returns ``content``.
 
-        # The fact-check result should be traceable to the original research
-        assert result.correlation_id == context.correlation_id
+    Cheaper than AsyncMock, which these tests never inspect.
+    """
+    response = _Msg(content)
 
+    async def ainvoke(*args, **kwargs):
+        return response
 
-class TestFactCheckerToSynthesizerFlow:
-    """Test fact-checker to synthesizer data flow."""
+    return ainvoke
 
-    @pytest.mark.asyncio
-    async def test_factcheck_output_feeds_synthesizer(self):
-        """Verify FactCheckCompleted event flows into synthesizer."""
-        synthesizer = SynthesizerAgent(provider="ollama", model="llama3.2:3b")
 
-        fact_check = FactCheckCompleted.create(
-            claims=[
-                {
-                    "text": "Quantum computers use qubits",
-                    "status": "verified",
-                },
-                {
-                    "text": "Quantum superposition allows multiple states",
-                    "status": "partially_verified",
-                },
-                {
-                    "text": "Quantum entanglement enables instant communication",
-                    "status": "disputed",
-                },
-            ],
-            verified_claims=[
-                {"text": "Quantum computers use qubits", "status": "verified"}
-            ],
-            confidence_scores={
-                "Quantum computers use qubits": 0.95,
-                "Quantum superposition allows multiple states": 0.70,
-                "Quantum entanglement enables instant communication": 0.30,
-            },
-        )
+# Agents are built once per module; each test patches ``llm.ainvoke`` itself,
+# so construction (client wiring, tool binding) is the only shared work.
 
-        research = ResearchCompleted.create(
-            topic="quantum computing",
-            sources=[{"url": "", "title": "", "date": ""}],
-            findings=["finding 1", "finding 2"],
-        )
 
-        context = AgentContext.create(correlation_id="test-synthesis-flow")
+@pytest.fixture(scope="module")
+def researcher():
+    """Create a researcher agent shared by the module."""
+    return ResearcherAgent(provider="ollama", model="llama3.2:3b")
 
-        with patch.object(
-            synthesizer.llm, "ainvoke", new_callable=AsyncMock
-        ) as mock_invoke:
-            mock_response = type(
-                "MockResponse",
-                (),
-                {
-                    "content": '{"insights": ["Quantum computing uses fundamentally different computation model"], "resolved_contradictions": []}'
-                },
-            )()
-            mock_invoke.return_value = mock_response
 
-            result = await synthesizer.synthesize(
-                research=research,
-                fact_check=fact_check,
-                context=context,
-            )
+@pytest.fixture(scope="module")
+def fact_checker():
+    """Create a fact-checker agent shared by the module."""
+    return FactCheckerAgent(provider="ollama", model="llama3.2:3b")
 
-        assert result is not None
-        assert hasattr(result, "insights")
-        assert hasattr(result, "resolved_contradictions")
-        assert len(result.insights) > 0
 
+@pytest.fixture(scope="module")
+def synthesizer():
+    """Create a synthesizer agent shared by the module."""
+    return SynthesizerAgent(provider="ollama", model="llama3.2:3b")
 
-class TestSynthesizerToWriterFlow:
-    """Test synthesizer to writer data flow."""
 
-    @pytest.mark.asyncio
-    async def test_synthesis_output_feeds_writer(self):
-        """Verify SynthesisCompleted event flows into writer."""
-        writer = WriterAgent(provider="ollama", model="llama3.2:3b")
+@pytest.fixture(scope="module")
+def writer():
+    """Create a writer agent shared by the module."""
+    return WriterAgent(provider="ollama", model="llama3.2:3b")
 
-        synthesis = SynthesisCompleted.create(
-            insights=[
-                "Blockchain provides decentralized trust mechanisms",
-                "Smart contracts enable automated execution of agreements",
-                "Cryptography ensures transaction security and privacy",
-            ],
-            resolved_contradictions=[
-                {
-                    "contradiction": "Blockchain scalability vs security",
-                    "resolution": "Layer 2 solutions address scalability while maintaining security guarantees",
-                }
-            ],
-        )
 
-        context = AgentContext.create(correlation_id="test-writer-flow")
+@pytest.fixture(scope="module")
+def critic():
+    """Create a critic agent shared by the module."""
+    return CriticAgent(provider="ollama", model="llama3.2:3b")
 
-        with patch.object(writer.llm, "ainvoke", new_callable=AsyncMock) as mock_invoke:
-            mock_response = type(
-                "MockResponse",
-                (),
-                {
-                    "content": '{"title": "Blockchain Technology Overview", "content": "# Blockchain Technology\\n\\n## Introduction\\n\\nBlockchain represents...", "format": "markdown"}'
-                },
-            )()
-            mock_invoke.return_value = mock_response
-
-            result = await writer.write_report(
-                synthesis=synthesis,
-                format="markdown",
-                context=context,
-            )
-
-        assert result is not None
-        assert hasattr(result, "title")
-        assert hasattr(result, "content")
-        assert hasattr(result, "format")
-        assert "Blockchain" in result.title or result.title != ""
-
-    @pytest.mark.asyncio
-    async def test_writer_supports_plain_format(self):
-        """Verify writer can produce plain text format."""
-        writer = WriterAgent(provider="ollama", model="llama3.2:3b")
 
-        synthesis = SynthesisCompleted.create(
-            insights=["Key insight one", "Key insight two"],
-            resolved_contradictions=[],
-        )
+@pytest.fixture(scope="module")
+def ctx_default():
+    """Create an agent context shared by tests that don't assert on its ID."""
+    return AgentContext.create(correlation_id="test")
 
-        context = AgentContext.create(correlation_id="test-plain-format")
 
-        with patch.object(writer.llm, "ainvoke", new_callable=AsyncMock) as mock_invoke:
-            mock_response = type(
-                "MockResponse",
-                (),
-                {
-                    "content": '{"title": "Plain Text Report", "content": "PLAIN TEXT REPORT\\n\\nThis is plain content", "format": "plain"}'
-                },
-            )()
-            mock_invoke.return_value = mock_response
+# Placeholder source; agents only read sources, so one dict is shared
+_EMPTY_SOURCE = {"url": "", "title": "", "date": ""}
 
-            result = await writer.write_report(
-                synthesis=synthesis,
-                format="plain",
-                context=context,
-            )
+# Upstream events fed into each agent by the flow tests
+_RESEARCH = ResearchCompleted.create(
+    topic="artificial intelligence ethics",
+    sources=[
+        {
+            "url": "https://example.com/ai-ethics",
+            "title": "AI Ethics Guidelines",
+            "date": "2024-01-15",
+        },
+        {
+            "url": "https://example.com/ai-safety",
+            "title": "AI Safety Principles",
+            "date": "2024-02-01",
+        },
+    ],
+    findings=[
+        "AI systems should be transparent and explainable",
+        "AI should not discriminate against protected groups",
+        "Human oversight should be maintained for critical decisions",
+        "AI development should follow ethical guidelines",
+    ],
+)
+_FACT_CHECK = FactCheckCompleted.create(
+    claims=[
+        {"text": "Quantum computers use qubits", "status": "verified"},
+        {
+            "text": "Quantum superposition allows multiple states",
+            "status": "partially_verified",
+        },
+        {
+            "text": "Quantum entanglement enables instant communication",
+            "status": "disputed",
+        },
+    ],
+    verified_claims=[{"text": "Quantum computers use qubits", "status": "verified"}],
+    confidence_scores={
+        "Quantum computers use qubits": 0.95,
+        "Quantum superposition allows multiple states": 0.70,
+        "Quantum entanglement enables instant communication": 0.30,
+    },
+)
+_SYNTHESIS_RESEARCH = ResearchCompleted.create(
+    topic="quantum computing",
+    sources=[_EMPTY_SOURCE],
+    findings=["finding 1", "finding 2"],
+)
+_SYNTHESIS = SynthesisCompleted.create(
+    insights=[
+        "Blockchain provides decentralized trust mechanisms",
+        "Smart contracts enable automated execution of agreements",
+        "Cryptography ensures transaction security and privacy",
+    ],
+    resolved_contradictions=[
+        {
+            "contradiction": "Blockchain scalability vs security",
+            "resolution": "Layer 2 solutions address scalability while maintaining security guarantees",
+        }
+    ],
+)
+_PLAIN_SYNTHESIS = SynthesisCompleted.create(
+    insights=["Key insight one", "Key insight two"],
+    resolved_contradictions=[],
+)
+_REPORT = ReportWritten.create(
+    title="Climate Change Analysis",
+    content="# Climate Change Analysis\n\n## Overview\n\nThis report examines the impacts of climate change on global ecosystems.",
+    format="markdown",
+)
 
-        assert result.format == "plain"
+# (agent fixture, method, inputs, canned response, output event type, extra check)
+_FLOW_CASES = [
+    pytest.param(
+        "fact_checker",
+        "verify_claims",
+        {"claims": _RESEARCH.findings, "sources": _RESEARCH.sources},
+        _FACTCHECK_RESPONSE,
+        FactCheckCompleted,
+        lambda result: len(result.claims) > 0,
+        id="research-feeds-factchecker",
+    ),
+    pytest.param(
+        "synthesizer",
+        "synthesize",
+        {"research": _SYNTHESIS_RESEARCH, "fact_check": _FACT_CHECK},
+        _SYNTHESIS_RESPONSE,
+        SynthesisCompleted,
+        lambda result: len(result.insights) > 0,
+        id="factcheck-feeds-synthesizer",
+    ),
+    pytest.param(
+        "writer",
+        "write_report",
+        {"synthesis": _SYNTHESIS, "format": "markdown"},
+        _WRITER_MARKDOWN_RESPONSE,
+        ReportWritten,
+        lambda result: "Blockchain" in result.title or result.title != "",
+        id="synthesis-feeds-writer",
+    ),
+    pytest.param(
+        "writer",
+        "write_report",
+        {"synthesis": _PLAIN_SYNTHESIS, "format": "plain"},
+        _WRITER_PLAIN_RESPONSE,
+        ReportWritten,
+        lambda result: result.format == "plain",
+        id="writer-plain-format",
+    ),
+    pytest.param(
+        "critic",
+        "review",
+        {"report": _REPORT},
+        _CRITIC_REJECT_RESPONSE,
+        ReportReviewed,
+        lambda result: isinstance(result.suggestions, list)
+        and 0.0 <= result.score <= 1.0,
+        id="report-feeds-critic",
+    ),
+]
+
+
+class TestAgentFlows:
+    """Test each agent consumes its upstream event and emits its own."""
+
+    @pytest.mark.parametrize(
+        ("agent_name", "method", "inputs", "response", "event_type", "check"),
+        _FLOW_CASES,
+    )
+    async def test_agent_flow(
+        self,
+        request,
+        monkeypatch,
+        ctx_default,
+        agent_name,
+        method,
+        inputs,
+        response,
+        event_type,
+        check,
+    ):
+        """Verify an upstream event flows through the agent into its output event."""
+        agent = request.getfixturevalue(agent_name)
+        monkeypatch.setattr(agent.llm, "ainvoke", _respond_with(response))
+
+        result = await getattr(agent, method)(**inputs, context=ctx_default)
+
+        assert isinstance(result, event_type)
+        assert check(result)
+
+
+class TestFactCheckerContext:
+    """Test fact-checker keeps research context."""
+
+    async def test_factchecker_preserves_research_topic(
+        self, monkeypatch, fact_checker, ctx_default
+    ):
+        """Verify that fact-checker maintains context of research topic."""
+        research = ResearchCompleted.create(
+            topic="renewable energy advancements",
+            sources=[
+                {
+                    "url": "https://example.com/renewable",
+                    "title": "Renewable Energy",
+                    "date": "2024-01-01",
+                }
+            ],
+            findings=[
+                "Solar panel efficiency has improved significantly",
+                "Wind power costs have decreased by 50%",
+            ],
+        )
 
+        monkeypatch.setattr(
+            fact_checker.llm, "ainvoke", _respond_with(_FACTCHECK_TOPIC_RESPONSE)
+        )
 
-class TestWriterToCriticFlow:
-    """Test writer to critic data flow."""
+        result = await fact_checker.verify_claims(
+            claims=research.findings,
+            sources=research.sources,
+            context=ctx_default,
+        )
 
-    @pytest.mark.asyncio
-    async def test_report_output_feeds_critic(self):
-        """Verify ReportWritten event is reviewed by critic."""
-        critic = CriticAgent(provider="ollama", model="llama3.2:3b")
+        # The fact-check result should be traceable to the original research
+        assert result.correlation_id == ctx_default.correlation_id
 
-        report = ReportWritten.create(
-            title="Climate Change Analysis",
-            content="# Climate Change Analysis\n\n## Overview\n\nThis report examines the impacts of climate change on global ecosystems.",
-            format="markdown",
-        )
 
-        context = AgentContext.create(correlation_id="test-critic-flow")
+class TestCriticApproval:
+    """Test critic approval decisions."""
 
-        with patch.object(critic.llm, "ainvoke", new_callable=AsyncMock) as mock_invoke:
-            mock_response = type(
-                "MockResponse",
-                (),
-                {
-                    "content": '{"suggestions": ["Add more recent data", "Include economic impact section"], "score": 0.75, "approved": false}'
-                },
-            )()
-            mock_invoke.return_value = mock_response
-
-            result = await critic.review(report=report, context=context)
-
-        assert result is not None
-        assert hasattr(result, "suggestions")
-        assert hasattr(result, "score")
-        assert hasattr(result, "approved")
-        assert isinstance(result.suggestions, list)
-        assert 0.0 <= result.score <= 1.0
-
-    @pytest.mark.asyncio
-    async def test_critic_can_approve_report(self):
+    async def test_critic_can_approve_report(self, monkeypatch, critic, ctx_default):
         """Verify critic can approve a high-quality report."""
-        critic = CriticAgent(provider="ollama", model="llama3.2:3b")
-
         report = ReportWritten.create(
             title="Excellent Research Report",
             content="# Excellent Report\n\nThis is a comprehensive and well-written report with proper citations.",
             format="markdown",
         )
 
-        context = AgentContext.create(correlation_id="test-approval")
-
-        with patch.object(critic.llm, "ainvoke", new_callable=AsyncMock) as mock_invoke:
-            mock_response = type(
-                "MockResponse",
-                (),
-                {"content": '{"suggestions": [], "score": 0.92, "approved": true}'},
-            )()
-            mock_invoke.return_value = mock_response
+        monkeypatch.setattr(critic.llm, "ainvoke", _respond_with(_CRITIC_APPROVE_RESPONSE))
 
-            result = await critic.review(report=report, context=context)
+        result = await critic.review(report=report, context=ctx_default)
 
         assert result.approved is True
         assert result.score >= 0.8
@@ -333,15 +344,12 @@ class TestWriterToCriticFlow:
 class TestMultiAgentDataContract:
     """Test that data contracts are maintained across agents."""
 
-    @pytest.mark.asyncio
-    async def test_research_contains_required_fields(self):
+    def test_research_contains_required_fields(self, researcher, frozen_event_clock):
         """Verify researcher output contains all required fields."""
-        researcher = ResearcherAgent(provider="ollama", model="llama3.2:3b")
-
         # Create minimal research
         research = ResearchCompleted.create(
             topic="test",
-            sources=[{"url": "", "title": "", "date": ""}],
+            sources=[_EMPTY_SOURCE],
             findings=["finding"],
         )
 
@@ -350,35 +358,36 @@ class TestMultiAgentDataContract:
         assert len(research.findings) == 1
         assert "url" in research.sources[0]
         assert research.correlation_id is not None
+        assert research.timestamp == frozen_event_clock
 
-    @pytest.mark.asyncio
-    async def test_factcheck_claim_status_normalization(self):
+    def test_factcheck_claim_status_normalization(self, fact_checker):
         """Verify fact-checker normalizes claim statuses correctly."""
-        fact_checker = FactCheckerAgent(provider="ollama", model="llama3.2:3b")
-
-        # Test status normalization through the private method
+        # Invalid statuses default to unverified
+        expected = {
+            "VERIFIED": "verified",
+            "Partially_Verified": "partially_verified",
+            "partially verified": "partially_verified",
+            "disputed": "disputed",
+            "unknown_status": "unverified",
+        }
+        statuses = list(expected) * 1000
         claims = [
-            {"text": "Claim 1", "status": "VERIFIED"},
-            {"text": "Claim 2", "status": "Partially_Verified"},
-            {"text": "Claim 3", "status": "disputed"},
-            {"text": "Claim 4", "status": "unknown_status"},
+            {"text": f"Claim {i}", "status": status}
+            for i, status in enumerate(statuses)
         ]
 
         normalized = fact_checker._normalize_claim_statuses(claims)
 
-        assert normalized[0]["status"] == "verified"
-        assert normalized[1]["status"] == "partially_verified"
-        assert normalized[2]["status"] == "disputed"
-        assert normalized[3]["status"] == "unverified"  # Invalid defaults to unverified
+        assert [c["status"] for c in normalized] == [expected[s] for s in statuses]
+        assert [c["text"] for c in normalized] == [c["text"] for c in claims]
 
-    @pytest.mark.asyncio
-    async def test_event_correlation_id_tracking(self):
+    def test_event_correlation_id_tracking(self):
         """Verify correlation ID is preserved through all events."""
         correlation_id = "unique-test-correlation-id"
 
         research = ResearchCompleted.create(
             topic="test",
-            sources=[{"url": "", "title": "", "date": ""}],
+            sources=[_EMPTY_SOURCE],
             findings=["finding"],
             correlation_id=correlation_id,
         )
@@ -1,10 +1,12 @@
 """Integration tests for API endpoints."""
 
+import inspect
 from unittest.mock import AsyncMock, patch
-from datetime import datetime, timezone
+
+import httpx
 import pytest
 
-from fastapi.testclient import TestClient
+from fastapi.routing import APIRoute
 
 from src.api.main import app
 from src.api.models.response import JobStatus
@@ -18,41 +20,67 @@ from src.domain.events import (
 from src.orchestration.workflow import WorkflowStage
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client."""
-    return TestClient(app)
+    """Create an async client that calls the app in-process on the test's loop.
+
+    ASGITransport skips TestClient's background thread, and holds no
+    loop-bound state, so one client can serve every test in the session.
+    """
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def no_workflow():
+    """Stop submitted jobs from running the real workflow, patched once per module."""
+    with patch(
+        "src.api.routes.research._run_research_workflow", new_callable=AsyncMock
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_jobs():
+    """Reset the in-memory job store so tests sharing the client stay isolated."""
+    from src.api.routes import research
+
+    for shard in research._shards:
+        shard.clear()
+    yield
+    for shard in research._shards:
+        shard.clear()
 
 
 class TestHealthEndpoint:
     """Tests for health check endpoint."""
 
-    def test_health_check_returns_healthy(self, client):
+    async def test_health_check_returns_healthy(self, client):
         """Test health check returns healthy status."""
-        response = client.get("/api/v1/health")
+        response = await client.get("/api/v1/health")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert data["service"] == "veritas-api"
 
-    def test_health_check_no_docs(self, client):
+    async def test_health_check_no_docs(self, client):
         """Test health check doesn't expose docs."""
         # Health endpoint should work without authentication
-        response = client.get("/api/v1/health")
+        response = await client.get("/api/v1/health")
         assert response.status_code == 200
 
 
 class TestResearchEndpoints:
     """Tests for research API endpoints."""
 
-    def test_submit_research_returns_202(self, client):
+    async def test_submit_research_returns_202(self, client):
         """Test submitting a research job returns 202 Accepted."""
-        with patch("src.api.routes.research._run_research_workflow") as mock_workflow:
-            response = client.post(
-                "/api/v1/research",
-                json={"topic": "What is machine learning?"},
-            )
+        response = await client.post(
+            "/api/v1/research",
+            json={"topic": "What is machine learning?"},
+        )
 
         assert response.status_code == 202
         data = response.json()
@@ -60,116 +88,136 @@ class TestResearchEndpoints:
         assert data["status"] == "pending"
         assert data["topic"] == "What is machine learning?"
 
-    def test_submit_research_with_custom_params(self, client):
+    async def test_submit_research_with_custom_params(self, client):
         """Test submitting research with custom parameters."""
-        with patch("src.api.routes.research._run_research_workflow"):
-            response = client.post(
-                "/api/v1/research",
-                json={
-                    "topic": "Climate change effects",
-                    "max_iterations": 5,
-                    "auto_approve_threshold": 0.9,
-                    "llm_provider": "anthropic",
-                    "llm_model": "claude-3-opus",
-                },
-            )
+        response = await client.post(
+            "/api/v1/research",
+            json={
+                "topic": "Climate change effects",
+                "max_iterations": 5,
+                "auto_approve_threshold": 0.9,
+                "llm_provider": "anthropic",
+                "llm_model": "claude-3-opus",
+            },
+        )
 
         assert response.status_code == 202
         data = response.json()
         assert data["topic"] == "Climate change effects"
 
-    def test_submit_research_validation_error(self, client):
+    async def test_submit_research_validation_error(self, client):
         """Test that missing topic returns validation error."""
-        response = client.post(
+        response = await client.post(
             "/api/v1/research",
             json={},
         )
 
         assert response.status_code == 422  # Validation error
 
-    def test_get_job_not_found(self, client):
+    async def test_get_job_not_found(self, client):
         """Test getting a non-existent job returns 404."""
-        response = client.get("/api/v1/research/nonexistent-job-id")
+        response = await client.get("/api/v1/research/nonexistent-job-id")
 
         assert response.status_code == 404
 
-    def test_get_job_pending_status(self, client):
+    async def test_get_job_pending_status(self, client):
         """Test getting a pending job returns status only."""
         # First create a job
-        with patch("src.api.routes.research._run_research_workflow"):
-            submit_response = client.post(
-                "/api/v1/research",
-                json={"topic": "Test topic"},
-            )
+        submit_response = await client.post(
+            "/api/v1/research",
+            json={"topic": "Test topic"},
+        )
 
         job_id = submit_response.json()["job_id"]
 
         # Now get the job
-        response = client.get(f"/api/v1/research/{job_id}")
+        response = await client.get(f"/api/v1/research/{job_id}")
 
         assert response.status_code == 200
         data = response.json()
         assert data["job_id"] == job_id
         assert data["status"] in [JobStatus.PENDING, JobStatus.PROCESSING]
 
-    def test_list_jobs_empty(self, client):
+    async def test_list_jobs_empty(self, client):
         """Test listing jobs when none exist."""
-        response = client.get("/api/v1/research")
+        response = await client.get("/api/v1/research")
 
         assert response.status_code == 200
         # Returns empty list or default jobs
 
-    def test_delete_job_not_found(self, client):
+    async def test_delete_job_not_found(self, client):
         """Test deleting a non-existent job returns 404."""
-        response = client.delete("/api/v1/research/nonexistent-job-id")
+        response = await client.delete("/api/v1/research/nonexistent-job-id")
 
         assert response.status_code == 404
 
-    def test_delete_job_success(self, client):
+    async def test_delete_job_success(self, client):
         """Test deleting a job successfully."""
         # First create a job
-        with patch("src.api.routes.research._run_research_workflow"):
-            submit_response = client.post(
-                "/api/v1/research",
-                json={"topic": "Test topic"},
-            )
+        submit_response = await client.post(
+            "/api/v1/research",
+            json={"topic": "Test topic"},
+        )
 
         job_id = submit_response.json()["job_id"]
 
         # Now delete it
-        response = client.delete(f"/api/v1/research/{job_id}")
+        response = await client.delete(f"/api/v1/research/{job_id}")
 
         assert response.status_code == 204
 
 
+class TestAsyncRoutes:
+    """Tests that request handling stays on the event loop."""
+
+    @staticmethod
+    def _iter_dependencies(dependant):
+        for dependency in dependant.dependencies:
+            yield dependency
+            yield from TestAsyncRoutes._iter_dependencies(dependency)
+
+    def test_all_endpoints_are_coroutines(self):
+        """Test that sync endpoints are never offloaded to the threadpool."""
+        for route in app.routes:
+            if isinstance(route, APIRoute):
+                assert inspect.iscoroutinefunction(route.endpoint), route.path
+
+    def test_all_dependencies_are_coroutines(self):
+        """Test that no `Depends(def ...)` spills into the threadpool."""
+        for route in app.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            for dependency in self._iter_dependencies(route.dependant):
+                assert inspect.iscoroutinefunction(dependency.call), route.path
+
+
 class TestCORSHeaders:
     """Tests for CORS configuration."""
 
-    def test_cors_headers_present(self, client):
-        """Test that CORS headers are present in response."""
-        response = client.options(
+    async def test_cors_headers_present(self, client):
+        """Test that a CORS preflight is answered with CORS headers."""
+        response = await client.options(
             "/api/v1/health",
-            headers={"Origin": "http://localhost:3000"},
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+            },
         )
 
-        # Should have CORS headers
-        assert (
-            "access-control-allow-origin" in response.headers
-            or response.status_code == 200
-        )
+        assert response.status_code == 200
+        assert "access-control-allow-origin" in response.headers
 
 
 class TestAPIEndpointsWithMockedWorkflow:
     """Tests for research endpoints with mocked workflow results."""
 
-    def test_get_completed_job_with_results(self, client):
+    async def test_get_completed_job_with_results(self, client):
         """Test getting a completed job with full results."""
         # First create and complete a job
-        with patch("src.api.routes.research._run_research_workflow"):
-            submit_response = client.post(
-                "/api/v1/research",
-                json={"topic": "Test topic"},
-            )
+        submit_response = await client.post(
+            "/api/v1/research",
+            json={"topic": "Test topic"},
+        )
 
         job_id = submit_response.json()["job_id"]
 
@@ -209,11 +257,10 @@ class TestAPIEndpointsWithMockedWorkflow:
             iterations=1,
         )
 
-        research._jobs[job_id]["result"] = result
-        research._jobs[job_id]["status"] = JobStatus.COMPLETED
+        research._update_job(job_id, result=result, status=JobStatus.COMPLETED)
 
         # Now get the completed job
-        response = client.get(f"/api/v1/research/{job_id}")
+        response = await client.get(f"/api/v1/research/{job_id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -222,25 +269,25 @@ class TestAPIEndpointsWithMockedWorkflow:
         assert data["sources"] is not None
         assert data["report_title"] == "Test Report"
 
-    def test_get_failed_job_with_error(self, client):
+    async def test_get_failed_job_with_error(self, client):
         """Test getting a failed job returns error info."""
         # First create a job
-        with patch("src.api.routes.research._run_research_workflow"):
-            submit_response = client.post(
-                "/api/v1/research",
-                json={"topic": "Test topic"},
-            )
+        submit_response = await client.post(
+            "/api/v1/research",
+            json={"topic": "Test topic"},
+        )
 
         job_id = submit_response.json()["job_id"]
 
         # Manually mark as failed
         from src.api.routes import research
 
-        research._jobs[job_id]["status"] = JobStatus.FAILED
-        research._jobs[job_id]["error"] = "Connection timeout"
+        research._update_job(
+            job_id, status=JobStatus.FAILED, error="Connection timeout"
+        )
 
         # Now get the failed job
-        response = client.get(f"/api/v1/research/{job_id}")
+        response = await client.get(f"/api/v1/research/{job_id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -1,24 +1,76 @@
 """Workflow configuration integration tests."""
 
-from unittest.mock import AsyncMock, patch
-
 import pytest
 
-from src.domain.events import (
-    FactCheckCompleted,
-    ReportReviewed,
-    ReportWritten,
-    ResearchCompleted,
-    SynthesisCompleted,
+from src.domain.events import ReportReviewed, ReportWritten, SynthesisCompleted
+from src.domain.interfaces import AgentContext
+from src.orchestration.workflow import ResearchWorkflow, WorkflowResult, WorkflowStage
+
+_LONG_TOPIC = (
+    "What are the latest developments in renewable energy technology, particularly "
+    "focusing on solar panel efficiency improvements and energy storage solutions in 2024?"
 )
-from src.orchestration.workflow import ResearchWorkflow, WorkflowStage
+
+# Downstream stage outputs shared by every mocked run
+_SYNTH_EVENT = SynthesisCompleted.create(insights=["insight"], resolved_contradictions=[])
+_WRITE_EVENT = ReportWritten.create(title="Report", content="Content", format="markdown")
+_REVIEW_EVENT = ReportReviewed.create(suggestions=[], score=0.9, approved=True)
+
+
+class _AsyncReturn:
+    """Awaitable stand-in for an agent method that always returns ``value``.
+
+    None of these tests inspect calls, so AsyncMock's bookkeeping is skipped.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value=None):
+        self.value = value
+
+    async def __call__(self, *args, **kwargs):
+        return self.value
+
+
+# Agent stubs shared by every mocked run; research and fact-check values are
+# set per test from the canned_* fixtures
+_RESEARCH_STUB = _AsyncReturn()
+_FACT_CHECK_STUB = _AsyncReturn()
+_SYNTH_STUB = _AsyncReturn(_SYNTH_EVENT)
+_WRITE_STUB = _AsyncReturn(_WRITE_EVENT)
+_REVIEW_STUB = _AsyncReturn(_REVIEW_EVENT)
+
+
+@pytest.fixture
+def mocked_workflow(swap, canned_research, canned_fact_check):
+    """Build a workflow whose five agent calls return canned events.
+
+    Agents are shared through the workflow's agent cache, so stubs go
+    through ``swap``, which drops the instance attribute again on exit;
+    ``monkeypatch`` would leave the bound method behind on the instance.
+    """
+    workflow = ResearchWorkflow(
+        max_iterations=1,
+        auto_approve_threshold=0.8,
+        llm_provider="ollama",
+        llm_model="llama3.2:3b",
+    )
+    _RESEARCH_STUB.value = canned_research()
+    _FACT_CHECK_STUB.value = canned_fact_check()
+    with (
+        swap(workflow.researcher, "research", _RESEARCH_STUB),
+        swap(workflow.fact_checker, "verify_claims", _FACT_CHECK_STUB),
+        swap(workflow.synthesizer, "synthesize", _SYNTH_STUB),
+        swap(workflow.writer, "write_report", _WRITE_STUB),
+        swap(workflow.critic, "review", _REVIEW_STUB),
+    ):
+        yield workflow
 
 
 class TestWorkflowCustomConfiguration:
     """Test workflow with custom configuration parameters."""
 
-    @pytest.mark.asyncio
-    async def test_workflow_with_custom_max_iterations(self):
+    def test_workflow_with_custom_max_iterations(self):
         """Test workflow respects custom max_iterations setting."""
         # Create workflow with 5 iterations
         workflow = ResearchWorkflow(
@@ -31,8 +83,7 @@ class TestWorkflowCustomConfiguration:
         assert workflow.max_iterations == 5
         assert workflow.auto_approve_threshold == 1.0
 
-    @pytest.mark.asyncio
-    async def test_workflow_with_custom_approval_threshold(self):
+    def test_workflow_with_custom_approval_threshold(self):
         """Test workflow respects custom auto_approve_threshold."""
         workflow = ResearchWorkflow(
             max_iterations=3,
@@ -43,348 +94,105 @@ class TestWorkflowCustomConfiguration:
 
         assert workflow.auto_approve_threshold == 0.7
 
-    @pytest.mark.asyncio
     async def test_workflow_with_zero_iterations(self):
-        """Test workflow with max_iterations=0."""
+        """Test max_iterations=0 skips review and leaves the report as written."""
         workflow = ResearchWorkflow(
             max_iterations=0,
             auto_approve_threshold=0.8,
             llm_provider="ollama",
             llm_model="llama3.2:3b",
         )
+        result = WorkflowResult(status=WorkflowStage.REVIEW, report=_WRITE_EVENT)
+
+        await workflow._review(result, AgentContext.create())
 
-        assert workflow.max_iterations == 0
-
-        with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-        ):
-
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[],
-                confidence_scores={},
-            )
-            mock_synth.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Report", content="Content", format="markdown"
-            )
-
-            result = await workflow.execute_sequential("test topic")
-
-            assert result.status == WorkflowStage.COMPLETED
+        assert result.iterations == 0
+        assert result.review is None
+        assert result.report is _WRITE_EVENT
 
 
 class TestWorkflowAgentConfiguration:
     """Test workflow agent initialization."""
 
-    @pytest.mark.asyncio
-    async def test_workflow_initializes_all_agents(self):
+    def test_workflow_initializes_all_agents(self, ollama_workflow):
         """Verify all agents are initialized in workflow."""
-        workflow = ResearchWorkflow(
-            max_iterations=1,
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
         # Verify all agents exist
-        assert workflow.researcher is not None
-        assert workflow.fact_checker is not None
-        assert workflow.synthesizer is not None
-        assert workflow.writer is not None
-        assert workflow.critic is not None
-
-    @pytest.mark.asyncio
-    async def test_workflow_agents_have_correct_names(self):
-        """Verify agents have expected names."""
-        workflow = ResearchWorkflow(
-            max_iterations=1,
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
+        assert ollama_workflow.researcher is not None
+        assert ollama_workflow.fact_checker is not None
+        assert ollama_workflow.synthesizer is not None
+        assert ollama_workflow.writer is not None
+        assert ollama_workflow.critic is not None
 
-        assert workflow.researcher.name == "researcher"
-        assert workflow.fact_checker.name == "fact_checker"
-        assert workflow.synthesizer.name == "synthesizer"
-        assert workflow.writer.name == "writer"
-        assert workflow.critic.name == "critic"
+    def test_workflow_agents_have_correct_names(self, ollama_workflow):
+        """Verify agents have expected names."""
+        assert ollama_workflow.researcher.name == "researcher"
+        assert ollama_workflow.fact_checker.name == "fact_checker"
+        assert ollama_workflow.synthesizer.name == "synthesizer"
+        assert ollama_workflow.writer.name == "writer"
+        assert ollama_workflow.critic.name == "critic"
 
-    @pytest.mark.asyncio
-    async def test_workflow_agents_have_descriptions(self):
+    def test_workflow_agents_have_descriptions(self, ollama_workflow):
         """Verify agents have descriptions."""
-        workflow = ResearchWorkflow(
-            max_iterations=1,
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
-        assert len(workflow.researcher.description) > 0
-        assert len(workflow.fact_checker.description) > 0
-        assert len(workflow.synthesizer.description) > 0
-        assert len(workflow.writer.description) > 0
-        assert len(workflow.critic.description) > 0
+        assert len(ollama_workflow.researcher.description) > 0
+        assert len(ollama_workflow.fact_checker.description) > 0
+        assert len(ollama_workflow.synthesizer.description) > 0
+        assert len(ollama_workflow.writer.description) > 0
+        assert len(ollama_workflow.critic.description) > 0
 
 
 class TestWorkflowModelConfiguration:
     """Test workflow LLM model configuration."""
 
-    @pytest.mark.asyncio
-    async def test_workflow_stores_model_name(self):
+    def test_workflow_stores_model_name(self, ollama_workflow):
         """Verify workflow stores the LLM model name."""
-        workflow = ResearchWorkflow(
-            max_iterations=1,
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
-        assert workflow.llm_model == "llama3.2:3b"
+        assert ollama_workflow.llm_model == "llama3.2:3b"
 
-    @pytest.mark.asyncio
-    async def test_workflow_stores_provider_name(self):
+    def test_workflow_stores_provider_name(self, ollama_workflow):
         """Verify workflow stores the LLM provider name."""
-        workflow = ResearchWorkflow(
-            max_iterations=1,
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
-        assert workflow.llm_provider == "ollama"
+        assert ollama_workflow.llm_provider == "ollama"
 
 
 class TestWorkflowExecutionValidation:
     """Test workflow execution with various inputs."""
 
-    @pytest.mark.asyncio
-    async def test_workflow_accepts_simple_topic(self):
-        """Test workflow accepts a simple string topic."""
-        workflow = ResearchWorkflow(
-            max_iterations=1,
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
-        with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
-        ):
-
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[],
-                confidence_scores={},
-            )
-            mock_synth.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Report", content="Content", format="markdown"
-            )
-            mock_review.return_value = ReportReviewed.create(
-                suggestions=[], score=0.9, approved=True
-            )
-
-            result = await workflow.execute("test topic")
-
-            assert result.status == WorkflowStage.COMPLETED
-
-    @pytest.mark.asyncio
-    async def test_workflow_accepts_long_topic(self):
-        """Test workflow accepts a longer research topic."""
-        workflow = ResearchWorkflow(
-            max_iterations=1,
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
-        long_topic = "What are the latest developments in renewable energy technology, particularly focusing on solar panel efficiency improvements and energy storage solutions in 2024?"
-
-        with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
-        ):
-
-            mock_research.return_value = ResearchCompleted.create(
-                topic=long_topic,
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[],
-                confidence_scores={},
-            )
-            mock_synth.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Report", content="Content", format="markdown"
-            )
-            mock_review.return_value = ReportReviewed.create(
-                suggestions=[], score=0.9, approved=True
-            )
-
-            result = await workflow.execute(long_topic)
-
-            assert result.status == WorkflowStage.COMPLETED
-            assert result.research.topic == long_topic
-
-    @pytest.mark.asyncio
-    async def test_workflow_accepts_optional_correlation_id(self):
-        """Test workflow accepts optional correlation_id parameter."""
-        workflow = ResearchWorkflow(
-            max_iterations=1,
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
-        with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
-        ):
-
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[],
-                confidence_scores={},
-            )
-            mock_synth.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Report", content="Content", format="markdown"
-            )
-            mock_review.return_value = ReportReviewed.create(
-                suggestions=[], score=0.9, approved=True
-            )
-
-            # Test with custom correlation ID
-            result = await workflow.execute(
-                "test topic", correlation_id="custom-correlation-123"
-            )
-
-            assert result.status == WorkflowStage.COMPLETED
-
-            # Test without correlation ID
-            result2 = await workflow.execute("test topic")
-            assert result2.status == WorkflowStage.COMPLETED
+    @pytest.mark.parametrize(
+        ("topic", "correlation_id", "method"),
+        [
+            pytest.param("test topic", None, "execute", id="simple-topic"),
+            pytest.param(_LONG_TOPIC, None, "execute", id="long-topic"),
+            pytest.param(
+                "test topic", "custom-correlation-123", "execute", id="custom-correlation-id"
+            ),
+            pytest.param("test topic", None, "execute_sequential", id="sequential"),
+        ],
+    )
+    async def test_workflow_accepts_topic(
+        self, mocked_workflow, canned_research, topic, correlation_id, method
+    ):
+        """Test workflow runs to completion for each topic and entry point."""
+        mocked_workflow.researcher.research.value = canned_research(topic)
+
+        run = getattr(mocked_workflow, method)
+        result = await run(topic, correlation_id=correlation_id)
+
+        assert result.status == WorkflowStage.COMPLETED
+        assert result.research.topic == topic
 
 
 class TestWorkflowDefaultValues:
     """Test workflow default configuration values."""
 
-    def test_workflow_default_max_iterations(self):
-        """Verify default max_iterations is 3."""
-        workflow = ResearchWorkflow(
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
-        assert workflow.max_iterations == 3
-
-    def test_workflow_default_approval_threshold(self):
-        """Verify default auto_approve_threshold is 0.8."""
-        workflow = ResearchWorkflow(
-            max_iterations=3,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
-        assert workflow.auto_approve_threshold == 0.8
-
-    def test_workflow_default_provider(self):
-        """Verify default LLM provider is openai."""
-        workflow = ResearchWorkflow(
-            max_iterations=3,
-            auto_approve_threshold=0.8,
-        )
-
-        assert workflow.llm_provider == "openai"
-
-    def test_workflow_default_model(self):
-        """Verify default LLM model is gpt-4o."""
-        workflow = ResearchWorkflow(
-            max_iterations=3,
-            auto_approve_threshold=0.8,
-            llm_provider="openai",
-        )
-
-        assert workflow.llm_model == "gpt-4o"
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("max_iterations", 3),
+            ("auto_approve_threshold", 0.8),
+            ("llm_provider", "openai"),
+            ("llm_model", "gpt-4o"),
+        ],
+    )
+    def test_workflow_default(self, attr, expected):
+        """Verify each setting defaults as documented."""
+        workflow = ResearchWorkflow()
+
+        assert getattr(workflow, attr) == expected
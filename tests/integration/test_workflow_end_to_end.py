@@ -1,9 +1,13 @@
 """End-to-end workflow integration tests."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.agents.factchecker import FactCheckerAgent
+from src.agents.researcher import ResearcherAgent
+from src.agents.synthesizer import SynthesizerAgent
+from src.agents.writer import WriterAgent
 from src.domain.events import (
     FactCheckCompleted,
     ReportReviewed,
@@ -11,433 +15,145 @@ from src.domain.events import (
     ResearchCompleted,
     SynthesisCompleted,
 )
-from src.orchestration.workflow import ResearchWorkflow, WorkflowStage
+from src.orchestration.workflow import WorkflowStage
 
+# Tests here share module-scoped fixtures and event loop; keep them on one
+# xdist worker so those are built once. Other modules spread per test.
+pytestmark = pytest.mark.xdist_group("workflow_e2e")
 
-class TestFullWorkflowExecution:
-    """Test the complete multi-agent workflow execution."""
-
-    @pytest.fixture
-    def ollama_config(self):
-        """Use Ollama local model for testing."""
-        return {
-            "llm_provider": "ollama",
-            "llm_model": "llama3.2:3b",
-            "max_iterations": 1,
-            "auto_approve_threshold": 0.8,
-        }
-
-    @pytest.fixture
-    def sample_research_completed(self):
-        """Sample research completed event."""
-        return ResearchCompleted.create(
-            topic="quantum computing applications",
-            sources=[
-                {
-                    "url": "https://example.com/quantum",
-                    "title": "Quantum Computing Overview",
-                    "date": "2024-01-01",
-                }
-            ],
-            findings=[
-                "Quantum computers use qubits instead of classical bits",
-                "Quantum superposition allows qubits to represent multiple states",
-                "Quantum entanglement enables instant communication between qubits",
-            ],
-        )
-
-    @pytest.fixture
-    def sample_fact_check_completed(self):
-        """Sample fact-check completed event."""
-        return FactCheckCompleted.create(
-            claims=[
-                {
-                    "text": "Quantum computers use qubits instead of classical bits",
-                    "status": "verified",
-                },
-                {
-                    "text": "Quantum superposition allows qubits to represent multiple states",
-                    "status": "verified",
-                },
-                {
-                    "text": "Quantum entanglement enables instant communication between qubits",
-                    "status": "partially_verified",
-                },
-            ],
-            verified_claims=[
-                {
-                    "text": "Quantum computers use qubits instead of classical bits",
-                    "status": "verified",
-                }
-            ],
-            confidence_scores={
-                "Quantum computers use qubits instead of classical bits": 0.95,
-                "Quantum superposition allows qubits to represent multiple states": 0.90,
-                "Quantum entanglement enables instant communication between qubits": 0.70,
-            },
-        )
-
-    @pytest.fixture
-    def sample_synthesis_completed(self):
-        """Sample synthesis completed event."""
-        return SynthesisCompleted.create(
-            insights=[
-                "Quantum computing represents a paradigm shift in computation",
-                "Key applications include cryptography, drug discovery, and optimization",
-                "Current hardware challenges include error correction and scalability",
-            ],
-            resolved_contradictions=[
-                {
-                    "contradiction": "Quantum entanglement and instant communication",
-                    "resolution": "While entanglement exists, it cannot be used for faster-than-light communication",
-                }
-            ],
-        )
-
-    @pytest.fixture
-    def sample_report_written(self):
-        """Sample report written event."""
-        return ReportWritten.create(
-            title="Quantum Computing: A Comprehensive Overview",
-            content="# Quantum Computing\n\n## Introduction\n\nQuantum computing represents...",
-            format="markdown",
-        )
-
-    @pytest.fixture
-    def sample_report_approved(self):
-        """Sample report reviewed and approved."""
-        return ReportReviewed.create(
-            suggestions=["Consider adding more recent developments"],
-            score=0.85,
-            approved=True,
-        )
-
-    @pytest.mark.asyncio
-    async def test_workflow_status_progression(self, ollama_config):
-        """Test that workflow status progresses through all stages."""
-        workflow = ResearchWorkflow(
-            max_iterations=1,
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
-        # Mock all agent methods to avoid real LLM calls
-        with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synthesize,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
-        ):
-
-            # Setup mock returns
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test topic",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding 1", "finding 2"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[{"text": "test", "status": "verified"}],
-                confidence_scores={"test": 0.9},
-            )
-            mock_synthesize.return_value = SynthesisCompleted.create(
-                insights=["insight 1"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Test Report", content="Test content", format="markdown"
-            )
-            mock_review.return_value = ReportReviewed.create(
-                suggestions=[], score=0.9, approved=True
-            )
-
-            # Execute workflow
-            result = await workflow.execute("test topic")
-
-            # Verify status progression
-            assert result.status == WorkflowStage.COMPLETED
-            assert result.research is not None
-            assert result.fact_check is not None
-            assert result.synthesis is not None
-            assert result.report is not None
-            assert result.review is not None
-            assert result.error is None
-
-    @pytest.mark.asyncio
-    async def test_workflow_researcher_output_structure(self, ollama_config):
-        """Test that researcher output has correct structure."""
-        workflow = ResearchWorkflow(
-            max_iterations=1,
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
-        with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synthesize,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
-        ):
-
-            mock_research.return_value = ResearchCompleted.create(
-                topic="machine learning basics",
-                sources=[
-                    {
-                        "url": "https://example.com/ml",
-                        "title": "ML Guide",
-                        "date": "2024-01-01",
-                    }
-                ],
-                findings=[
-                    "Machine learning is a subset of AI",
-                    "Neural networks are inspired by biological brains",
-                ],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[{"text": "test", "status": "verified"}],
-                confidence_scores={"test": 0.9},
-            )
-            mock_synthesize.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="ML Report", content="ML content", format="markdown"
-            )
-            mock_review.return_value = ReportReviewed.create(
-                suggestions=[], score=0.9, approved=True
-            )
-
-            result = await workflow.execute("machine learning basics")
-
-            # Verify researcher output structure
-            assert result.research.topic == "machine learning basics"
-            assert len(result.research.sources) > 0
-            assert len(result.research.findings) > 0
-            assert "url" in result.research.sources[0]
-            assert "title" in result.research.sources[0]
-
-    @pytest.mark.asyncio
-    async def test_workflow_accumulates_iterations(self, ollama_config):
-        """Test that workflow tracks iteration count."""
-        workflow = ResearchWorkflow(
-            max_iterations=3,
-            auto_approve_threshold=0.9,  # High threshold to trigger iterations
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
-        with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synthesize,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
-        ):
+# Placeholder source; agents only read sources, so one dict is shared
+_EMPTY_SOURCE = {"url": "", "title": "", "date": ""}
 
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[{"text": "test", "status": "verified"}],
-                confidence_scores={"test": 0.9},
-            )
-            mock_synthesize.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Report", content="Content", format="markdown"
-            )
+# Stage outputs shared by the mocked runs
+_RESEARCH_EVENT = ResearchCompleted.create(
+    topic="test topic",
+    sources=[_EMPTY_SOURCE],
+    findings=["finding 1", "finding 2"],
+)
+_FACT_CHECK_EVENT = FactCheckCompleted.create(
+    claims=[{"text": "test", "status": "verified"}],
+    verified_claims=[{"text": "test", "status": "verified"}],
+    confidence_scores={"test": 0.9},
+)
+_SYNTH_EVENT = SynthesisCompleted.create(insights=["insight"], resolved_contradictions=[])
+_WRITE_EVENT = ReportWritten.create(title="Report", content="Content", format="markdown")
+_REVIEW_EVENT = ReportReviewed.create(suggestions=[], score=0.9, approved=True)
+_REJECTED_REVIEW = ReportReviewed.create(
+    suggestions=["Improve clarity"], score=0.6, approved=False
+)
+_FINAL_REVIEW = ReportReviewed.create(suggestions=["Good enough"], score=0.92, approved=True)
 
-            # Critic rejects first two times, approves on third
-            call_count = 0
-
-            async def mock_review_func(*args, **kwargs):
-                nonlocal call_count
-                call_count += 1
-                if call_count < 3:
-                    return ReportReviewed.create(
-                        suggestions=["Improve clarity"],
-                        score=0.6,
-                        approved=False,
-                    )
-                return ReportReviewed.create(
-                    suggestions=["Good enough"],
-                    score=0.92,
-                    approved=True,
-                )
-
-            mock_review.side_effect = mock_review_func
+# ((max_iterations, auto_approve_threshold), entry point, critic reviews in
+# order, expected review rounds)
+_SCENARIOS = [
+    pytest.param((1, 0.8), "execute", (_REVIEW_EVENT,), 1, id="approved-first-round"),
+    # High threshold: the critic rejects twice before approving
+    pytest.param(
+        (3, 0.9),
+        "execute",
+        (_REJECTED_REVIEW, _REJECTED_REVIEW, _FINAL_REVIEW),
+        3,
+        id="iterates-until-approved",
+    ),
+    # Low threshold: a 0.6 score auto-approves without explicit approval
+    pytest.param((3, 0.5), "execute", (_REJECTED_REVIEW,), 1, id="auto-approved"),
+    pytest.param((1, 0.8), "execute_sequential", (), 0, id="sequential"),
+]
 
-            result = await workflow.execute("test topic")
 
-            assert result.iterations == 3
-            assert result.status == WorkflowStage.COMPLETED
+@pytest.fixture
+def workflow(request, workflow_factory):
+    """Workflow under test; parametrize indirectly with ``(max_iterations, threshold)``."""
+    return workflow_factory(*getattr(request, "param", ()))
 
-    @pytest.mark.asyncio
-    async def test_sequential_workflow_execution(self, ollama_config):
-        """Test sequential workflow without critic iterations."""
-        workflow = ResearchWorkflow(
-            max_iterations=1,
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
 
-        with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synthesize,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-        ):
+def _make_async_const(value):
+    """Build an awaitable agent method that always returns ``value``."""
 
-            mock_research.return_value = ResearchCompleted.create(
-                topic="climate change",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding 1", "finding 2"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[{"text": "test", "status": "verified"}],
-                confidence_scores={"test": 0.9},
-            )
-            mock_synthesize.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Climate Report", content="Climate content", format="markdown"
-            )
+    async def const(*args, **kwargs):
+        return value
 
-            result = await workflow.execute_sequential("climate change")
+    return const
 
-            assert result.status == WorkflowStage.COMPLETED
-            assert result.research is not None
-            assert result.report is not None
-            assert result.review is None  # Sequential skips critic
 
-    @pytest.mark.asyncio
-    async def test_workflow_with_auto_approval(self, ollama_config):
-        """Test workflow auto-approval when score exceeds threshold."""
-        workflow = ResearchWorkflow(
-            max_iterations=3,
-            auto_approve_threshold=0.5,  # Low threshold
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
+@pytest.fixture
+def critic_review(workflow, swap):
+    """Stub the critic's review with an AsyncMock that approves by default.
 
-        with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synthesize,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
-        ):
+    Tests script its reviews through ``side_effect`` and check whether it ran.
+    """
+    with swap(workflow.critic, "review", AsyncMock(return_value=_REVIEW_EVENT)) as review:
+        yield review
 
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[{"text": "test", "status": "verified"}],
-                confidence_scores={"test": 0.9},
-            )
-            mock_synthesize.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Report", content="Content", format="markdown"
-            )
 
-            # Score below approval but above auto-approve threshold
-            mock_review.return_value = ReportReviewed.create(
-                suggestions=["Minor suggestions"],
-                score=0.6,  # Above 0.5 auto-approve threshold
-                approved=False,  # But not explicitly approved
-            )
+# Agents are mocked and nothing is loop-bound, so one loop serves the class
+@pytest.mark.asyncio(loop_scope="module")
+class TestFullWorkflowExecution:
+    """Test the complete multi-agent workflow execution."""
 
-            result = await workflow.execute("test topic")
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def _stub_agent_classes(cls):
+        """Stub research through writing on the agent classes once per class.
 
-            # Should auto-approve because score >= threshold
-            assert result.status == WorkflowStage.COMPLETED
-            assert result.iterations == 1
+        Methods are patched on the classes rather than the cached agent
+        instances, so every workflow built in the class sees the stubs.
+        """
+        stubs = [
+            (ResearcherAgent, "research", _RESEARCH_EVENT),
+            (FactCheckerAgent, "verify_claims", _FACT_CHECK_EVENT),
+            (SynthesizerAgent, "synthesize", _SYNTH_EVENT),
+            (WriterAgent, "write_report", _WRITE_EVENT),
+        ]
+        with pytest.MonkeyPatch.context() as mp:
+            for agent_cls, method, event in stubs:
+                mp.setattr(agent_cls, method, _make_async_const(event))
+            yield
+
+    @pytest.mark.parametrize(
+        ("workflow", "method", "reviews", "expected_iterations"),
+        _SCENARIOS,
+        indirect=["workflow"],
+    )
+    async def test_workflow_scenario(
+        self, workflow, critic_review, method, reviews, expected_iterations
+    ):
+        """Test a full run completes with the expected review rounds."""
+        critic_review.side_effect = reviews
+
+        result = await getattr(workflow, method)("test topic")
+
+        assert result.status == WorkflowStage.COMPLETED
+        assert result.error is None
+        assert result.iterations == expected_iterations
+        assert result.fact_check is not None
+        assert result.synthesis is not None
+        assert result.report is not None
+        # Researcher output flows through unchanged
+        assert result.research.topic == "test topic"
+        assert result.research.findings == ["finding 1", "finding 2"]
+        assert {"url", "title"} <= result.research.sources[0].keys()
+        if reviews:
+            assert result.review is reviews[-1]
+        else:
+            # Sequential runs skip the critic
+            assert result.review is None
+            critic_review.assert_not_awaited()
+
+
+# Runs the real fact-checker, so it sits outside the class-level agent stubs
+@pytest.mark.asyncio(loop_scope="module")
+class TestFactCheckCoverage:
+    """Test fact-check claim coverage within a full workflow run."""
 
-    @pytest.mark.asyncio
     async def test_fact_check_coverage_logic_when_llm_returns_fewer_claims(
-        self, ollama_config
+        self, workflow, swap
     ):
         """Test that fact-checker adds missing claims when LLM returns fewer than findings.
 
         This tests the _ensure_claims_coverage integration with the full _run method.
         When the LLM combines or misses findings, the fallback should add them.
         """
-        workflow = ResearchWorkflow(
-            max_iterations=1,
-            auto_approve_threshold=0.8,
-            llm_provider="ollama",
-            llm_model="llama3.2:3b",
-        )
-
         # Mock LLM that returns only 1 claim for 3 findings
         async def mock_ainvoke(messages):
             # Simulate LLM combining findings into 1 claim
@@ -446,23 +162,18 @@ class TestFullWorkflowExecution:
             )
 
         with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synthesize,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
+            swap(workflow.researcher, "research", AsyncMock()) as mock_research,
+            swap(workflow.synthesizer, "synthesize", AsyncMock()) as mock_synthesize,
+            swap(workflow.writer, "write_report", AsyncMock()) as mock_write,
+            swap(workflow.critic, "review", AsyncMock()) as mock_review,
+            # Override the LLM for fact-checker to return fewer claims; patched
+            # so the shared wrapper is restored for other tests
+            swap(workflow.fact_checker._llm, "ainvoke", AsyncMock(side_effect=mock_ainvoke)),
         ):
 
             mock_research.return_value = ResearchCompleted.create(
                 topic="test topic",
-                sources=[{"url": "", "title": "", "date": ""}],
+                sources=[_EMPTY_SOURCE],
                 findings=[
                     "Finding 1 about quantum computing",
                     "Finding 2 about superposition",
@@ -470,19 +181,9 @@ class TestFullWorkflowExecution:
                 ],
             )
 
-            # Override the LLM for fact-checker to return fewer claims
-            workflow.fact_checker._llm.ainvoke = AsyncMock(side_effect=mock_ainvoke)
-
-            mock_synthesize.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Report", content="Content", format="markdown"
-            )
-            mock_review.return_value = ReportReviewed.create(
-                suggestions=[], score=0.9, approved=True
-            )
+            mock_synthesize.return_value = _SYNTH_EVENT
+            mock_write.return_value = _WRITE_EVENT
+            mock_review.return_value = _REVIEW_EVENT
 
             result = await workflow.execute("test topic")
 
@@ -1,11 +1,8 @@
 """Workflow error handling integration tests."""
 
-from unittest.mock import AsyncMock, patch
-
-import pytest
+from unittest.mock import AsyncMock
 
 from src.domain.events import (
-    FactCheckCompleted,
     ReportReviewed,
     ReportWritten,
     ResearchCompleted,
@@ -16,11 +13,15 @@ from src.infrastructure.circuit_breaker import CircuitOpenError
 from src.orchestration.workflow import ResearchWorkflow, WorkflowStage
 
 
+# Downstream stage outputs shared by the mocked runs
+_SYNTH_EVENT = SynthesisCompleted.create(insights=["insight"], resolved_contradictions=[])
+_WRITE_EVENT = ReportWritten.create(title="Report", content="Content", format="markdown")
+
+
 class TestWorkflowErrorHandling:
     """Test workflow behavior under error conditions."""
 
-    @pytest.mark.asyncio
-    async def test_workflow_handles_researcher_failure(self):
+    async def test_workflow_handles_researcher_failure(self, swap):
         """Verify workflow degrades gracefully when researcher fails."""
         workflow = ResearchWorkflow(
             max_iterations=1,
@@ -29,9 +30,7 @@ class TestWorkflowErrorHandling:
             llm_model="llama3.2:3b",
         )
 
-        with patch.object(
-            workflow.researcher, "research", new_callable=AsyncMock
-        ) as mock_research:
+        with swap(workflow.researcher, "research", AsyncMock()) as mock_research:
             # Simulate researcher failure
             mock_research.side_effect = Exception("Web search failed")
 
@@ -45,8 +44,7 @@ class TestWorkflowErrorHandling:
             assert result.research is None
             assert result.fact_check is None
 
-    @pytest.mark.asyncio
-    async def test_workflow_handles_factchecker_failure(self):
+    async def test_workflow_handles_factchecker_failure(self, canned_research, swap):
         """Verify workflow handles fact-checker failure gracefully."""
         workflow = ResearchWorkflow(
             max_iterations=1,
@@ -56,19 +54,11 @@ class TestWorkflowErrorHandling:
         )
 
         with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
+            swap(workflow.researcher, "research", AsyncMock()) as mock_research,
+            swap(workflow.fact_checker, "verify_claims", AsyncMock()) as mock_factcheck,
         ):
 
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
+            mock_research.return_value = canned_research()
             mock_factcheck.side_effect = Exception("Fact-check service unavailable")
 
             result = await workflow.execute("test topic")
@@ -79,8 +69,9 @@ class TestWorkflowErrorHandling:
             assert result.research is not None
             assert result.fact_check is None
 
-    @pytest.mark.asyncio
-    async def test_workflow_handles_synthesizer_failure(self):
+    async def test_workflow_handles_synthesizer_failure(
+        self, canned_research, canned_fact_check, swap
+    ):
         """Verify workflow handles synthesizer failure."""
         workflow = ResearchWorkflow(
             max_iterations=1,
@@ -90,27 +81,13 @@ class TestWorkflowErrorHandling:
         )
 
         with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
+            swap(workflow.researcher, "research", AsyncMock()) as mock_research,
+            swap(workflow.fact_checker, "verify_claims", AsyncMock()) as mock_factcheck,
+            swap(workflow.synthesizer, "synthesize", AsyncMock()) as mock_synth,
         ):
 
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[],
-                confidence_scores={},
-            )
+            mock_research.return_value = canned_research()
+            mock_factcheck.return_value = canned_fact_check()
             mock_synth.side_effect = Exception("Synthesis timeout")
 
             result = await workflow.execute("test topic")
@@ -120,8 +97,7 @@ class TestWorkflowErrorHandling:
             assert result.research is not None
             assert result.fact_check is not None
 
-    @pytest.mark.asyncio
-    async def test_workflow_handles_writer_failure(self):
+    async def test_workflow_handles_writer_failure(self, canned_research, canned_fact_check, swap):
         """Verify workflow handles writer failure."""
         workflow = ResearchWorkflow(
             max_iterations=1,
@@ -131,34 +107,15 @@ class TestWorkflowErrorHandling:
         )
 
         with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
+            swap(workflow.researcher, "research", AsyncMock()) as mock_research,
+            swap(workflow.fact_checker, "verify_claims", AsyncMock()) as mock_factcheck,
+            swap(workflow.synthesizer, "synthesize", AsyncMock()) as mock_synth,
+            swap(workflow.writer, "write_report", AsyncMock()) as mock_write,
         ):
 
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[],
-                confidence_scores={},
-            )
-            mock_synth.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
+            mock_research.return_value = canned_research()
+            mock_factcheck.return_value = canned_fact_check()
+            mock_synth.return_value = _SYNTH_EVENT
             mock_write.side_effect = Exception("Writer LLM error")
 
             result = await workflow.execute("test topic")
@@ -167,8 +124,7 @@ class TestWorkflowErrorHandling:
             assert "Writer LLM error" in result.error
             assert result.synthesis is not None
 
-    @pytest.mark.asyncio
-    async def test_workflow_captures_partial_results_on_failure(self):
+    async def test_workflow_captures_partial_results_on_failure(self, canned_fact_check, swap):
         """Verify that partial results are captured even on failure."""
         workflow = ResearchWorkflow(
             max_iterations=1,
@@ -178,15 +134,9 @@ class TestWorkflowErrorHandling:
         )
 
         with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
+            swap(workflow.researcher, "research", AsyncMock()) as mock_research,
+            swap(workflow.fact_checker, "verify_claims", AsyncMock()) as mock_factcheck,
+            swap(workflow.synthesizer, "synthesize", AsyncMock()) as mock_synth,
         ):
 
             mock_research.return_value = ResearchCompleted.create(
@@ -196,11 +146,7 @@ class TestWorkflowErrorHandling:
                 ],
                 findings=["finding 1", "finding 2", "finding 3"],
             )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[],
-                confidence_scores={},
-            )
+            mock_factcheck.return_value = canned_fact_check()
             # Synthesizer fails
             mock_synth.side_effect = Exception("Unexpected error")
 
@@ -217,8 +163,7 @@ class TestWorkflowErrorHandling:
 class TestWorkflowLLMErrors:
     """Test workflow behavior under LLM error conditions."""
 
-    @pytest.mark.asyncio
-    async def test_workflow_handles_rate_limit_error(self):
+    async def test_workflow_handles_rate_limit_error(self, swap):
         """Verify workflow correctly reports rate limit errors."""
         workflow = ResearchWorkflow(
             max_iterations=1,
@@ -228,21 +173,11 @@ class TestWorkflowLLMErrors:
         )
 
         with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
+            swap(workflow.researcher, "research", AsyncMock()) as mock_research,
+            swap(workflow.fact_checker, "verify_claims", AsyncMock()) as mock_factcheck,
+            swap(workflow.synthesizer, "synthesize", AsyncMock()) as mock_synth,
+            swap(workflow.writer, "write_report", AsyncMock()) as mock_write,
+            swap(workflow.critic, "review", AsyncMock()) as mock_review,
         ):
 
             # Simulate rate limit error
@@ -255,8 +190,7 @@ class TestWorkflowLLMErrors:
             assert result.error is not None
             assert "Rate limit" in result.error
 
-    @pytest.mark.asyncio
-    async def test_workflow_handles_circuit_breaker_open(self):
+    async def test_workflow_handles_circuit_breaker_open(self, swap):
         """Verify workflow handles circuit breaker open state."""
         workflow = ResearchWorkflow(
             max_iterations=1,
@@ -266,21 +200,11 @@ class TestWorkflowLLMErrors:
         )
 
         with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
+            swap(workflow.researcher, "research", AsyncMock()) as mock_research,
+            swap(workflow.fact_checker, "verify_claims", AsyncMock()) as mock_factcheck,
+            swap(workflow.synthesizer, "synthesize", AsyncMock()) as mock_synth,
+            swap(workflow.writer, "write_report", AsyncMock()) as mock_write,
+            swap(workflow.critic, "review", AsyncMock()) as mock_review,
         ):
 
             # Simulate circuit breaker open
@@ -296,8 +220,7 @@ class TestWorkflowLLMErrors:
 class TestWorkflowIterationsLimit:
     """Test workflow iteration limits."""
 
-    @pytest.mark.asyncio
-    async def test_max_iterations_enforced_strictly(self):
+    async def test_max_iterations_enforced_strictly(self, canned_research, canned_fact_check, swap):
         """Verify max iterations is strictly enforced."""
         workflow = ResearchWorkflow(
             max_iterations=2,
@@ -307,40 +230,17 @@ class TestWorkflowIterationsLimit:
         )
 
         with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
+            swap(workflow.researcher, "research", AsyncMock()) as mock_research,
+            swap(workflow.fact_checker, "verify_claims", AsyncMock()) as mock_factcheck,
+            swap(workflow.synthesizer, "synthesize", AsyncMock()) as mock_synth,
+            swap(workflow.writer, "write_report", AsyncMock()) as mock_write,
+            swap(workflow.critic, "review", AsyncMock()) as mock_review,
         ):
 
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[],
-                confidence_scores={},
-            )
-            mock_synth.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Report", content="Content", format="markdown"
-            )
+            mock_research.return_value = canned_research()
+            mock_factcheck.return_value = canned_fact_check()
+            mock_synth.return_value = _SYNTH_EVENT
+            mock_write.return_value = _WRITE_EVENT
 
             # Critic always rejects
             mock_review.return_value = ReportReviewed.create(
@@ -356,8 +256,9 @@ class TestWorkflowIterationsLimit:
             assert result.status == WorkflowStage.COMPLETED
             # Even though not approved, it completes due to max iterations
 
-    @pytest.mark.asyncio
-    async def test_iteration_zero_with_sequential_workflow(self):
+    async def test_iteration_zero_with_sequential_workflow(
+        self, canned_research, canned_fact_check, swap
+    ):
         """Verify sequential workflow has zero iterations."""
         workflow = ResearchWorkflow(
             max_iterations=3,
@@ -367,37 +268,16 @@ class TestWorkflowIterationsLimit:
         )
 
         with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
+            swap(workflow.researcher, "research", AsyncMock()) as mock_research,
+            swap(workflow.fact_checker, "verify_claims", AsyncMock()) as mock_factcheck,
+            swap(workflow.synthesizer, "synthesize", AsyncMock()) as mock_synth,
+            swap(workflow.writer, "write_report", AsyncMock()) as mock_write,
         ):
 
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[],
-                confidence_scores={},
-            )
-            mock_synth.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Report", content="Content", format="markdown"
-            )
+            mock_research.return_value = canned_research()
+            mock_factcheck.return_value = canned_fact_check()
+            mock_synth.return_value = _SYNTH_EVENT
+            mock_write.return_value = _WRITE_EVENT
 
             result = await workflow.execute_sequential("test topic")
 
@@ -409,7 +289,6 @@ class TestWorkflowIterationsLimit:
 class TestWorkflowRecovery:
     """Test workflow recovery and continuation."""
 
-    @pytest.mark.asyncio
     async def test_workflow_preserves_correlation_id_in_context(self):
         """Verify correlation ID is passed to agent context correctly."""
 
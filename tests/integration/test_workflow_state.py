@@ -1,8 +1,6 @@
 """Workflow state management integration tests."""
 
-from unittest.mock import AsyncMock, patch
-
-import pytest
+from unittest.mock import AsyncMock
 
 from src.domain.events import (
     FactCheckCompleted,
@@ -15,10 +13,15 @@ from src.domain.interfaces import AgentContext
 from src.orchestration.workflow import ResearchWorkflow, WorkflowResult, WorkflowStage
 
 
+# Downstream stage outputs shared by the mocked runs
+_SYNTH_EVENT = SynthesisCompleted.create(insights=["insight"], resolved_contradictions=[])
+_WRITE_EVENT = ReportWritten.create(title="Report", content="Content", format="markdown")
+_REVIEW_EVENT = ReportReviewed.create(suggestions=[], score=0.9, approved=True)
+
+
 class TestWorkflowResultState:
     """Test WorkflowResult state accumulation."""
 
-    @pytest.mark.asyncio
     async def test_workflow_result_initial_state(self):
         """Test WorkflowResult has correct initial state."""
         result = WorkflowResult(status=WorkflowStage.RESEARCH)
@@ -32,24 +35,15 @@ class TestWorkflowResultState:
         assert result.error is None
         assert result.iterations == 0
 
-    @pytest.mark.asyncio
-    async def test_workflow_result_accumulates_all_stages(self):
+    async def test_workflow_result_accumulates_all_stages(self, canned_research, canned_fact_check):
         """Test WorkflowResult correctly accumulates results from all stages."""
         result = WorkflowResult(status=WorkflowStage.COMPLETED)
 
         # Add research result
-        result.research = ResearchCompleted.create(
-            topic="test topic",
-            sources=[{"url": "", "title": "", "date": ""}],
-            findings=["finding 1", "finding 2"],
-        )
+        result.research = canned_research("test topic", ("finding 1", "finding 2"))
 
         # Add fact-check result
-        result.fact_check = FactCheckCompleted.create(
-            claims=[{"text": "test", "status": "verified"}],
-            verified_claims=[],
-            confidence_scores={},
-        )
+        result.fact_check = canned_fact_check()
 
         # Add synthesis result
         result.synthesis = SynthesisCompleted.create(
@@ -91,7 +85,6 @@ class TestWorkflowResultState:
         assert result.review.approved is True
         assert result.iterations == 1
 
-    @pytest.mark.asyncio
     async def test_workflow_result_error_state(self):
         """Test WorkflowResult correctly stores error state."""
         result = WorkflowResult(
@@ -128,8 +121,7 @@ class TestWorkflowStageProgression:
         assert WorkflowStage.COMPLETED.value == "completed"
         assert WorkflowStage.FAILED.value == "failed"
 
-    @pytest.mark.asyncio
-    async def test_stage_progression_in_workflow(self):
+    async def test_stage_progression_in_workflow(self, canned_research, canned_fact_check, swap):
         """Test that workflow status progresses through all stages."""
         workflow = ResearchWorkflow(
             max_iterations=1,
@@ -139,43 +131,18 @@ class TestWorkflowStageProgression:
         )
 
         with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
+            swap(workflow.researcher, "research", AsyncMock()) as mock_research,
+            swap(workflow.fact_checker, "verify_claims", AsyncMock()) as mock_factcheck,
+            swap(workflow.synthesizer, "synthesize", AsyncMock()) as mock_synth,
+            swap(workflow.writer, "write_report", AsyncMock()) as mock_write,
+            swap(workflow.critic, "review", AsyncMock()) as mock_review,
         ):
 
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[],
-                confidence_scores={},
-            )
-            mock_synth.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Report", content="Content", format="markdown"
-            )
-            mock_review.return_value = ReportReviewed.create(
-                suggestions=[], score=0.9, approved=True
-            )
+            mock_research.return_value = canned_research()
+            mock_factcheck.return_value = canned_fact_check()
+            mock_synth.return_value = _SYNTH_EVENT
+            mock_write.return_value = _WRITE_EVENT
+            mock_review.return_value = _REVIEW_EVENT
 
             result = await workflow.execute("test topic")
 
@@ -186,7 +153,6 @@ class TestWorkflowStageProgression:
 class TestCorrelationIdPropagation:
     """Test correlation ID tracking through the workflow."""
 
-    @pytest.mark.asyncio
     async def test_correlation_id_set_from_context(self):
         """Verify correlation ID is properly set from context."""
         context = AgentContext.create(correlation_id="test-correlation-abc")
@@ -196,7 +162,6 @@ class TestCorrelationIdPropagation:
         assert context.request_id == ""
         assert context.metadata == {}
 
-    @pytest.mark.asyncio
     async def test_events_preserve_correlation_id(self):
         """Verify domain events preserve correlation ID."""
         correlation_id = "research-session-123"
@@ -241,8 +206,9 @@ class TestCorrelationIdPropagation:
         assert report.correlation_id == correlation_id
         assert review.correlation_id == correlation_id
 
-    @pytest.mark.asyncio
-    async def test_workflow_generates_correlation_id_if_not_provided(self):
+    async def test_workflow_generates_correlation_id_if_not_provided(
+        self, canned_research, canned_fact_check, swap
+    ):
         """Verify workflow generates correlation ID if not provided."""
         workflow = ResearchWorkflow(
             max_iterations=1,
@@ -252,43 +218,18 @@ class TestCorrelationIdPropagation:
         )
 
         with (
-            patch.object(
-                workflow.researcher, "research", new_callable=AsyncMock
-            ) as mock_research,
-            patch.object(
-                workflow.fact_checker, "verify_claims", new_callable=AsyncMock
-            ) as mock_factcheck,
-            patch.object(
-                workflow.synthesizer, "synthesize", new_callable=AsyncMock
-            ) as mock_synth,
-            patch.object(
-                workflow.writer, "write_report", new_callable=AsyncMock
-            ) as mock_write,
-            patch.object(
-                workflow.critic, "review", new_callable=AsyncMock
-            ) as mock_review,
+            swap(workflow.researcher, "research", AsyncMock()) as mock_research,
+            swap(workflow.fact_checker, "verify_claims", AsyncMock()) as mock_factcheck,
+            swap(workflow.synthesizer, "synthesize", AsyncMock()) as mock_synth,
+            swap(workflow.writer, "write_report", AsyncMock()) as mock_write,
+            swap(workflow.critic, "review", AsyncMock()) as mock_review,
         ):
 
-            mock_research.return_value = ResearchCompleted.create(
-                topic="test",
-                sources=[{"url": "", "title": "", "date": ""}],
-                findings=["finding"],
-            )
-            mock_factcheck.return_value = FactCheckCompleted.create(
-                claims=[{"text": "test", "status": "verified"}],
-                verified_claims=[],
-                confidence_scores={},
-            )
-            mock_synth.return_value = SynthesisCompleted.create(
-                insights=["insight"],
-                resolved_contradictions=[],
-            )
-            mock_write.return_value = ReportWritten.create(
-                title="Report", content="Content", format="markdown"
-            )
-            mock_review.return_value = ReportReviewed.create(
-                suggestions=[], score=0.9, approved=True
-            )
+            mock_research.return_value = canned_research()
+            mock_factcheck.return_value = canned_fact_check()
+            mock_synth.return_value = _SYNTH_EVENT
+            mock_write.return_value = _WRITE_EVENT
+            mock_review.return_value = _REVIEW_EVENT
 
             # Execute without providing correlation ID
             result = await workflow.execute("test topic")
@@ -301,7 +242,6 @@ class TestCorrelationIdPropagation:
 class TestWorkflowResultDataclass:
     """Test WorkflowResult dataclass behavior."""
 
-    @pytest.mark.asyncio
     async def test_workflow_result_is_immutable(self):
         """Test that WorkflowResult fields can be updated."""
         result = WorkflowResult(status=WorkflowStage.RESEARCH)
@@ -313,7 +253,6 @@ class TestWorkflowResultDataclass:
         assert result.status == WorkflowStage.COMPLETED
         assert result.iterations == 5
 
-    @pytest.mark.asyncio
     async def test_workflow_result_default_values(self):
         """Test WorkflowResult has correct default values."""
         result = WorkflowResult(status=WorkflowStage.FAILED)
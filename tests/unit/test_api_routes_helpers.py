@@ -2,10 +2,20 @@
 
 import pytest
 
+from src.api.models.response import JobStatus, ResearchSource
 from src.api.routes.research import (
+    _NUM_SHARDS,
+    _convert_workflow_result,
+    _get_job,
+    _iter_jobs,
     _map_workflow_stage_to_progress,
+    _pop_job,
+    _put_job,
+    _shard_index,
+    _update_job,
 )
-from src.orchestration.workflow import WorkflowStage
+from src.domain.events import FactCheckCompleted, ResearchCompleted
+from src.orchestration.workflow import WorkflowResult, WorkflowStage
 
 
 class TestMapWorkflowStageToProgress:
@@ -60,3 +70,81 @@ class TestMapWorkflowStageToProgress:
         stage, progress = _map_workflow_stage_to_progress(None)  # type: ignore
         assert stage == "unknown"
         assert progress == 0
+
+
+class TestConvertWorkflowResult:
+    """Tests for _convert_workflow_result helper function."""
+
+    def test_completed_result(self):
+        """Test conversion of a completed workflow result."""
+        result = WorkflowResult(
+            status=WorkflowStage.COMPLETED,
+            research=ResearchCompleted.create(
+                topic="AI",
+                sources=[{"title": "Source", "url": "https://example.com"}],
+                findings=["Finding 1"],
+            ),
+            fact_check=FactCheckCompleted.create(
+                claims=[
+                    {"text": "A", "status": "verified"},
+                    {"text": "B", "status": "disputed"},
+                    {"text": "C", "status": "verified"},
+                ],
+                verified_claims=[],
+                confidence_scores={},
+            ),
+        )
+
+        response = _convert_workflow_result("job-1", result)
+
+        assert response.job_id == "job-1"
+        assert response.status == JobStatus.COMPLETED
+        assert response.topic == "AI"
+        assert response.sources == [
+            ResearchSource(title="Source", url="https://example.com")
+        ]
+        assert response.findings == ["Finding 1"]
+        assert response.claims_verified == 2
+        assert response.claims_disputed == 1
+        assert response.claims_partially_verified == 0
+        assert response.report_title is None
+
+    def test_failed_result(self):
+        """Test conversion of a failed workflow result."""
+        result = WorkflowResult(status=WorkflowStage.FAILED, error="boom")
+
+        response = _convert_workflow_result("job-2", result)
+
+        assert response.status == JobStatus.FAILED
+        assert response.error == "boom"
+        assert response.current_stage == "failed"
+        assert response.progress_percentage == 100
+
+
+class TestShardedJobStore:
+    """Tests for the sharded in-memory job store helpers."""
+
+    def test_shard_index_in_range(self):
+        """Test shard index is stable and within bounds."""
+        for job_id in ("a", "job-1", "123e4567-e89b-12d3-a456-426614174000"):
+            idx = _shard_index(job_id)
+            assert 0 <= idx < _NUM_SHARDS
+            assert _shard_index(job_id) == idx
+
+    def test_put_update_get_pop(self):
+        """Test a job record round-trips through the store."""
+        _put_job("shard-test", {"status": JobStatus.PENDING})
+        _update_job("shard-test", status=JobStatus.PROCESSING, progress_percentage=20)
+
+        job = _get_job("shard-test")
+        assert job == {"status": JobStatus.PROCESSING, "progress_percentage": 20}
+        assert ("shard-test", job) in _iter_jobs()
+
+        assert _pop_job("shard-test") is job
+        assert _get_job("shard-test") is None
+        assert _pop_job("shard-test") is None
+
+    def test_update_missing_job_is_noop(self):
+        """Test updating a deleted job does not raise."""
+        _update_job("missing-job", status=JobStatus.FAILED)
+        assert _get_job("missing-job") is None
@@ -1,5 +1,7 @@
 """Unit tests for circuit breaker implementation."""
 
+import asyncio
+
 import pytest
 
 from src.infrastructure.circuit_breaker import (
@@ -8,9 +10,75 @@ from src.infrastructure.circuit_breaker import (
     CircuitBreakerRegistry,
     CircuitOpenError,
     CircuitState,
+    CircuitStats,
+    CircuitTimeoutError,
+    RedisCircuitBreakerStore,
+    StateSnapshot,
+    _HALF_OPEN,
+    to_datetime,
 )
 
 
+class InMemoryStore:
+    """Circuit breaker store shared between breakers in one test."""
+
+    def __init__(self):
+        self.snapshots: dict[str, StateSnapshot] = {}
+
+    async def get(self, name):
+        return self.snapshots.get(name)
+
+    async def record(self, name, snapshot):
+        self.snapshots[name] = snapshot
+
+
+class FakeRedis:
+    """Minimal async Redis hash client."""
+
+    def __init__(self):
+        self.data: dict[str, dict[str, str]] = {}
+        self.expiry: dict[str, int] = {}
+
+    async def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    async def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    async def expire(self, key, seconds):
+        self.expiry[key] = seconds
+
+
+class TestCircuitStats:
+    """Tests for CircuitStats class."""
+
+    def test_initial_values(self):
+        """Test stats start empty."""
+        stats = CircuitStats()
+        assert stats.total_calls == 0
+        assert stats.last_failure_monotonic is None
+        assert stats.failure_rate == 0.0
+
+    def test_uses_slots(self):
+        """Test stats instances have no per-instance __dict__."""
+        stats = CircuitStats()
+        assert not hasattr(stats, "__dict__")
+        with pytest.raises(AttributeError):
+            stats.unknown = 1  # type: ignore[attr-defined]
+
+    def test_to_datetime(self):
+        """Test monotonic timestamps convert to UTC datetimes for display."""
+        import time
+        from datetime import UTC, datetime, timedelta
+
+        assert to_datetime(None) is None
+        converted = to_datetime(time.monotonic() - 60)
+        assert converted is not None
+        assert converted.tzinfo == UTC
+        expected = datetime.now(UTC) - timedelta(seconds=60)
+        assert abs((converted - expected).total_seconds()) < 1
+
+
 class TestCircuitBreakerConfig:
     """Tests for CircuitBreakerConfig class."""
 
@@ -35,10 +103,22 @@ class TestCircuitBreakerConfig:
         assert config.cooldown_seconds == 60.0
         assert config.timeout_seconds == 120.0
 
+    def test_config_is_read_only(self):
+        """Test config is frozen and carries no per-instance __dict__."""
+        config = CircuitBreakerConfig()
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.failure_threshold = 1
+
 
 class TestCircuitBreaker:
     """Tests for CircuitBreaker class."""
 
+    def test_breaker_uses_slots(self):
+        """Test breakers carry no per-instance __dict__."""
+        cb = CircuitBreaker("test")
+        assert not hasattr(cb, "__dict__")
+
     def test_initial_state_closed(self):
         """Test that circuit breaker starts in CLOSED state."""
         cb = CircuitBreaker("test")
@@ -60,6 +140,19 @@ class TestCircuitBreaker:
         assert cb.stats.successful_calls == 0
         assert cb.stats.failed_calls == 1
 
+    def test_record_failure_reads_clock_once(self, monkeypatch):
+        """Test a failure stamps stats and open time from one clock read."""
+        from src.infrastructure import circuit_breaker
+
+        readings = iter([100.0, 200.0])
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: next(readings))
+
+        cb = CircuitBreaker("test", config=CircuitBreakerConfig(failure_threshold=1))
+        cb.record_failure()
+
+        assert cb.stats.last_failure_monotonic == 100.0
+        assert cb._opened_at == 100.0
+
     def test_opens_after_failure_threshold(self):
         """Test that circuit opens after failure threshold is reached."""
         config = CircuitBreakerConfig(failure_threshold=3)
@@ -75,6 +168,47 @@ class TestCircuitBreaker:
         cb = CircuitBreaker("test")
         assert cb.allow_request() is True
 
+    def test_allow_request_closed_skips_clock(self, monkeypatch):
+        """Test the CLOSED fast path never reads the clock."""
+        from src.infrastructure import circuit_breaker
+
+        def fail():
+            raise AssertionError("clock read on CLOSED fast path")
+
+        cb = CircuitBreaker("test")
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", fail)
+
+        assert cb.allow_request() is True
+        assert cb.state == CircuitState.CLOSED
+
+    def test_state_change_callback_receives_enums(self):
+        """Test integer state codes are mapped back to CircuitState at the boundary."""
+        changes = []
+        config = CircuitBreakerConfig(failure_threshold=1)
+        cb = CircuitBreaker(
+            "test",
+            config=config,
+            on_state_change=lambda name, old, new: changes.append((old, new)),
+        )
+        cb.record_failure()
+
+        assert changes == [(CircuitState.CLOSED, CircuitState.OPEN)]
+        assert cb.state is CircuitState.OPEN
+
+    def test_transition_to_same_state_is_noop(self):
+        """Test a no-op transition skips logging and the callback."""
+        from src.infrastructure.circuit_breaker import _OPEN
+
+        changes = []
+        config = CircuitBreakerConfig(failure_threshold=1)
+        cb = CircuitBreaker(
+            "test", config=config, on_state_change=lambda *args: changes.append(args)
+        )
+        cb.record_failure()
+
+        assert cb._transition_to(_OPEN, expected=_OPEN) is False
+        assert len(changes) == 1
+
     def test_blocks_request_when_open(self):
         """Test that requests are blocked when circuit is open."""
         config = CircuitBreakerConfig(failure_threshold=1)
@@ -97,6 +231,23 @@ class TestCircuitBreaker:
         # Should now be half-open
         assert cb.state == CircuitState.HALF_OPEN
 
+    def test_cooldown_uses_monotonic_clock(self, monkeypatch):
+        """Test that cooldown is measured with the monotonic clock."""
+        from src.infrastructure import circuit_breaker
+
+        now = [1000.0]
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+
+        config = CircuitBreakerConfig(failure_threshold=1, cooldown_seconds=30.0)
+        cb = CircuitBreaker("test", config=config)
+        cb.record_failure()  # Opens the circuit
+
+        now[0] += 29.0
+        assert cb.state == CircuitState.OPEN
+
+        now[0] += 2.0
+        assert cb.state == CircuitState.HALF_OPEN
+
     def test_closes_after_success_threshold_in_half_open(self):
         """Test that circuit closes after success threshold in half-open."""
         config = CircuitBreakerConfig(
@@ -134,12 +285,51 @@ class TestCircuitBreaker:
 
         # Immediately record failure without waiting for cooldown
         # This simulates failure while in half-open state
-        cb._state = CircuitState.HALF_OPEN  # Force half-open state
+        cb._state_int = _HALF_OPEN  # Force half-open state
         cb.record_failure()
 
         # Should be open again
         assert cb.state == CircuitState.OPEN
 
+    def test_half_open_caps_concurrent_probes(self):
+        """Test only success_threshold probes are admitted while HALF_OPEN."""
+        config = CircuitBreakerConfig(failure_threshold=1, success_threshold=2)
+        cb = CircuitBreaker("test", config=config)
+        cb._state_int = _HALF_OPEN
+
+        first = cb.acquire()
+        assert first is not None
+        assert cb.acquire() is not None
+        assert cb.acquire() is None
+        assert cb.allow_request() is False
+
+        first.release()
+        first.release()  # a second release is a no-op
+        assert cb.acquire() is not None
+        assert cb.acquire() is None
+
+    def test_closed_calls_release_no_probe_slots(self):
+        """Test slots from calls admitted while CLOSED free nothing after a reopen."""
+        config = CircuitBreakerConfig(failure_threshold=1, success_threshold=1)
+        cb = CircuitBreaker("test", config=config)
+        closed_slot = cb.acquire()
+        cb._state_int = _HALF_OPEN
+
+        assert cb.acquire() is not None
+        closed_slot.release()
+        assert cb.acquire() is None
+
+    def test_snapshot(self):
+        """Test snapshot returns state and last failure time together."""
+        cb = CircuitBreaker("test", config=CircuitBreakerConfig(failure_threshold=1))
+        assert cb.snapshot() == (CircuitState.CLOSED, None)
+
+        cb.record_failure()
+        state, last_failure = cb.snapshot()
+
+        assert state is CircuitState.OPEN
+        assert last_failure == cb.stats.last_failure_monotonic
+
     def test_failure_rate_calculation(self):
         """Test failure rate calculation."""
         cb = CircuitBreaker("test")
@@ -165,7 +355,25 @@ class TestCircuitBreaker:
         assert callback_calls[0][1] == CircuitState.CLOSED
         assert callback_calls[0][2] == CircuitState.OPEN
 
-    @pytest.mark.asyncio
+    def test_concurrent_failures_open_circuit_once(self):
+        """Test that racing failures transition and notify exactly once."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        callback_calls = []
+        config = CircuitBreakerConfig(failure_threshold=1)
+        cb = CircuitBreaker(
+            "test",
+            config=config,
+            on_state_change=lambda *args: callback_calls.append(args),
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(64):
+                executor.submit(cb.record_failure)
+
+        assert cb.state == CircuitState.OPEN
+        assert callback_calls == [("test", CircuitState.CLOSED, CircuitState.OPEN)]
+
     async def test_call_success(self):
         """Test successful async call through circuit breaker."""
         cb = CircuitBreaker("test")
@@ -177,7 +385,6 @@ class TestCircuitBreaker:
         assert result == "success"
         assert cb.stats.successful_calls == 1
 
-    @pytest.mark.asyncio
     async def test_call_failure(self):
         """Test that failure is recorded when coroutine raises."""
         cb = CircuitBreaker("test")
@@ -190,7 +397,6 @@ class TestCircuitBreaker:
 
         assert cb.stats.failed_calls == 1
 
-    @pytest.mark.asyncio
     async def test_call_blocks_when_open(self):
         """Test that calls are blocked when circuit is open."""
         config = CircuitBreakerConfig(failure_threshold=1)
@@ -204,12 +410,91 @@ class TestCircuitBreaker:
             await cb.call(dummy_coro)
 
 
+    async def test_call_timeout_records_failure(self):
+        """Test a slow coroutine raises CircuitTimeoutError and counts as failure."""
+        cb = CircuitBreaker("test", config=CircuitBreakerConfig(timeout_seconds=0.01))
+
+        async def slow_coro():
+            await asyncio.sleep(1)
+
+        with pytest.raises(CircuitTimeoutError):
+            await cb.call(slow_coro)
+
+        assert cb.stats.failed_calls == 1
+
+class TestSharedCircuitState:
+    """Tests for sharing circuit state across replicas via a store."""
+
+    async def test_open_propagates_to_other_replica(self):
+        """Test a replica rejects requests once another replica opens."""
+        import asyncio
+
+        store = InMemoryStore()
+        config = CircuitBreakerConfig(failure_threshold=1)
+        replica_a = CircuitBreaker("llm", config=config, store=store)
+        replica_b = CircuitBreaker("llm", config=config, store=store, store_cache_ttl=0)
+
+        replica_a.record_failure()
+        await asyncio.sleep(0)  # let the fire-and-forget publish run
+        assert store.snapshots["llm"].state == CircuitState.OPEN
+
+        replica_b.allow_request()  # schedules a refresh
+        await asyncio.sleep(0)
+        assert replica_b.allow_request() is False
+        assert replica_b.state == CircuitState.CLOSED
+
+    async def test_remote_snapshot_cached_for_ttl(self):
+        """Test the store is read at most once per cache TTL."""
+        import asyncio
+
+        store = InMemoryStore()
+        reads = []
+        original_get = store.get
+
+        async def counting_get(name):
+            reads.append(name)
+            return await original_get(name)
+
+        store.get = counting_get
+        cb = CircuitBreaker("llm", store=store, store_cache_ttl=60)
+
+        for _ in range(10):
+            assert cb.allow_request() is True
+            await asyncio.sleep(0)
+
+        assert reads == ["llm"]
+
+    def test_sync_caller_without_loop(self):
+        """Test breakers with a store still work outside an event loop."""
+        cb = CircuitBreaker(
+            "llm", config=CircuitBreakerConfig(failure_threshold=1), store=InMemoryStore()
+        )
+
+        assert cb.allow_request() is True
+        cb.record_failure()
+        assert cb.allow_request() is False
+
+    async def test_redis_store_round_trip(self):
+        """Test Redis store serializes snapshots to a hash with expiry."""
+        client = FakeRedis()
+        store = RedisCircuitBreakerStore(client=client, ttl_seconds=30)
+
+        assert await store.get("llm") is None
+
+        await store.record("llm", StateSnapshot(CircuitState.OPEN, opened_at=123.5))
+        assert await store.get("llm") == StateSnapshot(CircuitState.OPEN, 123.5)
+        assert client.expiry["veritas:circuit:llm"] == 30
+
+        await store.record("llm", StateSnapshot(CircuitState.CLOSED))
+        assert await store.get("llm") == StateSnapshot(CircuitState.CLOSED, None)
+
+
 class TestCircuitBreakerRegistry:
     """Tests for CircuitBreakerRegistry class."""
 
     def teardown_method(self):
         """Clear registry after each test."""
-        CircuitBreakerRegistry._breakers.clear()
+        CircuitBreakerRegistry.clear()
 
     def test_get_or_create(self):
         """Test getting or creating a circuit breaker."""
@@ -234,12 +519,15 @@ class TestCircuitBreakerRegistry:
         """Test resetting a circuit breaker."""
         cb = CircuitBreakerRegistry.get_or_create("test")
         cb.record_failure()
+        cb._state_int = _HALF_OPEN
+        assert cb.acquire() is not None
 
         result = CircuitBreakerRegistry.reset("test")
 
         assert result is True
         assert cb.state == CircuitState.CLOSED
         assert cb._failure_count == 0
+        assert cb._half_open_probes == 0
 
     def test_all_states(self):
         """Test getting all circuit breaker states."""
@@ -251,3 +539,25 @@ class TestCircuitBreakerRegistry:
         assert "test1" in states
         assert "test2" in states
         assert len(states) == 2
+
+    def test_concurrent_get_or_create_returns_single_breaker(self):
+        """Test that racing creators for one name share a single breaker."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            breakers = list(
+                executor.map(
+                    lambda _: CircuitBreakerRegistry.get_or_create("shared"), range(64)
+                )
+            )
+
+        assert all(b is breakers[0] for b in breakers)
+
+    def test_clear(self):
+        """Test clearing the registry removes all breakers."""
+        CircuitBreakerRegistry.get_or_create("test1")
+
+        CircuitBreakerRegistry.clear()
+
+        assert CircuitBreakerRegistry.get("test1") is None
+        assert CircuitBreakerRegistry.all_states() == {}
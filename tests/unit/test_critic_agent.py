@@ -32,7 +32,6 @@ class TestCriticAgent:
             agent._llm = mock_llm
             agent._name = "critic"
             agent._description = "Reviews reports for clarity, logic, and completeness"
-            agent._correlation_id = None
             return agent
 
     def test_agent_name(self, critic_agent):
@@ -44,7 +43,6 @@ class TestCriticAgent:
         assert "clarity" in critic_agent.description.lower()
         assert "logic" in critic_agent.description.lower()
 
-    @pytest.mark.asyncio
     async def test_validate_input_accepts_report_written(self, critic_agent):
         """Test that validate_input accepts ReportWritten events."""
         report = ReportWritten.create(
@@ -54,7 +52,6 @@ class TestCriticAgent:
         )
         assert await critic_agent.validate_input(report) is True
 
-    @pytest.mark.asyncio
     async def test_validate_input_rejects_other_types(self, critic_agent):
         """Test that validate_input rejects non-ReportWritten inputs."""
         assert await critic_agent.validate_input("string") is False
@@ -62,7 +59,6 @@ class TestCriticAgent:
         assert await critic_agent.validate_input(None) is False
         assert await critic_agent.validate_input({}) is False
 
-    @pytest.mark.asyncio
     async def test_review_method_exists(self, critic_agent):
         """Test that review convenience method exists."""
         assert hasattr(critic_agent, "review")
@@ -98,10 +94,8 @@ class TestCriticAgentRun:
             agent._llm = mock_llm
             agent._name = "critic"
             agent._description = ""
-            agent._correlation_id = None
             return agent
 
-    @pytest.mark.asyncio
     async def test_run_parses_valid_json_response(self, critic_agent, agent_context):
         """Test that _run correctly parses valid JSON response."""
         report = ReportWritten.create(
@@ -117,7 +111,33 @@ class TestCriticAgentRun:
         assert result.approved is True
         assert result.correlation_id == agent_context.correlation_id
 
-    @pytest.mark.asyncio
+    async def test_run_accepts_json_outside_strict_range(self, mock_llm, agent_context):
+        """Test NaN and integers beyond 64 bits parse rather than hit the fallback."""
+        mock_llm.ainvoke = AsyncMock(
+            return_value=MagicMock(
+                content='{"suggestions": [], "score": 0.9, "approved": true, '
+                '"confidence": NaN, "id": 18446744073709551616}'
+            )
+        )
+
+        with patch("src.agents.critic.BaseAgent.__init__", return_value=None):
+            agent = CriticAgent()
+            agent._llm = mock_llm
+            agent._name = "critic"
+            agent._description = ""
+
+            report = ReportWritten.create(
+                title="Test Report",
+                content="Test content",
+                format="markdown",
+            )
+
+            result = await agent._run(report, agent_context)
+
+            assert result.suggestions == []
+            assert result.score == 0.9
+            assert result.approved is True
+
     async def test_run_handles_invalid_json_with_fallback(
         self, mock_llm, agent_context
     ):
@@ -131,7 +151,6 @@ class TestCriticAgentRun:
             agent._llm = mock_llm
             agent._name = "critic"
             agent._description = ""
-            agent._correlation_id = None
 
             report = ReportWritten.create(
                 title="Test Report",
@@ -167,7 +186,6 @@ class TestCriticAgentIntegration:
         """Create a test agent context."""
         return AgentContext.create(correlation_id="integration-test-id")
 
-    @pytest.mark.asyncio
     async def test_full_review_flow(self, mock_llm, agent_context):
         """Test complete review flow from execute to result."""
         with patch("src.agents.critic.BaseAgent.__init__", return_value=None):
@@ -175,7 +193,6 @@ class TestCriticAgentIntegration:
             agent._llm = mock_llm
             agent._name = "critic"
             agent._description = ""
-            agent._correlation_id = None
 
             report = ReportWritten.create(
                 title="Annual Report 2024",
@@ -191,7 +208,6 @@ class TestCriticAgentIntegration:
             assert result.approved is True
             assert result.correlation_id == "integration-test-id"
 
-    @pytest.mark.asyncio
     async def test_review_with_low_score(self, mock_llm, agent_context):
         """Test review that results in low quality score."""
 
@@ -207,7 +223,6 @@ class TestCriticAgentIntegration:
             agent._llm = mock_llm
             agent._name = "critic"
             agent._description = ""
-            agent._correlation_id = None
 
             report = ReportWritten.create(
                 title="Draft Report",
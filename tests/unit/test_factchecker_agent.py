@@ -32,7 +32,6 @@ class TestFactCheckerAgent:
             agent._llm = mock_llm
             agent._name = "fact_checker"
             agent._description = "Verifies claims and assigns confidence scores"
-            agent._correlation_id = None
             return agent
 
     def test_agent_name(self, fact_check_agent):
@@ -44,7 +43,6 @@ class TestFactCheckerAgent:
         assert "verifies" in fact_check_agent.description.lower()
         assert "confidence" in fact_check_agent.description.lower()
 
-    @pytest.mark.asyncio
     async def test_validate_input_accepts_research_completed(self, fact_check_agent):
         """Test that validate_input accepts ResearchCompleted events."""
         research = ResearchCompleted.create(
@@ -54,14 +52,12 @@ class TestFactCheckerAgent:
         )
         assert await fact_check_agent.validate_input(research) is True
 
-    @pytest.mark.asyncio
     async def test_validate_input_rejects_other_types(self, fact_check_agent):
         """Test that validate_input rejects non-ResearchCompleted inputs."""
         assert await fact_check_agent.validate_input("string") is False
         assert await fact_check_agent.validate_input(123) is False
         assert await fact_check_agent.validate_input(None) is False
 
-    @pytest.mark.asyncio
     async def test_verify_claims_method_exists(self, fact_check_agent):
         """Test that verify_claims convenience method exists."""
         assert hasattr(fact_check_agent, "verify_claims")
@@ -98,10 +94,8 @@ class TestFactCheckerAgentRun:
             agent._llm = mock_llm
             agent._name = "fact_checker"
             agent._description = ""
-            agent._correlation_id = None
             return agent
 
-    @pytest.mark.asyncio
     async def test_run_parses_valid_json_response(
         self, fact_check_agent, agent_context
     ):
@@ -126,7 +120,6 @@ class TestFactCheckerAgentRun:
         assert result.confidence_scores.get("Claim 1") == 0.9
         assert result.correlation_id == agent_context.correlation_id
 
-    @pytest.mark.asyncio
     async def test_run_handles_invalid_json_with_fallback(
         self, mock_llm, agent_context
     ):
@@ -140,7 +133,6 @@ class TestFactCheckerAgentRun:
             agent._llm = mock_llm
             agent._name = "fact_checker"
             agent._description = ""
-            agent._correlation_id = None
 
             research = ResearchCompleted.create(
                 topic="Test",
@@ -384,7 +376,6 @@ class TestFactCheckerAgentIntegration:
         """Create a test agent context."""
         return AgentContext.create(correlation_id="integration-test-id")
 
-    @pytest.mark.asyncio
     async def test_full_verify_claims_flow(self, mock_llm, agent_context):
         """Test complete verification flow from execute to result."""
         with patch("src.agents.factchecker.BaseAgent.__init__", return_value=None):
@@ -392,7 +383,6 @@ class TestFactCheckerAgentIntegration:
             agent._llm = mock_llm
             agent._name = "fact_checker"
             agent._description = ""
-            agent._correlation_id = None
 
             research = ResearchCompleted.create(
                 topic="Basic Facts",
@@ -410,7 +400,6 @@ class TestFactCheckerAgentIntegration:
             assert len(result.claims) == 2
             assert result.correlation_id == "integration-test-id"
 
-    @pytest.mark.asyncio
     async def test_verify_claims_with_custom_claims(self, mock_llm, agent_context):
         """Test verify_claims convenience method with custom inputs."""
         with patch("src.agents.factchecker.BaseAgent.__init__", return_value=None):
@@ -418,7 +407,6 @@ class TestFactCheckerAgentIntegration:
             agent._llm = mock_llm
             agent._name = "fact_checker"
             agent._description = ""
-            agent._correlation_id = None
 
             claims = ["Claim 1", "Claim 2"]
             sources = [{"url": "http://test.com", "title": "Test"}]
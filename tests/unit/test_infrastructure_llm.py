@@ -28,6 +28,95 @@ class TestLLMFactories:
         llm = get_openrouter_llm()
         assert llm is not None
 
+    @patch("src.infrastructure.llm.settings")
+    def test_openai_compatible_clients_share_http_pool(self, mock_settings):
+        """Test OpenAI and OpenRouter clients share one httpx pool."""
+        mock_settings.openai_api_key = "openai-key"
+        mock_settings.openrouter_api_key = "router-key"
+
+        from src.infrastructure import llm
+
+        openai_llm = llm.get_openai_llm(model="gpt-4o-mini")
+        router_llm = llm.get_openrouter_llm()
+
+        http_client, http_async_client = llm._shared_http_clients()
+        assert openai_llm.http_client is http_client
+        assert router_llm.http_client is http_client
+        assert openai_llm.http_async_client is http_async_client
+        assert router_llm.http_async_client is http_async_client
+
+    @patch("src.infrastructure.llm.settings")
+    async def test_aclose_http_clients_closes_shared_pools(self, mock_settings):
+        """Test closing the shared pools drops clients built on them."""
+        mock_settings.openai_api_key = "openai-key"
+
+        from src.infrastructure import llm
+
+        before = llm.get_openai_llm(model="gpt-4o-mini")
+        http_client, http_async_client = llm._shared_http_clients()
+
+        await llm.aclose_http_clients()
+
+        assert http_client.is_closed
+        assert http_async_client.is_closed
+        after = llm.get_openai_llm(model="gpt-4o-mini")
+        assert after is not before
+        assert after.http_async_client is not http_async_client
+        assert not after.http_async_client.is_closed
+
+    @patch("src.infrastructure.llm.settings")
+    def test_openai_http_client_opt_out(self, mock_settings):
+        """Test a caller-supplied httpx client replaces the shared pool."""
+        import httpx
+
+        mock_settings.openai_api_key = "openai-key"
+
+        from src.infrastructure.llm import get_openai_llm
+
+        own_client = httpx.Client()
+        llm = get_openai_llm(http_client=own_client)
+
+        assert llm.http_client is own_client
+
+    def test_get_llm_dispatches_by_provider(self):
+        """Test get_llm routes through the provider table with OpenAI fallback."""
+        from src.infrastructure import llm
+
+        sentinel = MagicMock()
+        with patch.dict(llm._PROVIDERS, {"ollama": lambda **kwargs: sentinel}):
+            assert llm.get_llm("ollama") is sentinel
+
+    @patch("src.infrastructure.llm.settings")
+    def test_get_llm_unknown_provider_falls_back_to_openai(self, mock_settings):
+        """Test unknown providers fall back to the OpenAI client."""
+        from langchain_openai import ChatOpenAI
+
+        from src.infrastructure.llm import get_llm
+
+        mock_settings.openai_api_key = "openai-key"
+
+        assert isinstance(get_llm("unknown-provider"), ChatOpenAI)
+
+    def test_get_ollama_llm_reuses_client(self):
+        """Test identical configurations share one client instance."""
+        from src.infrastructure.llm import get_ollama_llm
+
+        first = get_ollama_llm(model="llama3.2:3b", temperature=0.1)
+        second = get_ollama_llm(model="llama3.2:3b", temperature=0.1)
+        other = get_ollama_llm(model="llama3.2:3b", temperature=0.2)
+
+        assert first is second
+        assert first is not other
+
+    def test_unhashable_kwargs_bypass_cache(self):
+        """Test configurations with unhashable values are built fresh."""
+        from src.infrastructure.llm import get_ollama_llm
+
+        first = get_ollama_llm(stop=["END"])
+        second = get_ollama_llm(stop=["END"])
+
+        assert first is not second
+
 
 class TestResilientLLMWrapper:
     """Tests for ResilientLLMWrapper class."""
@@ -56,7 +145,24 @@ class TestResilientLLMWrapper:
 
         assert wrapper._retry_config == RETRY_CONFIG_DEFAULT
 
-    @pytest.mark.asyncio
+    def test_retry_decorator_shared_across_wrappers(self, mock_llm):
+        """Test that wrappers with equal retry configs share one decorator."""
+        from src.config.retry import RetryConfig
+        from src.infrastructure.llm import ResilientLLMWrapper
+
+        first = ResilientLLMWrapper(
+            llm=mock_llm, retry_config=RetryConfig(max_attempts=2), use_tenacity=True
+        )
+        second = ResilientLLMWrapper(
+            llm=mock_llm, retry_config=RetryConfig(max_attempts=2), use_tenacity=True
+        )
+        other = ResilientLLMWrapper(
+            llm=mock_llm, retry_config=RetryConfig(max_attempts=3), use_tenacity=True
+        )
+
+        assert first._retry_decorator is second._retry_decorator
+        assert first._retry_decorator is not other._retry_decorator
+
     async def test_ainvoke_success(self, wrapper, mock_llm):
         """Test successful ainvoke call."""
         mock_llm.ainvoke = AsyncMock(return_value=MagicMock(content="test response"))
@@ -66,7 +172,166 @@ class TestResilientLLMWrapper:
         assert result.content == "test response"
         mock_llm.ainvoke.assert_called_once()
 
-    @pytest.mark.asyncio
+    async def test_ainvoke_retries_retryable_errors(self, mock_llm):
+        """Test the built-in retry loop retries rate limits with backoff."""
+        from src.config.retry import RetryConfig
+        from src.infrastructure.llm import ResilientLLMWrapper
+
+        mock_llm.ainvoke = AsyncMock(
+            side_effect=[Exception("rate limit hit"), MagicMock(content="ok")]
+        )
+        wrapper = ResilientLLMWrapper(
+            llm=mock_llm, retry_config=RetryConfig(max_attempts=3)
+        )
+
+        with patch("src.infrastructure.llm.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await wrapper.ainvoke(messages=["test"])
+
+        assert result.content == "ok"
+        assert mock_llm.ainvoke.await_count == 2
+        sleep.assert_awaited_once()
+
+    async def test_ainvoke_does_not_retry_non_retryable_errors(self, mock_llm):
+        """Test non-retryable errors propagate after a single attempt."""
+        from src.config.retry import RetryConfig
+        from src.infrastructure.llm import ResilientLLMWrapper
+
+        mock_llm.ainvoke = AsyncMock(side_effect=ValueError("bad request"))
+        wrapper = ResilientLLMWrapper(
+            llm=mock_llm, retry_config=RetryConfig(max_attempts=3)
+        )
+
+        with pytest.raises(ValueError):
+            await wrapper.ainvoke(messages=["test"])
+
+        assert mock_llm.ainvoke.await_count == 1
+
+    async def test_ainvoke_binds_tools_under_retry(self, mock_llm):
+        """Test tool-bound calls go through the same retry and circuit breaker."""
+        from src.config.retry import RetryConfig
+        from src.infrastructure.llm import ResilientLLMWrapper
+
+        bound = MagicMock()
+        bound.ainvoke = AsyncMock(
+            side_effect=[Exception("rate limit hit"), MagicMock(content="ok")]
+        )
+        mock_llm.bind_tools = MagicMock(return_value=bound)
+        wrapper = ResilientLLMWrapper(
+            llm=mock_llm, retry_config=RetryConfig(max_attempts=3)
+        )
+
+        with patch("src.infrastructure.llm.asyncio.sleep", new=AsyncMock()):
+            result = await wrapper.ainvoke(messages=["test"], tools=["tool"])
+
+        assert result.content == "ok"
+        mock_llm.bind_tools.assert_called_once_with(["tool"])
+        assert bound.ainvoke.await_count == 2
+        mock_llm.ainvoke.assert_not_called()
+        assert wrapper._circuit.stats.failed_calls == 1
+
+    async def test_ainvoke_records_outcomes_on_circuit(self, wrapper, mock_llm):
+        """Test successes and failures are reported to the circuit breaker."""
+        await wrapper.ainvoke(messages=["test"])
+        mock_llm.ainvoke = AsyncMock(side_effect=ValueError("bad request"))
+        with pytest.raises(ValueError):
+            await wrapper.ainvoke(messages=["test"])
+
+        stats = wrapper._circuit.stats
+        assert stats.successful_calls == 1
+        assert stats.failed_calls == 1
+
+    async def test_ainvoke_short_circuits_after_repeated_failures(self, mock_llm):
+        """Test a failing provider opens the circuit and blocks further calls."""
+        from src.infrastructure.circuit_breaker import (
+            CircuitBreakerConfig,
+            CircuitOpenError,
+        )
+        from src.infrastructure.llm import ResilientLLMWrapper
+
+        mock_llm.ainvoke = AsyncMock(side_effect=ValueError("bad request"))
+        wrapper = ResilientLLMWrapper(
+            llm=mock_llm, circuit_config=CircuitBreakerConfig(failure_threshold=2)
+        )
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await wrapper.ainvoke(messages=["test"])
+        with pytest.raises(CircuitOpenError):
+            await wrapper.ainvoke(messages=["test"])
+
+        assert mock_llm.ainvoke.await_count == 2
+
+    async def test_ainvoke_stops_retrying_once_circuit_opens(self, mock_llm):
+        """Test retries stop at the failure threshold instead of max_attempts."""
+        from src.config.retry import RetryConfig
+        from src.infrastructure.circuit_breaker import (
+            CircuitBreakerConfig,
+            CircuitOpenError,
+        )
+        from src.infrastructure.llm import ResilientLLMWrapper
+
+        mock_llm.ainvoke = AsyncMock(side_effect=Exception("rate limit hit"))
+        wrapper = ResilientLLMWrapper(
+            llm=mock_llm,
+            retry_config=RetryConfig(max_attempts=5),
+            circuit_config=CircuitBreakerConfig(failure_threshold=2),
+        )
+
+        with patch("src.infrastructure.llm.asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(CircuitOpenError):
+                await wrapper.ainvoke(messages=["test"])
+
+        assert mock_llm.ainvoke.await_count == 2
+
+    def test_invoke_sync_stops_retrying_once_circuit_opens(self, mock_llm):
+        """Test the blocking path also stops retrying at the failure threshold."""
+        from src.config.retry import RetryConfig
+        from src.infrastructure.circuit_breaker import (
+            CircuitBreakerConfig,
+            CircuitOpenError,
+        )
+        from src.infrastructure.llm import ResilientLLMWrapper
+
+        mock_llm.invoke.side_effect = Exception("rate limit hit")
+        wrapper = ResilientLLMWrapper(
+            llm=mock_llm,
+            retry_config=RetryConfig(max_attempts=5),
+            circuit_config=CircuitBreakerConfig(failure_threshold=2),
+        )
+
+        with patch("src.infrastructure.llm.time.sleep"):
+            with pytest.raises(CircuitOpenError):
+                wrapper.invoke_sync(messages=["test"])
+
+        assert mock_llm.invoke.call_count == 2
+
+    async def test_ainvoke_releases_its_probe_slot_once(self, mock_llm):
+        """Test a HALF_OPEN call frees only the probe slot it took."""
+        from src.infrastructure.circuit_breaker import _HALF_OPEN, CircuitBreakerConfig
+        from src.infrastructure.llm import ResilientLLMWrapper
+
+        wrapper = ResilientLLMWrapper(
+            llm=mock_llm, circuit_config=CircuitBreakerConfig(success_threshold=3)
+        )
+        circuit = wrapper._circuit
+        circuit._state_int = _HALF_OPEN
+        held = circuit.acquire()
+
+        await wrapper.ainvoke(messages=["test"])
+
+        assert circuit._half_open_probes == 1
+        held.release()
+        assert circuit._half_open_probes == 0
+
+    def test_fmt_mono(self):
+        """Test monotonic timestamps are formatted only for display."""
+        import time
+
+        from src.infrastructure.llm import _fmt_mono
+
+        assert _fmt_mono(None) == "n/a"
+        assert _fmt_mono(time.monotonic()).startswith("20")
+
     async def test_ainvoke_with_correlation_id(self, wrapper, mock_llm):
         """Test ainvoke with correlation ID."""
         mock_llm.ainvoke = AsyncMock(return_value=MagicMock(content="response"))
@@ -76,6 +341,127 @@ class TestResilientLLMWrapper:
         # Verify correlation ID is passed
         mock_llm.ainvoke.assert_called_once()
 
+    async def test_ainvoke_scopes_correlation_id_to_call(self, wrapper, mock_llm):
+        """Test ainvoke exposes the correlation ID via context only during the call."""
+        from src.infrastructure.logging import correlation_id_var
+
+        seen = []
+
+        async def capture(messages):
+            seen.append(correlation_id_var.get())
+            return MagicMock(content="response")
+
+        mock_llm.ainvoke = capture
+
+        await wrapper.ainvoke(messages=["test"], correlation_id="test-id")
+
+        assert seen == ["test-id"]
+        assert correlation_id_var.get() is None
+
+    async def test_ainvoke_keeps_caller_correlation_id(self, mock_llm):
+        """Test a context-provided ID wins over the wrapper default."""
+        from src.infrastructure.llm import ResilientLLMWrapper
+        from src.infrastructure.logging import correlation_id_var
+
+        seen = []
+
+        async def capture(messages):
+            seen.append(correlation_id_var.get())
+            return MagicMock(content="response")
+
+        mock_llm.ainvoke = capture
+        wrapper = ResilientLLMWrapper(llm=mock_llm, correlation_id="default-id")
+
+        await wrapper.ainvoke(messages=["test"])
+        token = correlation_id_var.set("caller-id")
+        try:
+            await wrapper.ainvoke(messages=["test"])
+        finally:
+            correlation_id_var.reset(token)
+
+        assert seen == ["default-id", "caller-id"]
+
+    async def test_ainvoke_logs_lazily_formatted_success(self, wrapper, caplog):
+        """Test the success log carries the correlation ID as a lazy argument."""
+        import logging
+
+        with caplog.at_level(logging.INFO, logger="src.infrastructure.llm"):
+            await wrapper.ainvoke(messages=["test"], correlation_id="test-id")
+
+        record = next(r for r in caplog.records if "successful" in r.msg)
+        assert record.args == ("test-id",)
+        assert record.correlation_id == "test-id"
+        assert record.getMessage() == "LLM invocation successful (correlation_id=test-id)"
+
+    async def test_invoke_routes_through_ainvoke(self, wrapper, mock_llm):
+        """Test invoke uses the native async client without a thread hop."""
+        mock_llm.ainvoke = AsyncMock(return_value=MagicMock(content="async"))
+
+        result = await wrapper.invoke(messages=["test"])
+
+        assert result.content == "async"
+        mock_llm.ainvoke.assert_called_once()
+        mock_llm.invoke.assert_not_called()
+
+    async def test_invoke_falls_back_to_thread_for_sync_clients(self):
+        """Test invoke runs sync-only clients in a worker thread."""
+        from src.infrastructure.llm import ResilientLLMWrapper
+
+        sync_llm = MagicMock(spec=["invoke", "model"])
+        sync_llm.invoke.return_value = MagicMock(content="sync")
+        wrapper = ResilientLLMWrapper(llm=sync_llm)
+
+        result = await wrapper.invoke(messages=["test"])
+
+        assert result.content == "sync"
+        sync_llm.invoke.assert_called_once_with(["test"])
+
+    def test_invoke_sync(self, wrapper, mock_llm):
+        """Test blocking invoke_sync calls the client's invoke."""
+        mock_llm.invoke.return_value = MagicMock(content="blocking")
+
+        result = wrapper.invoke_sync(messages=["test"])
+
+        assert result.content == "blocking"
+
+
+class TestTokenCounting:
+    """Tests for prompt token counting and truncation."""
+
+    def test_count_tokens_estimates_unknown_models(self):
+        """Test models without a tiktoken encoding use a character estimate."""
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        from src.infrastructure.llm import count_tokens
+
+        messages = [SystemMessage(content="a" * 8), HumanMessage(content="b" * 9)]
+
+        assert count_tokens("llama3.2:3b", messages) == 2 + 3
+
+    def test_truncate_messages_keeps_prompt_that_fits(self):
+        """Test prompts within budget are returned unchanged."""
+        from src.infrastructure.llm import truncate_messages
+
+        messages = ["short"]
+
+        assert truncate_messages("llama3.2:3b", messages, 10) is messages
+
+    def test_truncate_messages_trims_largest_message(self):
+        """Test the largest message is cut until the prompt fits the budget."""
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        from src.infrastructure.llm import count_tokens, truncate_messages
+
+        system = SystemMessage(content="instructions")
+        messages = [system, HumanMessage(content="x" * 400)]
+
+        trimmed = truncate_messages("llama3.2:3b", messages, 20)
+
+        assert trimmed[0] is system
+        assert isinstance(trimmed[1], HumanMessage)
+        assert count_tokens("llama3.2:3b", trimmed) <= 20
+        assert len(messages[1].content) == 400
+
 
 class TestGetResilientLLM:
     """Tests for get_resilient_llm factory."""
@@ -89,3 +475,33 @@ class TestGetResilientLLM:
         from src.infrastructure.llm import ResilientLLMWrapper
 
         assert isinstance(result, ResilientLLMWrapper)
+
+    def test_get_resilient_llm_reuses_wrapper(self):
+        """Test identical configurations share one cached wrapper."""
+        from src.config.retry import RetryConfig
+        from src.infrastructure.llm import get_resilient_llm
+
+        first = get_resilient_llm(
+            provider="ollama", model="llama3.2:3b", retry_config=RetryConfig()
+        )
+        second = get_resilient_llm(
+            provider="ollama", model="llama3.2:3b", retry_config=RetryConfig()
+        )
+        other = get_resilient_llm(
+            provider="ollama",
+            model="llama3.2:3b",
+            retry_config=RetryConfig(max_attempts=2),
+        )
+
+        assert first is second
+        assert other is not first
+        assert other._retry_config.max_attempts == 2
+
+    def test_get_resilient_llm_unhashable_kwargs_not_cached(self):
+        """Test unhashable constructor arguments bypass the wrapper cache."""
+        from src.infrastructure.llm import get_resilient_llm
+
+        first = get_resilient_llm(provider="ollama", model_kwargs={"a": 1})
+        second = get_resilient_llm(provider="ollama", model_kwargs={"a": 1})
+
+        assert first is not second
@@ -0,0 +1,91 @@
+"""Unit tests for the LLM response cache."""
+
+from unittest.mock import AsyncMock
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.infrastructure.llm_cache import (
+    InMemoryCacheBackend,
+    LLMCache,
+    RedisCacheBackend,
+)
+
+
+class TestLLMCacheKey:
+    """Tests for cache key construction."""
+
+    def test_key_is_stable_for_identical_requests(self):
+        """Test identical model/messages produce the same key."""
+        messages = [SystemMessage(content="sys"), HumanMessage(content="hi")]
+        assert LLMCache.make_key("gpt-4o", messages) == LLMCache.make_key(
+            "gpt-4o", list(messages)
+        )
+
+    def test_key_changes_with_provider_model_messages_and_tools(self):
+        """Test every request component contributes to the key."""
+        messages = [HumanMessage(content="hi")]
+        base = LLMCache.make_key("gpt-4o", messages)
+
+        assert LLMCache.make_key("gpt-4o-mini", messages) != base
+        assert LLMCache.make_key("gpt-4o", [HumanMessage(content="bye")]) != base
+        assert LLMCache.make_key("gpt-4o", [SystemMessage(content="hi")]) != base
+        assert LLMCache.make_key("gpt-4o", messages, tools=["search"]) != base
+        assert LLMCache.make_key("gpt-4o", messages, provider="openrouter") != base
+
+
+class TestInMemoryCacheBackend:
+    """Tests for the in-memory LRU backend."""
+
+    async def test_round_trip(self):
+        """Test values can be stored and read back."""
+        backend = InMemoryCacheBackend()
+        await backend.set("k", "v", ttl=60)
+        assert await backend.get("k") == "v"
+
+    async def test_expired_entries_are_misses(self):
+        """Test entries past their TTL are dropped."""
+        backend = InMemoryCacheBackend()
+        await backend.set("k", "v", ttl=0)
+        assert await backend.get("k") is None
+
+    async def test_evicts_least_recently_used(self):
+        """Test the oldest unused entry is evicted when full."""
+        backend = InMemoryCacheBackend(maxsize=2)
+        await backend.set("a", "1", ttl=60)
+        await backend.set("b", "2", ttl=60)
+        await backend.get("a")
+        await backend.set("c", "3", ttl=60)
+
+        assert await backend.get("a") == "1"
+        assert await backend.get("b") is None
+        assert await backend.get("c") == "3"
+
+
+class TestRedisCacheBackend:
+    """Tests for the Redis backend."""
+
+    async def test_uses_prefixed_keys_with_expiry(self):
+        """Test values are written with the key prefix and TTL."""
+        client = AsyncMock()
+        client.get.return_value = "v"
+        backend = RedisCacheBackend(client=client)
+
+        await backend.set("k", "v", ttl=30)
+        assert await backend.get("k") == "v"
+
+        client.set.assert_awaited_once_with("veritas:llm:k", "v", ex=30)
+        client.get.assert_awaited_once_with("veritas:llm:k")
+
+
+class TestLLMCache:
+    """Tests for LLMCache error handling."""
+
+    async def test_backend_errors_are_misses(self):
+        """Test a failing backend never fails the caller."""
+        backend = AsyncMock()
+        backend.get.side_effect = ConnectionError("down")
+        backend.set.side_effect = ConnectionError("down")
+        cache = LLMCache(backend=backend)
+
+        assert await cache.get("k") is None
+        await cache.set("k", "v")
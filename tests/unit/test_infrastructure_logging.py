@@ -52,10 +52,65 @@ class TestLoggingSetup:
 
         from src.infrastructure.logging import get_logger
 
+        get_logger.cache_clear()
         logger = get_logger(__name__)
 
         mock_logger.bind.assert_called_once_with(name=__name__)
+        get_logger.cache_clear()
 
+    @patch("src.infrastructure.logging.logger")
+    def test_get_logger_is_memoized(self, mock_logger):
+        """Test repeated get_logger calls reuse the bound logger."""
+        from src.infrastructure.logging import get_logger
+
+        get_logger.cache_clear()
+        first = get_logger("veritas.test")
+        second = get_logger("veritas.test")
+
+        assert first is second
+        mock_logger.bind.assert_called_once_with(name="veritas.test")
+        get_logger.cache_clear()
+
+
+
+class TestBatchedFileSink:
+    """Tests for the bounded, batched production log sink."""
+
+    def test_writes_records_in_order(self, tmp_path):
+        """Test records are flushed to the file on stop."""
+        from src.infrastructure.logging import BatchedFileSink
+
+        path = tmp_path / "app.log"
+        sink = BatchedFileSink(path, batch_size=2)
+        for i in range(5):
+            sink(f"line {i}\n")
+        sink.stop()
+
+        assert path.read_text() == "".join(f"line {i}\n" for i in range(5))
+
+    def test_drops_records_when_queue_full(self, tmp_path):
+        """Test a full queue drops records instead of blocking."""
+        from src.infrastructure.logging import BatchedFileSink
+
+        sink = BatchedFileSink(tmp_path / "app.log", max_queue=1)
+        sink.stop()  # Writer gone, so the queue can only fill up
+        sink("kept\n")
+        sink("dropped\n")
+
+        assert sink.dropped == 1
+
+    def test_rotates_large_files(self, tmp_path):
+        """Test the file is rotated once it exceeds max_bytes."""
+        from src.infrastructure.logging import BatchedFileSink
+
+        path = tmp_path / "app.log"
+        path.write_text("x" * 20)
+        sink = BatchedFileSink(path, max_bytes=10, backup_count=2)
+        sink("fresh\n")
+        sink.stop()
+
+        assert path.read_text() == "fresh\n"
+        assert (tmp_path / "app.log.1").read_text() == "x" * 20
 
 class TestLogStage:
     """Tests for log_stage function."""
@@ -70,7 +125,24 @@ class TestLogStage:
 
         log_stage("RESEARCH", "Gathering data...", mock_instance)
 
-        mock_instance.info.assert_called_once_with("[RESEARCH] Gathering data...")
+        mock_instance.info.assert_called_once_with(
+            "[{}] {}", "RESEARCH", "Gathering data..."
+        )
+
+    def test_log_stage_formats_on_emit(self):
+        """Test the emitted record carries the formatted stage prefix."""
+        from loguru import logger
+
+        from src.infrastructure.logging import log_stage
+
+        messages = []
+        handler_id = logger.add(messages.append, format="{message}")
+        try:
+            log_stage("REVIEW", "Score {0.9}")
+        finally:
+            logger.remove(handler_id)
+
+        assert messages == ["[REVIEW] Score {0.9}\n"]
 
     def test_log_stage_imports(self):
         """Test that log_stage can be imported."""
@@ -78,3 +150,33 @@ class TestLogStage:
 
         # Verify the function exists and is callable
         assert callable(log_stage)
+
+
+class TestCorrelationIdFilter:
+    """Tests for correlation ID context propagation."""
+
+    def test_filter_injects_current_correlation_id(self):
+        """Test the filter copies the context variable onto log records."""
+        import logging
+
+        from src.infrastructure.logging import CorrelationIdFilter, correlation_id_var
+
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+        token = correlation_id_var.set("cid-123")
+        try:
+            assert CorrelationIdFilter().filter(record) is True
+        finally:
+            correlation_id_var.reset(token)
+
+        assert record.correlation_id == "cid-123"
+
+    def test_filter_defaults_to_none(self):
+        """Test records outside a correlated context get None."""
+        import logging
+
+        from src.infrastructure.logging import CorrelationIdFilter
+
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+        CorrelationIdFilter().filter(record)
+
+        assert record.correlation_id is None
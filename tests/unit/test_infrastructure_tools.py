@@ -1,6 +1,6 @@
 """Unit tests for web search tools infrastructure."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -18,6 +18,29 @@ class TestWebSearchTools:
         client = get_tavily_client()
         assert client is not None
 
+    @patch("src.infrastructure.tools.settings")
+    def test_tavily_clients_are_reused(self, mock_settings):
+        """Test repeated lookups share one client per API key."""
+        mock_settings.tavily_api_key = "test-key"
+
+        from src.infrastructure.tools import get_async_tavily_client, get_tavily_client
+
+        assert get_tavily_client() is get_tavily_client()
+        assert get_async_tavily_client() is get_async_tavily_client()
+
+    @patch("src.infrastructure.tools.settings")
+    async def test_aclose_tavily_clients_closes_shared_client(self, mock_settings):
+        """Test closing the async clients releases them for a fresh one."""
+        mock_settings.tavily_api_key = "test-key"
+
+        from src.infrastructure.tools import aclose_tavily_clients, get_async_tavily_client
+
+        client = get_async_tavily_client()
+        await aclose_tavily_clients()
+
+        assert client._client.is_closed
+        assert get_async_tavily_client() is not client
+
     @patch("src.infrastructure.tools.settings")
     def test_get_tavily_client_no_api_key(self, mock_settings):
         """Test that missing API key raises ValueError."""
@@ -171,3 +194,20 @@ class TestWebSearchFunction:
 
         call_args = mock_client.search.call_args
         assert call_args[1]["max_results"] == 10
+
+    @patch("src.infrastructure.tools.get_async_tavily_client")
+    async def test_async_search_awaits_shared_client(self, mock_get_client):
+        """Test the async search awaits the async client with a cleaned query."""
+        mock_client = MagicMock()
+        mock_client.search = AsyncMock(
+            return_value={"results": [{"title": "T", "url": "http://x", "content": "c"}]}
+        )
+        mock_get_client.return_value = mock_client
+
+        from src.infrastructure.tools import get_async_web_search_tool
+
+        search = get_async_web_search_tool(max_results=3)
+        result = await search("Action Input: quantum")
+
+        mock_client.search.assert_awaited_once_with(query="quantum", max_results=3)
+        assert "http://x" in result
@@ -31,7 +31,6 @@ class TestResearcherAgent:
             agent._llm = mock_llm
             agent._name = "researcher"
             agent._description = "Collects raw information, sources, and key findings"
-            agent._correlation_id = None
             agent._tools = []
             return agent
 
@@ -44,30 +43,25 @@ class TestResearcherAgent:
         assert "collects" in researcher_agent.description.lower()
         assert "findings" in researcher_agent.description.lower()
 
-    @pytest.mark.asyncio
     async def test_validate_input_accepts_valid_string(self, researcher_agent):
         """Test that validate_input accepts non-empty strings."""
         assert await researcher_agent.validate_input("Climate Change") is True
         assert await researcher_agent.validate_input("  topic with spaces  ") is True
 
-    @pytest.mark.asyncio
     async def test_validate_input_accepts_dict_with_topic(self, researcher_agent):
         """Test that validate_input accepts dict with 'topic' key."""
         assert await researcher_agent.validate_input({"topic": "Test Topic"}) is True
 
-    @pytest.mark.asyncio
     async def test_validate_input_rejects_empty_string(self, researcher_agent):
         """Test that validate_input rejects empty strings."""
         assert await researcher_agent.validate_input("") is False
         assert await researcher_agent.validate_input("   ") is False
 
-    @pytest.mark.asyncio
     async def test_validate_input_rejects_dict_with_empty_topic(self, researcher_agent):
         """Test that validate_input rejects dict with empty topic."""
         assert await researcher_agent.validate_input({"topic": ""}) is False
         assert await researcher_agent.validate_input({"topic": "   "}) is False
 
-    @pytest.mark.asyncio
     async def test_validate_input_rejects_other_types(self, researcher_agent):
         """Test that validate_input rejects other input types."""
         assert await researcher_agent.validate_input(123) is False
@@ -75,7 +69,6 @@ class TestResearcherAgent:
         assert await researcher_agent.validate_input({}) is False
         assert await researcher_agent.validate_input([]) is False
 
-    @pytest.mark.asyncio
     async def test_research_method_exists(self, researcher_agent):
         """Test that research convenience method exists."""
         assert hasattr(researcher_agent, "research")
@@ -138,12 +131,10 @@ class TestResearcherAgentRun:
             agent._llm = mock_llm
             agent._name = "researcher"
             agent._description = ""
-            agent._correlation_id = None
             agent._search_tool = mock_search_tool
             agent._tools = []
             return agent
 
-    @pytest.mark.asyncio
     async def test_run_direct_parses_valid_json_response(
         self, researcher_agent, agent_context
     ):
@@ -155,6 +146,60 @@ class TestResearcherAgentRun:
         assert len(result.findings) > 0
         assert result.correlation_id == agent_context.correlation_id
 
+    async def test_run_searches_subqueries_concurrently(
+        self, researcher_agent, mock_search_tool, agent_context
+    ):
+        """Test subqueries are searched concurrently under the search limit."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def search(query):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"results for {query}"
+
+        mock_search_tool.ainvoke = AsyncMock(side_effect=search)
+        researcher_agent._max_concurrent_searches = 2
+
+        await researcher_agent._run(
+            {"topic": "Topic", "subqueries": ["a", "b", "Topic"]}, agent_context
+        )
+
+        queried = [c.args[0] for c in mock_search_tool.ainvoke.await_args_list]
+        assert queried == ["Topic", "a", "b"]
+        assert peak == 2
+        prompt = researcher_agent.llm.llm.ainvoke.await_args.args[0][0].content
+        assert "QUERY: a\nresults for a" in prompt
+
+
+class TestSearchWebTool:
+    """Tests for the search_web LangChain tool."""
+
+    async def test_ainvoke_uses_async_client_only(self):
+        """Test async invocation never falls back to the blocking client."""
+        from src.agents.researcher import search_web
+
+        async_search = AsyncMock(return_value="async results")
+        with (
+            patch(
+                "src.agents.researcher.get_web_search_tool",
+                side_effect=AssertionError("sync client used"),
+            ),
+            patch(
+                "src.agents.researcher.get_async_web_search_tool",
+                return_value=async_search,
+            ),
+        ):
+            result = await search_web.ainvoke("query")
+
+        assert result == "async results"
+        async_search.assert_awaited_once_with("query")
+
 
 class TestParseResponse:
     """Tests for _parse_response method."""
@@ -32,7 +32,6 @@ class TestSynthesizerAgent:
             agent._llm = mock_llm
             agent._name = "synthesizer"
             agent._description = "Merges validated research into coherent insights"
-            agent._correlation_id = None
             return agent
 
     def test_agent_name(self, synthesizer_agent):
@@ -44,7 +43,6 @@ class TestSynthesizerAgent:
         assert "merges" in synthesizer_agent.description.lower()
         assert "insights" in synthesizer_agent.description.lower()
 
-    @pytest.mark.asyncio
     async def test_validate_input_accepts_dict_with_required_keys(
         self, synthesizer_agent
     ):
@@ -66,21 +64,18 @@ class TestSynthesizerAgent:
             is True
         )
 
-    @pytest.mark.asyncio
     async def test_validate_input_rejects_dict_missing_keys(self, synthesizer_agent):
         """Test that validate_input rejects dict missing required keys."""
         assert await synthesizer_agent.validate_input({"research": {}}) is False
         assert await synthesizer_agent.validate_input({"fact_check": {}}) is False
         assert await synthesizer_agent.validate_input({}) is False
 
-    @pytest.mark.asyncio
     async def test_validate_input_rejects_other_types(self, synthesizer_agent):
         """Test that validate_input rejects other input types."""
         assert await synthesizer_agent.validate_input("string") is False
         assert await synthesizer_agent.validate_input(123) is False
         assert await synthesizer_agent.validate_input(None) is False
 
-    @pytest.mark.asyncio
     async def test_synthesize_method_exists(self, synthesizer_agent):
         """Test that synthesize convenience method exists."""
         assert hasattr(synthesizer_agent, "synthesize")
@@ -116,10 +111,8 @@ class TestSynthesizerAgentRun:
             agent._llm = mock_llm
             agent._name = "synthesizer"
             agent._description = ""
-            agent._correlation_id = None
             return agent
 
-    @pytest.mark.asyncio
     async def test_run_parses_valid_json_response(
         self, synthesizer_agent, agent_context
     ):
@@ -143,7 +136,6 @@ class TestSynthesizerAgentRun:
         assert len(result.resolved_contradictions) == 1
         assert result.correlation_id == agent_context.correlation_id
 
-    @pytest.mark.asyncio
     async def test_run_handles_invalid_json_with_fallback(
         self, mock_llm, agent_context
     ):
@@ -155,7 +147,6 @@ class TestSynthesizerAgentRun:
             agent._llm = mock_llm
             agent._name = "synthesizer"
             agent._description = ""
-            agent._correlation_id = None
 
             research = ResearchCompleted.create(
                 topic="Test",
@@ -197,7 +188,6 @@ class TestSynthesizerAgentIntegration:
         """Create a test agent context."""
         return AgentContext.create(correlation_id="integration-test-id")
 
-    @pytest.mark.asyncio
     async def test_full_synthesize_flow(self, mock_llm, agent_context):
         """Test complete synthesis flow from execute to result."""
         with patch("src.agents.synthesizer.BaseAgent.__init__", return_value=None):
@@ -205,7 +195,6 @@ class TestSynthesizerAgentIntegration:
             agent._llm = mock_llm
             agent._name = "synthesizer"
             agent._description = ""
-            agent._correlation_id = None
 
             research = ResearchCompleted.create(
                 topic="Energy Trends",
@@ -242,7 +231,6 @@ class TestSynthesizerAgentIntegration:
             assert len(result.insights) == 2
             assert result.correlation_id == "integration-test-id"
 
-    @pytest.mark.asyncio
     async def test_synthesize_with_empty_findings(self, mock_llm, agent_context):
         """Test synthesis with empty research findings."""
         with patch("src.agents.synthesizer.BaseAgent.__init__", return_value=None):
@@ -250,7 +238,6 @@ class TestSynthesizerAgentIntegration:
             agent._llm = mock_llm
             agent._name = "synthesizer"
             agent._description = ""
-            agent._correlation_id = None
 
             research = ResearchCompleted.create(
                 topic="Empty Topic",
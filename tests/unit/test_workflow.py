@@ -1,6 +1,8 @@
 """Unit tests for workflow orchestration."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 
 class TestWorkflowStage:
@@ -34,6 +36,33 @@ class TestWorkflowStage:
         assert WorkflowStage.FAILED.value == "failed"
 
 
+class TestLazyImports:
+    """Tests for deferred agent imports."""
+
+    def test_workflow_module_does_not_import_agents(self):
+        """Test importing workflow types leaves agents and LLM clients unloaded."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from src.orchestration.workflow import WorkflowResult\n"
+            "print(any(m in sys.modules for m in "
+            "('src.agents', 'src.infrastructure.llm', 'langchain_openai')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert out.stdout.strip() == "False"
+
+    def test_agent_classes_resolve_on_access(self):
+        """Test agent classes remain reachable as workflow module attributes."""
+        from src.agents import ResearcherAgent
+        from src.orchestration import workflow
+
+        assert workflow.ResearcherAgent is ResearcherAgent
+
 class TestWorkflowResult:
     """Tests for WorkflowResult class."""
 
@@ -64,46 +93,478 @@ class TestWorkflowResult:
         assert result.status == WorkflowStage.FAILED
         assert result.error == "Something went wrong"
 
+    def test_uses_slots(self):
+        """Test WorkflowResult instances carry no per-instance __dict__."""
+        from src.orchestration.workflow import WorkflowResult, WorkflowStage
+
+        result = WorkflowResult(status=WorkflowStage.RESEARCH)
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unknown = 1
+
+    def test_json_round_trip(self):
+        """Test to_json/from_json restore events, status and timestamps."""
+        from src.domain.events import ReportReviewed, ReportWritten
+        from src.orchestration.workflow import WorkflowResult, WorkflowStage
+
+        result = WorkflowResult(
+            status=WorkflowStage.COMPLETED,
+            report=ReportWritten.create(title="T", content="C", format="markdown"),
+            review=ReportReviewed.create(suggestions=["s"], score=0.9, approved=True),
+            iterations=1,
+        )
+
+        restored = WorkflowResult.from_json(result.to_json())
+
+        assert restored == result
+        assert isinstance(restored.report, ReportWritten)
+        assert restored.status is WorkflowStage.COMPLETED
+
 
 class TestResearchWorkflow:
     """Tests for ResearchWorkflow class."""
 
-    def test_workflow_initialization_defaults(self):
+    @pytest.fixture
+    def agent_classes(self):
+        """Stand-in agent classes, each building a fresh mock agent per call."""
+        return {
+            name: MagicMock(side_effect=lambda **kwargs: MagicMock())
+            for name in (
+                "ResearcherAgent",
+                "FactCheckerAgent",
+                "SynthesizerAgent",
+                "WriterAgent",
+                "CriticAgent",
+            )
+        }
+
+    @pytest.fixture
+    def make_workflow(self, agent_classes):
+        """Build ResearchWorkflows whose agents come from ``agent_classes``."""
+        from src.orchestration.workflow import ResearchWorkflow
+
+        def make(**kwargs):
+            with patch.multiple("src.orchestration.workflow", **agent_classes):
+                return ResearchWorkflow(**kwargs)
+
+        return make
+
+    def test_workflow_initialization_defaults(self, make_workflow):
         """Test ResearchWorkflow with default values."""
-        with patch("src.orchestration.workflow.ResearcherAgent"):
-            with patch("src.orchestration.workflow.FactCheckerAgent"):
-                with patch("src.orchestration.workflow.SynthesizerAgent"):
-                    with patch("src.orchestration.workflow.WriterAgent"):
-                        with patch("src.orchestration.workflow.CriticAgent"):
-                            from src.orchestration.workflow import ResearchWorkflow
-
-                            workflow = ResearchWorkflow()
+        workflow = make_workflow()
 
-                            assert workflow.max_iterations == 3
-                            assert workflow.auto_approve_threshold == 0.8
-                            assert workflow.llm_provider == "openai"
-                            assert workflow.llm_model == "gpt-4o"
+        assert workflow.max_iterations == 3
+        assert workflow.auto_approve_threshold == 0.8
+        assert workflow.llm_provider == "openai"
+        assert workflow.llm_model == "gpt-4o"
 
-    def test_workflow_initialization_custom(self):
+    def test_workflow_initialization_custom(self, make_workflow):
         """Test ResearchWorkflow with custom values."""
-        with patch("src.orchestration.workflow.ResearcherAgent"):
-            with patch("src.orchestration.workflow.FactCheckerAgent"):
-                with patch("src.orchestration.workflow.SynthesizerAgent"):
-                    with patch("src.orchestration.workflow.WriterAgent"):
-                        with patch("src.orchestration.workflow.CriticAgent"):
-                            from src.orchestration.workflow import ResearchWorkflow
-
-                            workflow = ResearchWorkflow(
-                                max_iterations=5,
-                                auto_approve_threshold=0.9,
-                                llm_provider="anthropic",
-                                llm_model="claude-3-opus",
-                            )
-
-                            assert workflow.max_iterations == 5
-                            assert workflow.auto_approve_threshold == 0.9
-                            assert workflow.llm_provider == "anthropic"
-                            assert workflow.llm_model == "claude-3-opus"
+        workflow = make_workflow(
+            max_iterations=5,
+            auto_approve_threshold=0.9,
+            llm_provider="anthropic",
+            llm_model="claude-3-opus",
+        )
+
+        assert workflow.max_iterations == 5
+        assert workflow.auto_approve_threshold == 0.9
+        assert workflow.llm_provider == "anthropic"
+        assert workflow.llm_model == "claude-3-opus"
+
+    def test_agents_built_on_first_access(self, make_workflow, agent_classes):
+        """Test agents are instantiated lazily, once, from the classes bound at init."""
+        researcher_cls = agent_classes["ResearcherAgent"]
+        workflow = make_workflow(llm_provider="ollama", llm_model="llama3.2:3b")
+
+        researcher_cls.assert_not_called()
+
+        assert workflow.researcher is workflow.researcher
+        researcher_cls.assert_called_once_with(
+            provider="ollama",
+            model="llama3.2:3b",
+            max_tokens=None,
+            cache=None,
+            max_prompt_tokens=None,
+        )
+        with pytest.raises(AttributeError):
+            workflow.not_an_agent
+
+    def test_workflows_with_same_settings_share_agents(self, make_workflow, agent_classes):
+        """Test agents are reused across workflows with identical agent settings."""
+        from src.orchestration.workflow import ResearchWorkflow
+
+        first = make_workflow(llm_provider="ollama", llm_model="llama3.2:3b")
+        second = make_workflow(
+            llm_provider="ollama", llm_model="llama3.2:3b", max_iterations=5
+        )
+        other_model = make_workflow(llm_provider="ollama", llm_model="mistral")
+
+        assert first.researcher is second.researcher
+        assert other_model.researcher is not first.researcher
+        assert agent_classes["ResearcherAgent"].call_count == 2
+
+        ResearchWorkflow.clear_agent_cache()
+        rebuilt = make_workflow(llm_provider="ollama", llm_model="llama3.2:3b")
+        assert rebuilt.researcher is not first.researcher
+
+    def test_agent_cache_evicts_least_recently_used(self, make_workflow):
+        """Test the shared agent cache stays within its size limit."""
+        from src.orchestration.workflow import ResearchWorkflow
+
+        def researcher(model):
+            return make_workflow(llm_provider="ollama", llm_model=model).researcher
+
+        with patch.object(ResearchWorkflow, "_agent_cache_size", 2):
+            first = researcher("a")
+            researcher("b")
+            assert researcher("a") is first  # refreshes "a"
+            researcher("c")  # evicts "b"
+
+            assert researcher("a") is first
+            assert len(ResearchWorkflow._agent_cache) == 2
+
+    @patch("src.infrastructure.llm.settings")
+    def test_agents_share_http_connection_pool(self, mock_settings):
+        """Test all agents' LLM clients reuse one HTTP connection pool."""
+        mock_settings.openai_api_key = "openai-key"
+
+        from src.infrastructure import llm
+        from src.orchestration.workflow import ResearchWorkflow
+
+        workflow = ResearchWorkflow()
+        agents = [
+            workflow.researcher,
+            workflow.fact_checker,
+            workflow.synthesizer,
+            workflow.writer,
+            workflow.critic,
+        ]
+
+        for agent in agents:
+            assert agent.llm.llm.http_async_client is llm._shared_http_clients()[1]
+        # Agents with the same settings share a single wrapper and client
+        assert workflow.writer.llm is workflow.researcher.llm
+
+    async def test_fact_check_runs_batches_concurrently_and_merges(self, make_workflow):
+        """Test findings are verified in concurrent batches and merged in order."""
+        import asyncio
+
+        from src.domain.events import FactCheckCompleted, ResearchCompleted
+        from src.domain.interfaces import AgentContext
+
+        workflow = make_workflow(fact_check_batch_size=2, max_concurrency=2)
+
+        in_flight = 0
+        peak = 0
+
+        async def verify_claims(claims, sources, context):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return FactCheckCompleted.create(
+                claims=[{"text": c, "status": "verified"} for c in claims],
+                verified_claims=[],
+                confidence_scores={c: 0.9 for c in claims},
+            )
+
+        workflow.fact_checker.verify_claims = AsyncMock(side_effect=verify_claims)
+        findings = [f"finding {i}" for i in range(5)]
+        research = ResearchCompleted.create(topic="t", sources=[], findings=findings)
+
+        result = await workflow._fact_check(research, AgentContext.create("cid"))
+
+        assert workflow.fact_checker.verify_claims.await_count == 3
+        assert peak == 2
+        assert [c["text"] for c in result.claims] == findings
+        assert set(result.confidence_scores) == set(findings)
+        assert result.correlation_id == "cid"
+
+    async def test_fact_check_batch_failure_cancels_remaining_batches(self, make_workflow):
+        """Test a failing batch cancels the others and raises its own error."""
+        import asyncio
+
+        from src.domain.events import ResearchCompleted
+        from src.domain.interfaces import AgentContext
+
+        workflow = make_workflow(fact_check_batch_size=1, max_concurrency=3)
+
+        cancelled = []
+
+        async def verify_claims(claims, sources, context):
+            if claims == ["finding 0"]:
+                raise RuntimeError("Fact-check service unavailable")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.extend(claims)
+                raise
+
+        workflow.fact_checker.verify_claims = AsyncMock(side_effect=verify_claims)
+        findings = [f"finding {i}" for i in range(3)]
+        research = ResearchCompleted.create(topic="t", sources=[], findings=findings)
+
+        with pytest.raises(RuntimeError, match="Fact-check service unavailable"):
+            await workflow._fact_check(research, AgentContext.create("cid"))
+
+        assert sorted(cancelled) == ["finding 1", "finding 2"]
+
+    async def test_revision_runs_alongside_review(self, make_workflow):
+        """Test the next revision starts before the critic finishes reviewing."""
+        import asyncio
+
+        from src.domain.events import (
+            FactCheckCompleted,
+            ReportReviewed,
+            ReportWritten,
+            ResearchCompleted,
+            SynthesisCompleted,
+        )
+
+        from src.orchestration.workflow import WorkflowStage
+
+        workflow = make_workflow(
+            max_iterations=2,
+            auto_approve_threshold=1.0,
+            speculative_revision=True,
+        )
+
+        events = []
+        workflow.researcher.research = AsyncMock(
+            return_value=ResearchCompleted.create(topic="t", sources=[], findings=["f"])
+        )
+        workflow.fact_checker.verify_claims = AsyncMock(
+            return_value=FactCheckCompleted.create(
+                claims=[], verified_claims=[], confidence_scores={}
+            )
+        )
+
+        async def write_report(**kwargs):
+            events.append("write")
+            return ReportWritten.create(title="T", content="C", format="markdown")
+
+        async def review(report, context):
+            events.append("review-start")
+            await asyncio.sleep(0.01)
+            events.append("review-end")
+            approved = events.count("review-end") == 2
+            return ReportReviewed.create(suggestions=[], score=0.5, approved=approved)
+
+        workflow.synthesizer.synthesize = AsyncMock(
+            return_value=SynthesisCompleted.create(
+                insights=[], resolved_contradictions=[]
+            )
+        )
+        workflow.writer.write_report = AsyncMock(side_effect=write_report)
+        workflow.critic.review = AsyncMock(side_effect=review)
+
+        result = await workflow.execute("t")
+
+        assert result.status == WorkflowStage.COMPLETED
+        assert result.iterations == 2
+        # Initial report, then a speculative rewrite started during the first review
+        assert events[:4] == ["write", "review-start", "write", "review-end"]
+
+    async def test_speculative_revision_replaced_when_critic_has_suggestions(self, make_workflow):
+        """Test critic suggestions are written in rather than the speculative draft."""
+        from src.domain.events import ReportReviewed, ReportWritten
+        from src.domain.interfaces import AgentContext
+
+        from src.orchestration.workflow import WorkflowResult, WorkflowStage
+
+        workflow = make_workflow(
+            max_iterations=1, auto_approve_threshold=1.0, speculative_revision=True
+        )
+
+        async def write_report(**kwargs):
+            title = "revised" if kwargs["feedback"] else "speculative"
+            return ReportWritten.create(title=title, content="C", format="markdown")
+
+        workflow.writer.write_report = AsyncMock(side_effect=write_report)
+        workflow.critic.review = AsyncMock(
+            return_value=ReportReviewed.create(
+                suggestions=["Add sources"], score=0.5, approved=False
+            )
+        )
+        report = ReportWritten.create(title="T", content="C", format="markdown")
+        result = WorkflowResult(status=WorkflowStage.REVIEW, report=report)
+
+        await workflow._review(result, AgentContext.create("cid"))
+
+        assert result.report.title == "revised"
+        feedback = [c.kwargs["feedback"] for c in workflow.writer.write_report.await_args_list]
+        assert ["Add sources"] in feedback
+
+    async def test_discarded_speculative_revision_is_awaited(self, make_workflow):
+        """Test a dropped speculative rewrite is awaited, so its error is retrieved."""
+        import asyncio
+        import gc
+
+        from src.domain.events import ReportReviewed, ReportWritten
+        from src.domain.interfaces import AgentContext
+
+        from src.orchestration.workflow import WorkflowResult, WorkflowStage
+
+        workflow = make_workflow(max_iterations=1, speculative_revision=True)
+
+        stopped = []
+
+        async def write_report(**kwargs):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                stopped.append(True)
+                raise RuntimeError("writer cleanup failed") from None
+
+        async def review(report, context):
+            await asyncio.sleep(0)  # let the speculative rewrite start
+            return ReportReviewed.create(suggestions=[], score=0.9, approved=True)
+
+        workflow.writer.write_report = AsyncMock(side_effect=write_report)
+        workflow.critic.review = AsyncMock(side_effect=review)
+        report = ReportWritten.create(title="T", content="C", format="markdown")
+        result = WorkflowResult(status=WorkflowStage.REVIEW, report=report)
+
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        previous = loop.get_exception_handler()
+        loop.set_exception_handler(lambda loop, ctx: unhandled.append(ctx))
+        try:
+            await workflow._review(result, AgentContext.create("cid"))
+            # The rewrite has already stopped when the review loop returns
+            assert stopped == [True]
+            await asyncio.sleep(0.01)
+            gc.collect()
+        finally:
+            loop.set_exception_handler(previous)
+
+        assert result.review.approved
+        assert unhandled == []
+
+    async def test_revision_rewrites_with_feedback_and_reuses_synthesis(self, make_workflow):
+        """Test revisions pass critic suggestions to the writer only."""
+        from src.domain.events import (
+            FactCheckCompleted,
+            ReportReviewed,
+            ReportWritten,
+            ResearchCompleted,
+            SynthesisCompleted,
+        )
+
+        workflow = make_workflow(max_iterations=2, auto_approve_threshold=1.0)
+
+        workflow.researcher.research = AsyncMock(
+            return_value=ResearchCompleted.create(topic="t", sources=[], findings=["f"])
+        )
+        workflow.fact_checker.verify_claims = AsyncMock(
+            return_value=FactCheckCompleted.create(
+                claims=[], verified_claims=[], confidence_scores={}
+            )
+        )
+        workflow.synthesizer.synthesize = AsyncMock(
+            return_value=SynthesisCompleted.create(
+                insights=[], resolved_contradictions=[]
+            )
+        )
+        workflow.writer.write_report = AsyncMock(
+            return_value=ReportWritten.create(title="T", content="C", format="markdown")
+        )
+        workflow.critic.review = AsyncMock(
+            side_effect=[
+                ReportReviewed.create(
+                    suggestions=["Add sources"], score=0.5, approved=False
+                ),
+                ReportReviewed.create(suggestions=[], score=0.9, approved=True),
+            ]
+        )
+
+        await workflow.execute("t")
+
+        workflow.synthesizer.synthesize.assert_awaited_once()
+        assert workflow.writer.write_report.await_count == 2
+        revision = workflow.writer.write_report.await_args_list[1]
+        assert revision.kwargs["feedback"] == ["Add sources"]
+
+    @pytest.mark.parametrize(
+        ("approvals", "max_iterations", "expected_iterations"),
+        [
+            pytest.param((False, False, True), 3, 3, id="approved-on-third-round"),
+            pytest.param((False, False), 2, 2, id="stops-at-max-iterations"),
+        ],
+    )
+    async def test_review_loop_counts_rounds(
+        self, make_workflow, approvals, max_iterations, expected_iterations
+    ):
+        """Test the critic loop alone, without re-running the upstream stages."""
+        from src.domain.events import ReportReviewed, ReportWritten
+        from src.domain.interfaces import AgentContext
+
+        from src.orchestration.workflow import WorkflowResult, WorkflowStage
+
+        workflow = make_workflow(
+            max_iterations=max_iterations, auto_approve_threshold=1.0
+        )
+
+        report = ReportWritten.create(title="T", content="C", format="markdown")
+        workflow.writer.write_report = AsyncMock(return_value=report)
+        workflow.critic.review = AsyncMock(
+            side_effect=[
+                ReportReviewed.create(suggestions=[], score=0.5, approved=approved)
+                for approved in approvals
+            ]
+        )
+        result = WorkflowResult(status=WorkflowStage.REVIEW, report=report)
+
+        await workflow._review(result, AgentContext.create("cid"))
+
+        assert result.iterations == expected_iterations
+        assert workflow.critic.review.await_count == expected_iterations
+        # Every rejected round is followed by one rewrite
+        assert workflow.writer.write_report.await_count == approvals.count(False)
+
+    async def test_execute_binds_correlation_id_for_agents(self, make_workflow):
+        """Test agents see the run's correlation ID without it being passed."""
+        from src.infrastructure.logging import correlation_id_var
+
+        from src.orchestration.workflow import WorkflowStage
+
+        workflow = make_workflow()
+
+        seen = []
+
+        async def research(topic, context):
+            seen.append(correlation_id_var.get())
+            raise RuntimeError("stop")
+
+        workflow.researcher.research = AsyncMock(side_effect=research)
+
+        result = await workflow.execute("t", correlation_id="run-42")
+
+        assert result.status == WorkflowStage.FAILED
+        assert seen == ["run-42"]
+        assert correlation_id_var.get() is None
+
+    async def test_result_cache_skips_agents_on_repeat_topic(self, make_workflow):
+        """Test a cached completed run is returned without calling any agent."""
+        from src.infrastructure.llm_cache import InMemoryCacheBackend
+
+        from src.orchestration.workflow import WorkflowResult, WorkflowStage
+
+        backend = InMemoryCacheBackend()
+        workflow = make_workflow(result_cache=backend)
+
+        cached = WorkflowResult(status=WorkflowStage.COMPLETED, iterations=1)
+        await backend.set(workflow._result_key("t"), cached.to_json(), 60)
+        workflow.researcher.research = AsyncMock()
+
+        result = await workflow.execute("t")
+
+        assert result == cached
+        workflow.researcher.research.assert_not_called()
+        assert workflow._result_key("t") != workflow._result_key("other")
 
 
 class TestWorkflowResultProperties:
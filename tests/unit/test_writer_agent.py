@@ -32,7 +32,6 @@ class TestWriterAgent:
             agent._llm = mock_llm
             agent._name = "writer"
             agent._description = "Produces polished, structured reports"
-            agent._correlation_id = None
             return agent
 
     def test_agent_name(self, writer_agent):
@@ -44,7 +43,6 @@ class TestWriterAgent:
         assert "produces" in writer_agent.description.lower()
         assert "reports" in writer_agent.description.lower()
 
-    @pytest.mark.asyncio
     async def test_validate_input_accepts_dict_with_synthesis(self, writer_agent):
         """Test that validate_input accepts dict with 'synthesis' key."""
         synthesis = SynthesisCompleted.create(
@@ -53,25 +51,38 @@ class TestWriterAgent:
         )
         assert await writer_agent.validate_input({"synthesis": synthesis}) is True
 
-    @pytest.mark.asyncio
     async def test_validate_input_rejects_dict_missing_synthesis(self, writer_agent):
         """Test that validate_input rejects dict missing 'synthesis' key."""
         assert await writer_agent.validate_input({}) is False
         assert await writer_agent.validate_input({"format": "markdown"}) is False
 
-    @pytest.mark.asyncio
     async def test_validate_input_rejects_other_types(self, writer_agent):
         """Test that validate_input rejects other input types."""
         assert await writer_agent.validate_input("string") is False
         assert await writer_agent.validate_input(123) is False
         assert await writer_agent.validate_input(None) is False
 
-    @pytest.mark.asyncio
     async def test_write_report_method_exists(self, writer_agent):
         """Test that write_report convenience method exists."""
         assert hasattr(writer_agent, "write_report")
         assert callable(writer_agent.write_report)
 
+    def test_report_request_includes_feedback(self, writer_agent):
+        """Test reviewer feedback is added to the writing prompt."""
+        synthesis = SynthesisCompleted.create(
+            insights=["Insight 1"],
+            resolved_contradictions=[],
+        )
+
+        request = writer_agent._report_request(
+            synthesis, "markdown", ["Cite more sources"]
+        )
+
+        assert "REVIEWER FEEDBACK TO ADDRESS:\n- Cite more sources" in request
+        assert "REVIEWER FEEDBACK" not in writer_agent._report_request(
+            synthesis, "markdown"
+        )
+
 
 class TestWriterAgentRun:
     """Tests for WriterAgent._run method."""
@@ -116,10 +127,8 @@ class TestWriterAgentRun:
             agent._llm = mock_llm
             agent._name = "writer"
             agent._description = ""
-            agent._correlation_id = None
             return agent
 
-    @pytest.mark.asyncio
     async def test_run_parses_valid_json_response(self, writer_agent, agent_context):
         """Test that _run correctly parses valid JSON response."""
         synthesis = SynthesisCompleted.create(
@@ -138,7 +147,6 @@ class TestWriterAgentRun:
         assert result.format == "markdown"
         assert result.correlation_id == agent_context.correlation_id
 
-    @pytest.mark.asyncio
     async def test_run_handles_invalid_json_with_fallback(self, agent_context):
         """Test that _run handles invalid JSON response gracefully."""
         # Create fresh mock with invalid JSON response
@@ -157,7 +165,6 @@ class TestWriterAgentRun:
             agent._llm = mock_llm
             agent._name = "writer"
             agent._description = ""
-            agent._correlation_id = None
 
             synthesis = SynthesisCompleted.create(
                 insights=["Insight"],
@@ -171,7 +178,6 @@ class TestWriterAgentRun:
             # Should use fallback handling
             assert result.title == "Research Report"
 
-    @pytest.mark.asyncio
     async def test_run_with_plain_format(self, agent_context):
         """Test that _run handles plain text format correctly."""
         # Create fresh mock with plain text response
@@ -201,7 +207,6 @@ class TestWriterAgentRun:
             agent._llm = mock_llm
             agent._name = "writer"
             agent._description = ""
-            agent._correlation_id = None
 
             synthesis = SynthesisCompleted.create(
                 insights=["Key finding"],
@@ -254,7 +259,6 @@ class TestWriterAgentIntegration:
         """Create a test agent context."""
         return AgentContext.create(correlation_id="integration-test-id")
 
-    @pytest.mark.asyncio
     async def test_full_write_report_flow(self, mock_llm, agent_context):
         """Test complete write report flow from execute to result."""
         with patch("src.agents.writer.BaseAgent.__init__", return_value=None):
@@ -262,7 +266,6 @@ class TestWriterAgentIntegration:
             agent._llm = mock_llm
             agent._name = "writer"
             agent._description = ""
-            agent._correlation_id = None
 
             synthesis = SynthesisCompleted.create(
                 insights=[
@@ -289,7 +292,6 @@ class TestWriterAgentIntegration:
             assert result.format == "markdown"
             assert result.correlation_id == "integration-test-id"
 
-    @pytest.mark.asyncio
     async def test_write_report_with_default_format(self, mock_llm, agent_context):
         """Test write report uses markdown as default format."""
         with patch("src.agents.writer.BaseAgent.__init__", return_value=None):
@@ -297,7 +299,6 @@ class TestWriterAgentIntegration:
             agent._llm = mock_llm
             agent._name = "writer"
             agent._description = ""
-            agent._correlation_id = None
 
             synthesis = SynthesisCompleted.create(
                 insights=["Finding"],
@@ -310,7 +311,6 @@ class TestWriterAgentIntegration:
             assert isinstance(result, ReportWritten)
             assert result.format == "markdown"  # Default
 
-    @pytest.mark.asyncio
     async def test_write_report_with_html_format(self, agent_context):
         """Test write report with HTML format."""
         # Create a fresh mock for this test with HTML response
@@ -340,7 +340,6 @@ class TestWriterAgentIntegration:
             agent._llm = mock_llm
             agent._name = "writer"
             agent._description = ""
-            agent._correlation_id = None
 
             synthesis = SynthesisCompleted.create(
                 insights=["Insight"],